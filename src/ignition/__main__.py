@@ -15,12 +15,38 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Run without UI (monitor + orchestration only).",
     )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="With --headless: serve Prometheus metrics on 127.0.0.1:PORT/metrics.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        metavar="PATH",
+        help="With --headless: periodically write Prometheus metrics to PATH.",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=15.0,
+        metavar="SECONDS",
+        help="How often --metrics-file is rewritten (default: 15).",
+    )
     return parser
 
 
 def main() -> int:
     args = build_parser().parse_args()
-    return run_app(start_in_background=args.background, headless=args.headless)
+    return run_app(
+        start_in_background=args.background,
+        headless=args.headless,
+        metrics_port=args.metrics_port,
+        metrics_file=args.metrics_file,
+        metrics_interval=args.metrics_interval,
+    )
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import sys
 from dataclasses import dataclass
+from pathlib import Path
 
 from ignition.core.single_instance import SingleInstance
 from ignition.core.state import AppState
@@ -10,15 +13,35 @@ from ignition.gui.bootstrap import run_gui
 class AppLaunchOptions:
     start_in_background: bool
     headless: bool
+    metrics_port: int | None = None
+    metrics_file: str | None = None
+    metrics_interval: float = 15.0
 
 
-def run_app(*, start_in_background: bool, headless: bool) -> int:
+def run_app(
+    *,
+    start_in_background: bool,
+    headless: bool,
+    metrics_port: int | None = None,
+    metrics_file: str | None = None,
+    metrics_interval: float = 15.0,
+) -> int:
     with SingleInstance(name="iGnition") as instance:
         if not instance.acquired:
             return 0
 
         state = AppState.create()
-        options = AppLaunchOptions(start_in_background=start_in_background, headless=headless)
+        options = AppLaunchOptions(
+            start_in_background=start_in_background,
+            headless=headless,
+            metrics_port=metrics_port,
+            metrics_file=metrics_file,
+            metrics_interval=metrics_interval,
+        )
         if options.headless:
-            return state.run_headless()
+            return state.run_headless(
+                metrics_port=options.metrics_port,
+                metrics_file=Path(options.metrics_file) if options.metrics_file else None,
+                metrics_interval=options.metrics_interval,
+            )
         return run_gui(state=state, start_in_background=options.start_in_background)
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_GLOB = "activity-*.jsonl"
+
+
+def _segment_number(path: Path) -> int | None:
+    try:
+        return int(path.stem.split("-", 1)[1])
+    except (IndexError, ValueError):
+        return None
+
+
+@dataclass
+class _Segment:
+    number: int
+    path: Path
+    # Sparse index: (line number, byte offset, timestamp) of every Nth line.
+    points: list[tuple[int, int, float]] = field(default_factory=list)
+    lines: int = 0
+    size: int = 0
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(".idx")
+
+
+@dataclass(frozen=True)
+class JournalPage:
+    entries: list[dict[str, Any]]
+    next_cursor: str | None  # pass as ``before`` to get the next (older) page
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"entries": self.entries, "next_cursor": self.next_cursor}
+
+
+def _format_record(record: dict[str, Any], segment: int, line: int) -> dict[str, Any]:
+    ts = float(record.get("ts") or 0.0)
+    local = time.localtime(ts)
+    return {
+        "id":   f"{segment}:{line}",
+        "ts":   ts,
+        "date": time.strftime("%Y-%m-%d", local),
+        "time": time.strftime("%H:%M:%S", local),
+        "type": record.get("type"),
+        "app":  record.get("app"),
+        "msg":  record.get("msg"),
+    }
+
+
+def _parse_cursor(cursor: str | None) -> tuple[int, int] | None:
+    if not cursor:
+        return None
+    try:
+        segment, line = cursor.split(":", 1)
+        return int(segment), int(line)
+    except ValueError:
+        return None
+
+
+class ActivityJournal:
+    """Append-only JSON-lines journal of activity events, split into size-capped segments.
+
+    Each segment ``activity-NNNNNN.jsonl`` has a sidecar ``.idx`` holding the
+    byte offset and timestamp of every ``index_every``-th line. Queries walk
+    those index chunks newest first and only read the chunks they need.
+    Only the newest ``max_files`` segments are kept.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_file_bytes: int = 1 << 20,
+        max_files: int = 5,
+        index_every: int = 64,
+    ) -> None:
+        self._dir = directory
+        self._max_file_bytes = max(1024, int(max_file_bytes))
+        self._max_files = max(1, int(max_files))
+        self._index_every = max(1, int(index_every))
+        self._lock = threading.Lock()
+        self._segments: list[_Segment] = []
+        self._fh: BinaryIO | None = None
+        self._idx_fh: BinaryIO | None = None
+        self._loaded = False
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    def segment_paths(self) -> list[Path]:
+        with self._lock:
+            self._ensure_loaded()
+            return [s.path for s in self._segments]
+
+    # writing
+
+    def append(self, ts: float, event_type: str, app: str | None, msg: str) -> None:
+        line = json.dumps(
+            {"ts": round(ts, 3), "type": event_type, "app": app, "msg": msg},
+            ensure_ascii=False,
+        ).encode("utf-8") + b"\n"
+        with self._lock:
+            self._ensure_loaded()
+            seg = self._segments[-1] if self._segments else None
+            if seg is None or (seg.size and seg.size + len(line) > self._max_file_bytes):
+                seg = self._rotate()
+            fh, idx_fh = self._open_for_append(seg)
+            if seg.lines % self._index_every == 0:
+                point = (seg.lines, seg.size, round(ts, 3))
+                seg.points.append(point)
+                idx_fh.write(json.dumps(point).encode("ascii") + b"\n")
+                idx_fh.flush()
+            fh.write(line)
+            fh.flush()
+            seg.lines += 1
+            seg.size += len(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handles()
+
+    def _close_handles(self) -> None:
+        for fh in (self._fh, self._idx_fh):
+            if fh is not None:
+                try:
+                    fh.close()
+                except OSError:
+                    pass
+        self._fh = self._idx_fh = None
+
+    def _open_for_append(self, seg: _Segment) -> tuple[BinaryIO, BinaryIO]:
+        if self._fh is None or self._idx_fh is None:
+            self._close_handles()
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._fh = open(seg.path, "ab")
+            self._idx_fh = open(seg.index_path, "ab")
+        return self._fh, self._idx_fh
+
+    def _rotate(self) -> _Segment:
+        self._close_handles()
+        number = self._segments[-1].number + 1 if self._segments else 1
+        seg = _Segment(number=number, path=self._dir / f"activity-{number:06d}.jsonl")
+        self._segments.append(seg)
+        while len(self._segments) > self._max_files:
+            old = self._segments.pop(0)
+            for path in (old.path, old.index_path):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        return seg
+
+    # loading
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._dir.is_dir():
+            return
+        found = sorted(
+            (n, p) for p in self._dir.glob(_SEGMENT_GLOB)
+            if (n := _segment_number(p)) is not None
+        )
+        for number, path in found:
+            seg = _Segment(number=number, path=path)
+            try:
+                self._load_segment(seg)
+            except OSError:
+                logger.warning("Skipping unreadable journal segment %s", path)
+                continue
+            self._segments.append(seg)
+
+    def _load_segment(self, seg: _Segment) -> None:
+        seg.size = seg.path.stat().st_size
+        points: list[tuple[int, int, float]] = []
+        try:
+            for raw in seg.index_path.read_bytes().splitlines():
+                line, offset, ts = json.loads(raw)
+                points.append((int(line), int(offset), float(ts)))
+        except (OSError, ValueError, TypeError):
+            points = []
+        if points and points[-1][1] <= seg.size:
+            # count the lines after the last indexed one
+            with open(seg.path, "rb") as fh:
+                fh.seek(points[-1][1])
+                seg.lines = points[-1][0] + fh.read().count(b"\n")
+            seg.points = points
+            return
+        self._rebuild_index(seg)
+
+    def _rebuild_index(self, seg: _Segment) -> None:
+        points: list[tuple[int, int, float]] = []
+        offset = 0
+        lines = 0
+        with open(seg.path, "rb") as fh:
+            for raw in fh:
+                if lines % self._index_every == 0:
+                    points.append((lines, offset, self._record_ts(raw)))
+                offset += len(raw)
+                lines += 1
+        seg.points, seg.lines, seg.size = points, lines, offset
+        payload = b"".join(json.dumps(p).encode("ascii") + b"\n" for p in points)
+        seg.index_path.write_bytes(payload)
+
+    @staticmethod
+    def _record_ts(raw: bytes) -> float:
+        try:
+            return float(json.loads(raw).get("ts") or 0.0)
+        except (ValueError, AttributeError):
+            return 0.0
+
+    # querying
+
+    def query(
+        self,
+        *,
+        since: float | None = None,
+        until: float | None = None,
+        types: Iterable[str] | None = None,
+        app: str | None = None,
+        before: str | None = None,
+        limit: int = 100,
+    ) -> JournalPage:
+        """One page of matching entries, newest first.
+
+        ``since``/``until`` are epoch seconds (inclusive); ``before`` is the
+        ``next_cursor`` of the previous page.
+        """
+        wanted_types = set(types) if types else None
+        wanted_app = app.lower() if app else None
+        limit = max(1, int(limit))
+        cursor = _parse_cursor(before)
+
+        with self._lock:
+            self._ensure_loaded()
+            chunks = []
+            for seg in self._segments:
+                bounds = seg.points + [(seg.lines, seg.size, float("inf"))]
+                for k, (line0, off0, ts0) in enumerate(seg.points):
+                    chunks.append((seg.number, seg.path, line0, off0, bounds[k + 1][1], ts0))
+
+        out: list[dict[str, Any]] = []
+        for number, path, line0, off0, off1, ts0 in reversed(chunks):
+            if cursor is not None and (number, line0) >= cursor:
+                continue
+            if until is not None and ts0 > until:
+                continue
+            for line, record in reversed(self._read_chunk(path, line0, off0, off1)):
+                if cursor is not None and (number, line) >= cursor:
+                    continue
+                ts = float(record.get("ts") or 0.0)
+                if until is not None and ts > until:
+                    continue
+                if since is not None and ts < since:
+                    continue
+                if wanted_types is not None and record.get("type") not in wanted_types:
+                    continue
+                if wanted_app is not None and (record.get("app") or "").lower() != wanted_app:
+                    continue
+                out.append(_format_record(record, number, line))
+                if len(out) == limit:
+                    return JournalPage(entries=out, next_cursor=out[-1]["id"])
+            if since is not None and ts0 < since:
+                break
+        return JournalPage(entries=out, next_cursor=None)
+
+    @staticmethod
+    def _read_chunk(path: Path, line0: int, start: int, end: int) -> list[tuple[int, dict]]:
+        try:
+            with open(path, "rb") as fh:
+                fh.seek(start)
+                data = fh.read(end - start)
+        except OSError:
+            return []
+        records: list[tuple[int, dict]] = []
+        for i, raw in enumerate(data.splitlines()):
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                records.append((line0 + i, record))
+        return records
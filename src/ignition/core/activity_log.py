@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+DEFAULT_CAPACITY = 200
+
+
+class LogEntry:
+    __slots__ = ("seq", "ts", "type", "app", "msg")
+
+    def __init__(self, seq: int, ts: float, event_type: str, app: str | None, msg: str) -> None:
+        self.seq = seq
+        self.ts = ts
+        self.type = event_type
+        self.app = app
+        self.msg = msg
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seq":  self.seq,
+            "time": time.strftime("%H:%M:%S", time.localtime(self.ts)),
+            "type": self.type,
+            "app":  self.app,
+            "msg":  self.msg,
+        }
+
+
+class ActivityLog:
+    """Fixed-capacity ring buffer of log entries, addressed by sequence number.
+
+    Entry ``seq`` lives in slot ``seq % capacity``, so reading everything after
+    a cursor costs only the number of new entries. Sequence numbers keep
+    counting across ``clear`` and ``resize``.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._capacity = max(1, int(capacity))
+        self._slots: list[LogEntry | None] = [None] * self._capacity
+        self._next_seq = 0
+        self._first_seq = 0  # oldest seq still readable, ignoring capacity
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def next_seq(self) -> int:
+        with self._cond:
+            return self._next_seq
+
+    def __len__(self) -> int:
+        with self._cond:
+            return self._next_seq - self._oldest()
+
+    def _oldest(self) -> int:
+        return max(self._first_seq, self._next_seq - self._capacity)
+
+    def append(self, event_type: str, app: str | None, msg: str) -> LogEntry:
+        with self._cond:
+            entry = LogEntry(self._next_seq, time.time(), event_type, app, msg)
+            self._slots[entry.seq % self._capacity] = entry
+            self._next_seq += 1
+            self._cond.notify_all()
+        return entry
+
+    def since(self, seq: int) -> list[LogEntry]:
+        """Entries with ``entry.seq >= seq`` that are still in the buffer, oldest first."""
+        with self._cond:
+            return self._since(seq)
+
+    def _since(self, seq: int) -> list[LogEntry]:
+        slots, cap = self._slots, self._capacity
+        return [slots[s % cap] for s in range(max(seq, self._oldest()), self._next_seq)]
+
+    def wait_for(self, seq: int, timeout: float | None = None) -> list[LogEntry]:
+        """Block until an entry with ``seq`` or later exists (or ``timeout`` passes)."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._next_seq > seq, timeout=timeout)
+            return self._since(seq)
+
+    def clear(self) -> None:
+        with self._cond:
+            self._first_seq = self._next_seq
+            self._slots = [None] * self._capacity
+
+    def resize(self, capacity: int) -> None:
+        """Change capacity, keeping the newest entries that still fit."""
+        capacity = max(1, int(capacity))
+        with self._cond:
+            if capacity == self._capacity:
+                return
+            kept = self._since(self._next_seq - capacity)
+            self._capacity = capacity
+            self._slots = [None] * capacity
+            for entry in kept:
+                self._slots[entry.seq % capacity] = entry
+            self._first_seq = kept[0].seq if kept else self._next_seq
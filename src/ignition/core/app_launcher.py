@@ -1,17 +1,40 @@
 from __future__ import annotations
 
 import os
-import shlex
 import subprocess
-from dataclasses import dataclass
-from pathlib import Path
+from dataclasses import dataclass, field
 
+from ignition.core.launch_spec import LaunchSpec, compile_launch_spec
+from ignition.core.models import ManagedApp
+from ignition.core.process_tuning import ProcessTuning, apply_tuning
 from ignition.core.process_utils import any_process_exe_running
 
 
 @dataclass(frozen=True)
 class LaunchResult:
     pid: int
+    process: subprocess.Popen | None = field(default=None, compare=False, repr=False)
+    tuning_errors: tuple[str, ...] = ()  # settings from ``tuning`` that could not be applied
+
+
+def spawn_launch_spec(spec: LaunchSpec) -> LaunchResult:
+    """Start a precompiled spec; no validation happens here."""
+    startupinfo = None
+    if spec.start_minimized and os.name == "nt":
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = 7  # SW_SHOWMINNOACTIVE (not exported by subprocess module)
+
+    proc = subprocess.Popen(
+        list(spec.args),
+        cwd=spec.cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        stdin=subprocess.DEVNULL,
+        startupinfo=startupinfo,
+        creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
+    )
+    return LaunchResult(pid=int(proc.pid), process=proc)
 
 
 def launch_executable(
@@ -21,35 +44,44 @@ def launch_executable(
     working_directory: str,
     start_minimized: bool,
     allow_if_already_running: bool,
+    already_running: bool | None = None,
+    spec: LaunchSpec | None = None,
+    tuning: ProcessTuning | None = None,
 ) -> LaunchResult | None:
+    """Spawn ``executable_path``; ``None`` when skipped because it's already running.
+
+    ``already_running`` lets a caller that has checked a batch of executables
+    up front skip the per-app process lookup; ``spec`` skips compiling one.
+    ``tuning`` (priority, affinity, I/O priority) is applied right after spawn.
+    """
 
     if not executable_path:
         raise ValueError("Executable path is required")
-    if not os.path.exists(executable_path):
-        raise FileNotFoundError(executable_path)
+    if spec is None:
+        if not os.path.exists(executable_path):
+            raise FileNotFoundError(executable_path)
+        spec = compile_launch_spec(ManagedApp(
+            app_id="",
+            name="",
+            executable_path=executable_path,
+            arguments=arguments,
+            working_directory=working_directory,
+            start_minimized=start_minimized,
+        ))
+    if spec.problems:
+        raise ValueError("; ".join(spec.problems))
 
-    if not allow_if_already_running and any_process_exe_running(executable_path):
-        return None
+    if not allow_if_already_running:
+        if already_running is None:
+            already_running = any_process_exe_running(executable_path)
+        if already_running:
+            return None
 
-    args = [executable_path]
-    if arguments.strip():
-        args.extend(shlex.split(arguments, posix=False))
-
-    cwd = working_directory.strip() or str(Path(executable_path).parent)
-
-    startupinfo = None
-    if start_minimized and os.name == "nt":
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        startupinfo.wShowWindow = 7  # SW_SHOWMINNOACTIVE (not exported by subprocess module)
-
-    proc = subprocess.Popen(
-        args,
-        cwd=cwd,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        stdin=subprocess.DEVNULL,
-        startupinfo=startupinfo,
-        creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
-    )
-    return LaunchResult(pid=int(proc.pid))
+    result = spawn_launch_spec(spec)
+    if tuning is not None and not tuning.empty:
+        errors = apply_tuning(result.pid, tuning)
+        if errors:
+            result = LaunchResult(
+                pid=result.pid, process=result.process, tuning_errors=tuple(errors)
+            )
+    return result
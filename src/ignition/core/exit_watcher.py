@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import logging
+import os
+import select
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import psutil
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class _Watched:
+    key: str
+    pid: int
+    popen: subprocess.Popen | None
+    handle: Any = None
+    gone: bool = False
+    polled: bool = False  # no native handle could be opened; handle is a psutil.Process
+
+
+class ProcessExitWatcher:
+    """A single thread that waits on the exit handles of every watched process.
+
+    ``on_exit(key, pid)`` runs on the watcher thread the moment a watched
+    process exits. Subclasses supply the OS-specific blocking wait; this base
+    class falls back to ``psutil.wait_procs`` with a short timeout.
+    """
+
+    name = "polling"
+
+    def __init__(self, on_exit: Callable[[str, int], None]) -> None:
+        self._on_exit = on_exit
+        self._lock = threading.Lock()
+        self._watched: dict[str, _Watched] = {}
+        # Handles are only closed by the watcher thread, never under a pending wait.
+        self._retired: list[_Watched] = []
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    def watch(self, key: str, pid: int, popen: subprocess.Popen | None = None) -> None:
+        item = _Watched(key=key, pid=pid, popen=popen)
+        self._open(item)
+        with self._lock:
+            old = self._watched.pop(key, None)
+            if old is not None:
+                self._retired.append(old)
+            self._watched[key] = item
+            if self._thread is None and not self._stopping.is_set():
+                self._thread = threading.Thread(target=self._run, name="exit-watcher", daemon=True)
+                self._thread.start()
+        self._wake()
+
+    def unwatch(self, key: str) -> None:
+        with self._lock:
+            item = self._watched.pop(key, None)
+            if item is not None:
+                self._retired.append(item)
+        if item is not None:
+            self._wake()
+
+    def watched_keys(self) -> list[str]:
+        with self._lock:
+            return list(self._watched)
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._wake()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=3.0)
+        with self._lock:
+            items = [*self._watched.values(), *self._retired]
+            self._watched.clear()
+            self._retired = []
+            self._thread = None
+        for item in items:
+            self._close(item)
+        self._stopping.clear()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            with self._lock:
+                items = list(self._watched.values())
+                retired, self._retired = self._retired, []
+            for item in retired:
+                self._close(item)
+            done = [item for item in items if item.gone]
+            if not done:
+                try:
+                    done = self._wait_any(items)
+                except Exception:
+                    logger.exception("Exit wait failed")
+                    self._stopping.wait(1.0)
+                    continue
+            for item in done:
+                with self._lock:
+                    if self._watched.get(item.key) is not item:
+                        continue
+                    del self._watched[item.key]
+                self._close(item)
+                if item.popen is not None:
+                    item.popen.poll()  # reap our own child so it doesn't linger as a zombie
+                try:
+                    self._on_exit(item.key, item.pid)
+                except Exception:
+                    logger.exception("Exit handler failed for %s", item.key)
+
+    # Backend hooks -----------------------------------------------------------
+
+    def _open(self, item: _Watched) -> None:
+        try:
+            item.handle = psutil.Process(item.pid)
+        except psutil.NoSuchProcess:
+            item.gone = True
+
+    def _close(self, item: _Watched) -> None:
+        item.handle = None
+
+    def _wake(self) -> None:
+        pass
+
+    def _wait_any(self, items: list[_Watched]) -> list[_Watched]:
+        if not items:
+            self._stopping.wait(1.0)
+            return []
+        by_proc = {id(item.handle): item for item in items if item.handle is not None}
+        gone, _ = psutil.wait_procs([item.handle for item in items if item.handle], timeout=1.0)
+        return [by_proc[id(proc)] for proc in gone if id(proc) in by_proc]
+
+
+class _PidfdExitWatcher(ProcessExitWatcher):
+    name = "pidfd"
+
+    def __init__(self, on_exit: Callable[[str, int], None]) -> None:
+        super().__init__(on_exit)
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+    def _open(self, item: _Watched) -> None:
+        try:
+            item.handle = os.pidfd_open(item.pid)
+        except ProcessLookupError:
+            item.gone = True
+        except OSError as exc:
+            # Out of descriptors (EMFILE), or refused: poll this one instead.
+            logger.info("pidfd_open(%s) failed (%s); polling it instead", item.pid, exc)
+            item.polled = True
+            super()._open(item)
+
+    def _close(self, item: _Watched) -> None:
+        fd, item.handle = item.handle, None
+        if fd is not None and not item.polled:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def _wait_any(self, items: list[_Watched]) -> list[_Watched]:
+        by_fd: dict[int, _Watched] = {}
+        polled: dict[int, _Watched] = {}
+        for item in items:
+            if item.handle is None:
+                continue
+            if item.polled:
+                polled[id(item.handle)] = item
+            else:
+                by_fd[item.handle] = item
+        readable, _, _ = select.select([self._wake_r, *by_fd], [], [], 1.0 if polled else None)
+        if self._wake_r in readable:
+            try:
+                while os.read(self._wake_r, 512):
+                    pass
+            except OSError:
+                pass
+        done = [by_fd[fd] for fd in readable if fd in by_fd]
+        if polled:
+            gone, _ = psutil.wait_procs([item.handle for item in polled.values()], timeout=0)
+            done.extend(polled[id(proc)] for proc in gone)
+        return done
+
+
+class _WindowsExitWatcher(ProcessExitWatcher):
+    name = "win32-handles"
+
+    _SYNCHRONIZE = 0x00100000
+    _INFINITE = 0xFFFFFFFF
+    _WAIT_TIMEOUT = 0x102
+    _MAX_HANDLES = 63  # MAXIMUM_WAIT_OBJECTS minus the wake event
+
+    _WAIT_FAILED = 0xFFFFFFFF
+
+    def __init__(self, on_exit: Callable[[str, int], None]) -> None:
+        import ctypes
+        from ctypes import wintypes
+
+        super().__init__(on_exit)
+        # A private instance, so these prototypes don't leak into other ctypes users.
+        # Without them HANDLE results are truncated to a 32-bit int on 64-bit Windows.
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        kernel32.CreateEventW.argtypes = [
+            ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR,
+        ]
+        kernel32.SetEvent.restype = wintypes.BOOL
+        kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+        kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+        kernel32.WaitForMultipleObjects.argtypes = [
+            wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.BOOL, wintypes.DWORD,
+        ]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        self._kernel32 = kernel32
+        self._wake_event = kernel32.CreateEventW(None, False, False, None)
+        if not self._wake_event:
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def _open(self, item: _Watched) -> None:
+        handle = self._kernel32.OpenProcess(self._SYNCHRONIZE, False, item.pid)
+        if handle:
+            item.handle = handle
+        else:
+            item.gone = True
+
+    def _close(self, item: _Watched) -> None:
+        handle, item.handle = item.handle, None
+        if handle:
+            self._kernel32.CloseHandle(handle)
+
+    def _wake(self) -> None:
+        self._kernel32.SetEvent(self._wake_event)
+
+    def _wait_any(self, items: list[_Watched]) -> list[_Watched]:
+        import ctypes
+        from ctypes import wintypes
+
+        live = [item for item in items if item.handle]
+        head, overflow = live[: self._MAX_HANDLES], live[self._MAX_HANDLES:]
+        handles = (wintypes.HANDLE * (len(head) + 1))(self._wake_event, *[i.handle for i in head])
+        # With more handles than one wait can take, the rest are checked once a second.
+        timeout = 1000 if overflow else self._INFINITE
+        if (
+            self._kernel32.WaitForMultipleObjects(len(handles), handles, False, timeout)
+            == self._WAIT_FAILED
+        ):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return [
+            item for item in live
+            if self._kernel32.WaitForSingleObject(item.handle, 0) != self._WAIT_TIMEOUT
+        ]
+
+
+def create_exit_watcher(on_exit: Callable[[str, int], None]) -> ProcessExitWatcher:
+    if os.name == "nt":
+        try:
+            return _WindowsExitWatcher(on_exit)
+        except Exception:
+            logger.exception("Win32 exit watcher unavailable; polling instead")
+    elif sys.platform.startswith("linux") and hasattr(os, "pidfd_open"):
+        try:
+            os.close(os.pidfd_open(os.getpid()))
+            return _PidfdExitWatcher(on_exit)
+        except OSError:
+            logger.info("pidfd unavailable; exit watcher polling instead")
+    return ProcessExitWatcher(on_exit)
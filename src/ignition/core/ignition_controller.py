@@ -1,35 +1,83 @@
 from __future__ import annotations
 
 import datetime
-import json
 import logging
+import sqlite3
 import subprocess
 import threading
 import time
+from collections import Counter
 from dataclasses import dataclass
-from pathlib import Path
+from typing import Callable
 
 import psutil
 
+from ignition.core.activity_journal import ActivityJournal, JournalPage
+from ignition.core.activity_log import ActivityLog
 from ignition.core.app_launcher import launch_executable
 from ignition.core.config_store import ConfigStore
-from ignition.core.iracing_monitor import IRacingMonitor
+from ignition.core.exit_watcher import create_exit_watcher
+from ignition.core.iracing_monitor import SIM_PROCESS_NAME, UI_PROCESS_NAME, IRacingMonitor
+from ignition.core.launch_metrics import (
+    PHASE_DELAY_ELAPSED,
+    PHASE_SPAWNED,
+    PHASE_VISIBLE,
+    PHASE_WAIT_SATISFIED,
+    FirstVisibleWatcher,
+    LaunchMetrics,
+    LaunchTimeline,
+)
+from ignition.core.launch_plan import LaunchPlan, LaunchStep, build_launch_plan
+from ignition.core.launch_spec import LaunchSpecCache, prefetch_executable
 from ignition.core.models import ManagedApp, Profile
 from ignition.core.process_killer import (
+    TerminationResult,
     graceful_terminate_process,
     graceful_terminate_process_tree,
+    resume_processes,
+    suspend_process_tree,
+)
+from ignition.core.process_tuning import (
+    DescendantTuner,
+    ProcessTuning,
+    SavedTuning,
+    apply_tuning,
+    capture_tuning,
+    restore_tuning,
+    without_cores,
 )
-from ignition.core.process_utils import any_process_name_running
+from ignition.core.process_utils import normalize_windows_path, shared_process_snapshots
+from ignition.core.resource_governor import ResourceGovernor
+from ignition.core.session_history import SessionHistoryStore
+from ignition.core.session_stats import SessionAnalytics
 
 logger = logging.getLogger(__name__)
 
-_MAX_LOG = 200
-
 @dataclass
 class RunningApp:
     app: ManagedApp
     pid: int
     started_at_monotonic: float
+    process: subprocess.Popen | None = None
+
+@dataclass(frozen=True)
+class AppStopReport:
+    app_id: str
+    name: str
+    pid: int
+    outcome: str  # graceful | terminated | killed | gone | failed
+    duration_seconds: float
+    result: TerminationResult | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "app_id": self.app_id,
+            "name": self.name,
+            "pid": self.pid,
+            "outcome": self.outcome,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "exits": self.result.to_dict()["exits"] if self.result is not None else [],
+        }
 
 class IgnitionController:
     def __init__(self, config_store: ConfigStore) -> None:
@@ -42,26 +90,71 @@ class IgnitionController:
         self._paused = False
 
         # Activity log
-        self._log: list[dict] = []
-        self._log_seq = 0
-        self._log_lock = threading.Lock()
+        self._log = ActivityLog(capacity=config_store.config.activity_log_capacity)
+        self._journal = ActivityJournal(config_store.paths.log_dir / "activity")
+        self._journal_lock = threading.Lock()
+        self._deferred_journal: list[tuple[float, str, str | None, str]] = []
+
+        # Own-CPU budget, enforced while a session is running
+        self._governor = ResourceGovernor(
+            get_budget_percent=lambda: self._config_store.config.cpu_budget_percent
+        )
 
         # Session history
-        self._session_history: list[dict] = []
         self._curr_session_start: datetime.datetime | None = None
         self._curr_session_apps: list[str] = []
-        self._history_lock = threading.Lock()
-        self._load_session_history()
+        self._curr_session_timelines: list[LaunchTimeline] = []
+        self._history = SessionHistoryStore(
+            config_store.paths.session_history_db,
+            legacy_json=config_store.paths.session_history_file,
+        )
+        # Per-phase launch latency, per app and per profile
+        self._launch_metrics = LaunchMetrics()
 
-        # Watchdog (crash-restart)
-        self._watchdog_stop: threading.Event | None = None
-        self._restart_counts: dict[str, int] = {}
+        # Aggregates over that history, loaded on first use and updated per session
+        self._session_stats: SessionAnalytics | None = None
+        self._stats_lock = threading.Lock()
 
+        # Watchdog (crash-restart): one waiter on every running app's exit handle
+        self._exit_watcher = create_exit_watcher(self._on_app_exited)
+        self._restart_counts: dict[str, int] = {}
+        self._termination_stats: dict[str, dict] = {}
+        # Priority / affinity / I/O priority follow an app's process tree
+        self._tuner = DescendantTuner(self._on_tuning_failed, stretch=self._governor.stretch)
+        # The trigger process's own tuning for this session, and the cores kept free for it
+        self._trigger_saved: list[SavedTuning] = []
+        self._reserved_cores: tuple[int, ...] = ()
+        # Apps frozen while the sim runs (suspend_while_driving), with what was suspended
+        self._sim_running = False
+        self._suspended: dict[str, list[psutil.Process]] = {}
+        # Called (from any thread) whenever state the UI shows may have changed
+        self._change_listeners: list[Callable[[], None]] = []
+        # Lifetime event counters for the metrics exporter
+        self._counters: Counter[str] = Counter()
+
+        # Set when the current session ends; pending launch branches bail out on it
+        self._session_cancel = threading.Event()
+
+        # Launch warm-up: specs are compiled and validated before the session needs them
+        self._launch_specs = LaunchSpecCache()
+        self._launch_problems: dict[str, list[str]] = {}
+        self._warm_up_lock = threading.Lock()
+        self._warm_up_thread: threading.Thread | None = None
+        self._warm_up_again = False
+
+        self._snapshots = shared_process_snapshots()
+        self._visible_watcher = FirstVisibleWatcher(
+            snapshots=self._snapshots, stretch=self._governor.stretch
+        )
         self._monitor = IRacingMonitor(
             get_trigger_process_names=self._get_trigger_process_names,
             get_poll_interval_seconds=lambda: self._config_store.config.poll_interval_seconds,
             on_iracing_started=self._on_iracing_started,
             on_iracing_stopped=self._on_iracing_stopped,
+            on_armed=self.schedule_warm_up,
+            on_sim_changed=self._on_sim_changed,
+            snapshots=self._snapshots,
+            governor=self._governor,
         )
 
     def get_session_start_at(self) -> str | None:
@@ -78,14 +171,26 @@ class IgnitionController:
         with self._lock:
             return list(self._running.keys())
 
+    def get_suspended_app_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._suspended.keys())
+
+    def get_launch_plan(self) -> dict:
+        return build_launch_plan(list(self._get_active_profile().apps)).to_dict()
+
     def is_paused(self) -> bool:
         return self._paused
 
     def get_session_type(self) -> str | None:
+        if self._sim_running:
+            return "race"
         try:
-            if any_process_name_running(["iRacingSim64DX11.exe"]):
+            snapshot = self._snapshots.get(
+                max_age_seconds=self._governor.stretch(self._snapshots.max_age_seconds)
+            )
+            if snapshot.any_name_running([SIM_PROCESS_NAME]):
                 return "race"
-            if any_process_name_running(["iRacingUI.exe"]):
+            if snapshot.any_name_running([UI_PROCESS_NAME]):
                 return "service"
         except Exception:
             pass
@@ -100,51 +205,64 @@ class IgnitionController:
         self._log_event("resumed", None, "Monitoring resumed")
 
     def get_log_since(self, seq: int) -> list[dict]:
-        with self._log_lock:
-            return [e for e in self._log if e["seq"] >= seq]
+        return [e.to_dict() for e in self._log.since(seq)]
 
-    def clear_log(self) -> None:
-        with self._log_lock:
-            self._log.clear()
+    def wait_for_log(self, seq: int, timeout: float | None = None) -> list[dict]:
+        """Like ``get_log_since`` but blocks until there is something new."""
+        return [e.to_dict() for e in self._log.wait_for(seq, timeout)]
 
-    def get_session_history(self) -> list[dict]:
-        with self._history_lock:
-            return list(reversed(self._session_history))
+    def query_journal(self, **filters) -> JournalPage:
+        """A page of the on-disk activity journal; see ``ActivityJournal.query``."""
+        return self._journal.query(**filters)
 
-    def clear_session_history(self) -> None:
-        with self._history_lock:
-            self._session_history.clear()
-        self._save_session_history()
+    def set_log_capacity(self, capacity: int) -> None:
+        self._log.resize(capacity)
 
-    def _load_session_history(self) -> None:
-        path = self._history_file()
-        if path is None or not path.exists():
-            return
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            if isinstance(data, list):
-                self._session_history = data[-50:]
-        except Exception:
-            pass
+    def clear_log(self) -> None:
+        self._log.clear()
 
-    def _save_session_history(self) -> None:
-        path = self._history_file()
-        if path is None:
-            return
+    def get_session_history(
+        self, *, limit: int = 50, offset: int = 0, profile_id: str | None = None
+    ) -> list[dict]:
+        """Completed sessions, newest first."""
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(
-                json.dumps(self._session_history[-50:], indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
-        except Exception:
-            pass
+            return self._history.page(limit=limit, offset=offset, profile_id=profile_id)
+        except sqlite3.Error:
+            logger.exception("Reading session history failed")
+            return []
 
-    def _history_file(self) -> Path | None:
+    def clear_session_history(self) -> None:
         try:
-            return self._config_store.paths.session_history_file
-        except Exception:
-            return None
+            self._history.clear()
+        except sqlite3.Error:
+            logger.exception("Clearing session history failed")
+        with self._stats_lock:
+            self._session_stats = SessionAnalytics()
+            self._save_session_stats(self._session_stats)
+
+    def get_session_stats(self) -> dict:
+        with self._stats_lock:
+            return self._analytics().summary()
+
+    def _analytics(self) -> SessionAnalytics:
+        """Caller holds ``_stats_lock``. Rebuilt from history if missing or out of step."""
+        if self._session_stats is None:
+            stats = SessionAnalytics.load(self._config_store.paths.session_stats_file)
+            try:
+                if stats is None or stats.sessions != self._history.count():
+                    stats = SessionAnalytics.rebuild(self._history.iter_entries())
+                    self._save_session_stats(stats)
+            except sqlite3.Error:
+                logger.exception("Rebuilding session stats failed")
+                stats = stats or SessionAnalytics()
+            self._session_stats = stats
+        return self._session_stats
+
+    def _save_session_stats(self, stats: SessionAnalytics) -> None:
+        try:
+            stats.save(self._config_store.paths.session_stats_file)
+        except OSError:
+            logger.exception("Saving session stats failed")
 
     @staticmethod
     def _send_windows_toast(title: str, body: str) -> None:
@@ -171,26 +289,117 @@ class IgnitionController:
         except Exception:
             pass
 
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """``listener()`` runs on every status change or new log entry; it must not block."""
+        self._change_listeners.append(listener)
+
+    def _notify_changed(self) -> None:
+        for listener in list(self._change_listeners):
+            try:
+                listener()
+            except Exception:
+                logger.exception("Change listener failed")
+
     def _log_event(self, event_type: str, app_name: str | None, message: str) -> None:
-        with self._log_lock:
-            entry = {
-                "seq":  self._log_seq,
-                "time": datetime.datetime.now().strftime("%H:%M:%S"),
-                "type": event_type,
-                "app":  app_name,
-                "msg":  message,
-            }
-            self._log.append(entry)
-            self._log_seq += 1
-            if len(self._log) > _MAX_LOG:
-                self._log = self._log[-_MAX_LOG:]
+        entry = self._log.append(event_type, app_name, message)
+        self._notify_changed()
+        record = (entry.ts, event_type, app_name, message)
+        with self._journal_lock:
+            if not self._governor.allow_optional():
+                self._deferred_journal.append(record)
+                return
+        self._flush_journal(record)
+
+    def _flush_journal(self, *records: tuple[float, str, str | None, str]) -> None:
+        """Write journal entries held back while over the CPU budget, then ``records``."""
+        with self._journal_lock:
+            pending = self._deferred_journal + list(records)
+            self._deferred_journal = []
+            try:
+                for record in pending:
+                    self._journal.append(*record)
+            except OSError:
+                logger.warning("Activity journal write failed", exc_info=True)
+
+    def get_resource_usage(self) -> dict:
+        """Own CPU use against the session budget."""
+        usage = self._governor.stats()
+        with self._journal_lock:
+            usage["deferred_writes"] = len(self._deferred_journal)
+        return usage
 
     def start(self) -> None:
         self._monitor.start()
+        self.schedule_warm_up()
+
+    def get_launch_problems(self) -> dict[str, list[str]]:
+        with self._lock:
+            return {k: list(v) for k, v in self._launch_problems.items()}
 
-    def stop(self) -> None:
+    def schedule_warm_up(self) -> None:
+        """Run ``warm_up`` in the background; calls made while one runs fold into one rerun."""
+        with self._warm_up_lock:
+            if self._warm_up_thread is not None:
+                self._warm_up_again = True
+                return
+            self._warm_up_thread = threading.Thread(
+                target=self._warm_up_loop, name="launch-warm-up", daemon=True
+            )
+            self._warm_up_thread.start()
+
+    def _warm_up_loop(self) -> None:
+        while True:
+            try:
+                self.warm_up()
+            except Exception:
+                logger.exception("Launch warm-up failed")
+            with self._warm_up_lock:
+                if not self._warm_up_again:
+                    self._warm_up_thread = None
+                    return
+                self._warm_up_again = False
+
+    def warm_up(self) -> dict[str, list[str]]:
+        """Compile and validate launch specs for the active profile's enabled apps.
+
+        Newly found problems go to the activity log; the current set is
+        returned and kept for ``get_launch_problems``.
+        """
+        cfg = self._config_store.config
+        apps = [a for a in self._get_active_profile().apps if a.enabled]
+        problems: dict[str, list[str]] = {}
+        for app in apps:
+            spec = self._launch_specs.refresh(app)
+            if spec.problems:
+                problems[app.app_id] = list(spec.problems)
+            elif cfg.prefetch_executables:
+                prefetch_executable(app.executable_path)
+        self._launch_specs.retain(a.app_id for p in cfg.profiles for a in p.apps)
+
+        with self._lock:
+            previous = self._launch_problems
+            self._launch_problems = problems
+        if problems != previous:
+            self._notify_changed()
+        for app in apps:
+            found = problems.get(app.app_id)
+            if found and found != previous.get(app.app_id):
+                self._log_event("error", app.name, f"Launch check failed: {'; '.join(found)}")
+                logger.warning("Launch check failed for %s: %s", app.name, "; ".join(found))
+        return problems
+
+    def stop(self) -> list[AppStopReport]:
         self._monitor.stop()
-        self._stop_all_managed(reason="shutdown")
+        reports = self._stop_all_managed(reason="shutdown")
+        self._exit_watcher.stop()
+        self._tuner.stop()
+        self._visible_watcher.stop()
+        self._restore_trigger()
+        self._governor.set_enforcing(False)
+        self._flush_journal()
+        self._journal.close()
+        self._history.close()
+        return reports
 
     def start_app_now(self, *, app_id: str) -> None:
         app = self._find_app(app_id)
@@ -203,9 +412,12 @@ class IgnitionController:
             running = self._running.get(app_id)
         if running is None:
             return
-        self._terminate(running)
+        self._exit_watcher.unwatch(app_id)
+        self._tuner.untrack(app_id)
+        self._stop_running(running)
         with self._lock:
             self._running.pop(app_id, None)
+        self._notify_changed()
 
     def _get_active_profile(self) -> Profile:
         cfg = self._config_store.config
@@ -219,55 +431,57 @@ class IgnitionController:
             return []
         return list(profile.trigger_process_names)
 
-    def _watchdog_loop(self, stop: threading.Event) -> None:
-        while not stop.wait(2.0):
-            with self._lock:
-                if not self._iracing_running:
-                    break
-                items = list(self._running.items())
-            for app_id, running in items:
-                is_alive = True
-                try:
-                    proc = psutil.Process(running.pid)
-                    if not proc.is_running() or proc.status() == psutil.STATUS_ZOMBIE:
-                        is_alive = False
-                except psutil.NoSuchProcess:
-                    is_alive = False
-                if not is_alive:
-                    with self._lock:
-                        if app_id not in self._running:
-                            continue
-                        self._running.pop(app_id, None)
-                    if not running.app.restart_on_crash:
-                        self._log_event(
-                            "error", running.app.name,
-                            f"Process exited unexpectedly (pid {running.pid})",
-                        )
-                        continue
-                    count = self._restart_counts.get(app_id, 0)
-                    max_a = max(1, int(running.app.max_restart_attempts))
-                    if count >= max_a:
-                        self._log_event(
-                            "error", running.app.name,
-                            f"Crashed — max restarts ({max_a}) reached",
-                        )
-                        continue
-                    self._restart_counts[app_id] = count + 1
-                    self._log_event(
-                        "launch", running.app.name,
-                        f"Crashed — restarting (attempt {count + 1}/{max_a})",
-                    )
-                    threading.Thread(
-                        target=self._start_app, args=(running.app,), daemon=True
-                    ).start()
+    def _on_app_exited(self, app_id: str, pid: int) -> None:
+        with self._lock:
+            running = self._running.get(app_id)
+            if running is None or running.pid != pid:
+                return
+            self._running.pop(app_id, None)
+            in_session = self._iracing_running
+        self._tuner.untrack(app_id)
+        self._resume_app(app_id)  # don't leave frozen children behind
+
+        if not in_session:
+            self._log_event("stop", running.app.name, f"Exited (pid {pid})")
+            return
+        self._count("crashes")
+        if not running.app.restart_on_crash:
+            self._log_event(
+                "error", running.app.name,
+                f"Process exited unexpectedly (pid {pid})",
+            )
+            return
+        count = self._restart_counts.get(app_id, 0)
+        max_a = max(1, int(running.app.max_restart_attempts))
+        if count >= max_a:
+            self._log_event(
+                "error", running.app.name,
+                f"Crashed — max restarts ({max_a}) reached",
+            )
+            return
+        self._restart_counts[app_id] = count + 1
+        self._count("restarts")
+        # The shared snapshot may still list the instance that just died, which
+        # would make the relaunch skip itself as "already running".
+        self._snapshots.invalidate([pid])
+        self._log_event(
+            "launch", running.app.name,
+            f"Crashed — restarting (attempt {count + 1}/{max_a})",
+        )
+        threading.Thread(
+            target=self._start_app, args=(running.app,), daemon=True
+        ).start()
 
     def _on_iracing_started(self) -> None:
+        trigger_at = time.monotonic()
         with self._lock:
             self._iracing_running = True
+        self._notify_changed()
 
         if self._paused:
             self._log_event("skipped", None, "iRacing detected — skipped (monitoring paused)")
             return
+        self._governor.set_enforcing(True)
 
         profile = self._get_active_profile()
         if not profile.enabled:
@@ -276,31 +490,27 @@ class IgnitionController:
         self._log_event("iracing_start", None, "iRacing detected — starting apps")
         logger.info("iRacing detected: start sequence")
 
+        cancel = threading.Event()
         with self._lock:
             self._curr_session_start = datetime.datetime.now()
             self._curr_session_apps = []
+            self._curr_session_timelines = []
+            self._session_cancel = cancel
+        self._notify_changed()
 
         self._restart_counts.clear()
-
-        for app in list(profile.apps):
-            with self._lock:
-                if not self._iracing_running:
-                    break
-            if not app.enabled:
-                self._log_event("skipped", app.name, "Skipped (app disabled)")
-                continue
-            if app.start_delay_seconds > 0:
-                time.sleep(float(app.start_delay_seconds))
-                with self._lock:
-                    if not self._iracing_running:
-                        break
-            self._start_app(app)
-
-        stop = threading.Event()
-        self._watchdog_stop = stop
-        threading.Thread(
-            target=self._watchdog_loop, args=(stop,), name="watchdog", daemon=True
-        ).start()
+        self._tune_trigger(profile)
+
+        plan = build_launch_plan(list(profile.apps))
+        for app in plan.disabled:
+            self._log_event("skipped", app.name, "Skipped (app disabled)")
+        self._run_launch_plan(
+            plan,
+            cancel,
+            self._already_running(plan),
+            trigger_at=trigger_at,
+            profile_id=profile.profile_id,
+        )
 
         with self._lock:
             launched = len(self._curr_session_apps)
@@ -314,18 +524,149 @@ class IgnitionController:
                     daemon=True,
                 ).start()
 
+    def _tune_trigger(self, profile: Profile, *, sim_only: bool = False) -> None:
+        """Apply the profile's trigger policy to the trigger processes and the sim.
+
+        At session start that is every trigger process plus the sim if it is
+        already up; with ``sim_only`` (the sim started mid-session, e.g. in UI
+        trigger mode) just the sim. What each process had before is kept for
+        ``_restore_trigger``; while reserved cores are set, companions
+        launched this session avoid them.
+        """
+        policy = profile.trigger_policy
+        if not policy.enabled:
+            return
+        tuning = ProcessTuning(
+            priority=policy.priority, cpu_affinity=tuple(policy.reserved_cores)
+        )
+        names = [SIM_PROCESS_NAME]
+        if not sim_only:
+            names += profile.trigger_process_names
+        pids = self._snapshots.pids_for_names(names)
+        with self._lock:
+            if not sim_only:
+                self._trigger_saved = []
+                self._reserved_cores = tuning.cpu_affinity
+            already = {s.pid for s in self._trigger_saved}
+        saved, failures = [], []
+        for pid in pids:
+            if pid in already:
+                continue
+            previous = capture_tuning(pid)
+            if previous is None:
+                continue
+            saved.append(previous)
+            failures += apply_tuning(pid, tuning)
+        with self._lock:
+            self._trigger_saved += saved
+        if failures:
+            self._log_event("error", None, f"Could not tune iRacing: {'; '.join(failures)}")
+            logger.warning("Trigger tuning failed: %s", "; ".join(failures))
+        elif saved:
+            logger.info("Tuned trigger process(es) %s", [s.pid for s in saved])
+
+    def _restore_trigger(self) -> None:
+        with self._lock:
+            saved, self._trigger_saved = self._trigger_saved, []
+            self._reserved_cores = ()
+        failures = [f for previous in saved for f in restore_tuning(previous)]
+        if failures:
+            logger.warning("Restoring trigger tuning failed: %s", "; ".join(failures))
+
+    def _app_tuning(self, app: ManagedApp) -> ProcessTuning:
+        with self._lock:
+            reserved = self._reserved_cores
+        return without_cores(ProcessTuning.from_app(app), reserved)
+
+    def _already_running(self, plan: LaunchPlan) -> dict[str, list[int]]:
+        """One process pass for every app that must not start twice.
+
+        Apps sharing an executable are left out: whether the later one is
+        "already running" depends on the earlier one's launch, so they keep
+        the live per-app check.
+        """
+        counts = Counter(
+            normalize_windows_path(s.app.executable_path)
+            for s in plan.steps if s.app.executable_path
+        )
+        paths = [
+            s.app.executable_path for s in plan.steps
+            if not s.app.start_if_already_running
+            and s.app.executable_path
+            and counts[normalize_windows_path(s.app.executable_path)] == 1
+        ]
+        found = self._snapshots.running_executables(paths)
+        return {p: found.get(p, []) for p in paths}
+
+    def _run_launch_plan(
+        self,
+        plan: LaunchPlan,
+        cancel: threading.Event,
+        already_running: dict[str, list[int]] | None = None,
+        *,
+        trigger_at: float | None = None,
+        profile_id: str = "",
+    ) -> None:
+        """Launch every branch of ``plan`` concurrently; returns once all have finished.
+
+        ``already_running`` maps executable paths checked at session start to
+        their running PIDs (empty when not running); apps not in it are
+        checked when they launch. Delays count from ``trigger_at``, which is
+        also where each app's launch timeline starts.
+        """
+        already_running = already_running or {}
+        session_t0 = time.monotonic() if trigger_at is None else trigger_at
+        finished = {step.app.app_id: threading.Event() for step in plan.steps}
+
+        def run_step(step: LaunchStep) -> None:
+            try:
+                for dep in step.depends_on:
+                    finished[dep].wait()
+                delay = session_t0 + step.offset_seconds - time.monotonic()
+                if cancel.wait(max(0.0, delay)):
+                    return
+                timeline = LaunchTimeline(
+                    app_id=step.app.app_id,
+                    name=step.app.name,
+                    profile_id=profile_id,
+                    trigger_at=session_t0,
+                )
+                timeline.mark(PHASE_DELAY_ELAPSED)
+                self._start_app(
+                    step.app,
+                    running_pids=already_running.get(step.app.executable_path),
+                    timeline=timeline,
+                )
+            except Exception:
+                logger.exception("Launch step failed: %s", step.app.name)
+            finally:
+                finished[step.app.app_id].set()
+
+        threads = [
+            threading.Thread(
+                target=run_step, args=(step,), name=f"launch-{step.app.name}", daemon=True
+            )
+            for step in plan.steps
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
     def _on_iracing_stopped(self) -> None:
         with self._lock:
             self._iracing_running = False
+            self._session_cancel.set()
             session_start = self._curr_session_start
             session_apps = list(self._curr_session_apps)
+            session_timelines = list(self._curr_session_timelines)
             self._curr_session_start = None
             self._curr_session_apps = []
-        if self._watchdog_stop is not None:
-            self._watchdog_stop.set()
-            self._watchdog_stop = None
+            self._curr_session_timelines = []
+        self._governor.set_enforcing(False)
         self._log_event("iracing_stop", None, "iRacing closed — stopping apps")
         logger.info("iRacing closed: stop sequence")
+        self._restore_trigger()
         self._stop_all_managed(reason="iracing-exit")
 
         if session_start is not None:
@@ -339,14 +680,25 @@ class IgnitionController:
                 "profile_name": profile.name,
                 "profile_id": profile.profile_id,
                 "apps_launched": session_apps,
+                "launch_timings": [t.to_dict() for t in session_timelines],
             }
-            with self._history_lock:
-                self._session_history.append(entry)
-                if len(self._session_history) > 50:
-                    self._session_history = self._session_history[-50:]
-            self._save_session_history()
-
-    def _start_app(self, app: ManagedApp) -> None:
+            with self._stats_lock:
+                stats = self._analytics()
+                try:
+                    self._history.add(entry)
+                except sqlite3.Error:
+                    logger.exception("Saving session history failed")
+                    return
+                stats.record(entry)
+                self._save_session_stats(stats)
+
+    def _start_app(
+        self,
+        app: ManagedApp,
+        *,
+        running_pids: list[int] | None = None,
+        timeline: LaunchTimeline | None = None,
+    ) -> None:
         with self._lock:
             if app.app_id in self._running:
                 return
@@ -359,14 +711,25 @@ class IgnitionController:
                 with self._lock:
                     if not self._iracing_running:
                         return
-                if any_process_name_running([app.wait_for_process]):
+                if self._snapshots.any_name_running([app.wait_for_process]):
                     break
-                time.sleep(0.5)
+                time.sleep(self._governor.stretch(0.5))
             else:
                 self._log_event("error", app.name, f"Timed out waiting for {app.wait_for_process}")
                 logger.warning("Timeout waiting for %s before %s", app.wait_for_process, app.name)
                 return
 
+        if timeline is not None:
+            timeline.mark(PHASE_WAIT_SATISFIED)
+
+        spec = self._launch_specs.get(app)
+        tuning = self._app_tuning(app)
+        if spec.problems:
+            self._count("launch_failures")
+            self._log_event("error", app.name, f"Launch failed: {'; '.join(spec.problems)}")
+            logger.error("Failed to start %s: %s", app.name, "; ".join(spec.problems))
+            return
+
         try:
             result = launch_executable(
                 executable_path=app.executable_path,
@@ -374,47 +737,278 @@ class IgnitionController:
                 working_directory=app.working_directory,
                 start_minimized=app.start_minimized,
                 allow_if_already_running=app.start_if_already_running,
+                already_running=None if running_pids is None else bool(running_pids),
+                spec=spec,
+                tuning=tuning,
             )
         except Exception as exc:
+            self._count("launch_failures")
             self._log_event("error", app.name, f"Launch failed: {exc}")
             logger.error("Failed to start %s: %s", app.name, exc)
             return
 
         if result is None:
-            self._log_event("skipped", app.name, "Skipped (already running)")
+            pids = ", ".join(str(p) for p in running_pids or ())
+            self._log_event(
+                "skipped", app.name,
+                f"Skipped (already running, pid {pids})" if pids else "Skipped (already running)",
+            )
             logger.info("Skipped (already running): %s", app.name)
             return
 
-        running = RunningApp(app=app, pid=result.pid, started_at_monotonic=time.monotonic())
+        spawned_at = time.monotonic()
+        self._count("launches")
+        running = RunningApp(
+            app=app, pid=result.pid, started_at_monotonic=spawned_at, process=result.process
+        )
         with self._lock:
             self._running[app.app_id] = running
             self._curr_session_apps.append(app.name)
+            if timeline is not None:
+                self._curr_session_timelines.append(timeline)
+        if timeline is not None:
+            timeline.mark(PHASE_SPAWNED, spawned_at)
+            self._visible_watcher.watch(result.pid, lambda at: self._on_app_visible(timeline, at))
+        self._exit_watcher.watch(app.app_id, result.pid, result.process)
         self._log_event("launch", app.name, f"Started (pid {result.pid})")
         logger.info("Started: %s (pid=%s)", app.name, result.pid)
+        if result.tuning_errors:
+            self._on_tuning_failed(app.app_id, list(result.tuning_errors))
+        if app.kill_process_tree:
+            self._tuner.track(app.app_id, result.pid, tuning)
+        if app.suspend_while_driving:
+            self._suspend_app(running)  # no-op unless the sim is running
+
+    def _on_tuning_failed(self, app_id: str, failures: list[str]) -> None:
+        app = self._find_app(app_id)
+        name = app.name if app is not None else app_id
+        self._log_event("error", name, f"Could not apply {'; '.join(failures)}")
+        logger.warning("Process tuning failed for %s: %s", name, "; ".join(failures))
+
+    def _on_sim_changed(self, running: bool) -> None:
+        """Freeze ``suspend_while_driving`` apps while the sim runs; thaw them when it exits.
+
+        A sim started mid-session also gets the profile's trigger policy.
+        """
+        with self._lock:
+            self._sim_running = running
+            in_session = self._iracing_running
+            session_started = self._curr_session_start is not None
+            to_suspend = [r for r in self._running.values() if r.app.suspend_while_driving]
+            suspended = list(self._suspended)
+        self._notify_changed()  # session type
+        if running:
+            if session_started:
+                self._tune_trigger(self._get_active_profile(), sim_only=True)
+            if in_session:
+                for app in to_suspend:
+                    self._suspend_app(app)
+            return
+        for app_id in suspended:
+            if self._resume_app(app_id):
+                app = self._find_app(app_id)
+                self._log_event("resumed", app.name if app else app_id, "Resumed (sim closed)")
+
+    def _suspend_app(self, running: RunningApp) -> None:
+        """Suspend ``running`` if it's still running in a session with the sim up."""
+        app_id = running.app.app_id
+        with self._lock:
+            if app_id in self._suspended or not (self._sim_running and self._iracing_running):
+                return
+        procs = suspend_process_tree(running.pid, tree=running.app.kill_process_tree)
+        if not procs:
+            return
+        with self._lock:
+            # Checked again together with the store: a sim exit (or stop) handled
+            # while we were suspending has already resumed everything it saw.
+            kept = (
+                self._sim_running
+                and self._iracing_running
+                and self._running.get(app_id) is running
+                and app_id not in self._suspended
+            )
+            if kept:
+                self._suspended[app_id] = procs
+        if not kept:
+            resume_processes(procs)
+            return
+        self._log_event(
+            "paused", running.app.name, f"Suspended while driving ({len(procs)} processes)"
+        )
+        logger.info("Suspended while driving: %s (pid=%s)", running.app.name, running.pid)
 
-    def _stop_all_managed(self, *, reason: str) -> None:
+    def _resume_app(self, app_id: str) -> bool:
+        with self._lock:
+            procs = self._suspended.pop(app_id, None)
+        if procs is None:
+            return False
+        resume_processes(procs)
+        self._notify_changed()
+        return True
+
+    def _on_app_visible(self, timeline: LaunchTimeline, at: float | None) -> None:
+        if at is not None:
+            timeline.mark(PHASE_VISIBLE, at)
+        self._launch_metrics.record(timeline)
+
+    def get_launch_metrics(self) -> dict:
+        return self._launch_metrics.to_dict()
+
+    def _stop_all_managed(
+        self, *, reason: str, timeout_seconds: float | None = None
+    ) -> list[AppStopReport]:
+        """Stop managed apps in reverse-dependency levels, each level in parallel.
+
+        On quit (or with an explicit ``timeout_seconds``) every termination
+        shares one overall deadline; apps still running when it runs out are
+        killed instead of waited on. When iRacing exits there is no hurry, so
+        each app gets its full grace period.
+        """
         with self._lock:
             running_apps = list(self._running.values())
             self._running.clear()
-
+        self._notify_changed()  # apps left running emit no stop event of their own
         for running in running_apps:
-            if not running.app.kill_on_iracing_exit and reason == "iracing-exit":
-                continue
-            try:
-                self._terminate(running)
-                self._log_event("stop", running.app.name, f"Stopped (pid {running.pid})")
-                logger.info("Stopped: %s (pid=%s)", running.app.name, running.pid)
-            except Exception:
-                self._log_event("error", running.app.name, "Failed to stop")
-                logger.exception("Failed to stop: %s (pid=%s)", running.app.name, running.pid)
+            self._exit_watcher.unwatch(running.app.app_id)
+            self._tuner.untrack(running.app.app_id)
+            self._resume_app(running.app.app_id)
+
+        to_stop = [
+            r for r in running_apps
+            if r.app.kill_on_iracing_exit or reason != "iracing-exit"
+        ]
+        if not to_stop:
+            return []
+        if timeout_seconds is None and reason == "shutdown":
+            timeout_seconds = float(self._config_store.config.shutdown_timeout_seconds or 10.0)
+        deadline = None if timeout_seconds is None else time.monotonic() + max(0.0, timeout_seconds)
 
-    @staticmethod
-    def _terminate(running: RunningApp) -> None:
+        by_id = {r.app.app_id: r for r in to_stop}
+        plan = build_launch_plan([r.app for r in to_stop], include_disabled=True)
+        reports: dict[str, AppStopReport] = {}
+
+        def stop_one(running: RunningApp) -> None:
+            reports[running.app.app_id] = self._stop_running(running, deadline=deadline)
+
+        for level in reversed(plan.levels()):
+            threads = [
+                threading.Thread(
+                    target=stop_one, args=(by_id[step.app.app_id],),
+                    name=f"stop-{step.app.name}", daemon=True,
+                )
+                for step in level
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        return [reports[r.app.app_id] for r in to_stop if r.app.app_id in reports]
+
+    def _stop_running(self, running: RunningApp, *, deadline: float | None = None) -> AppStopReport:
+        started = time.monotonic()
+        result: TerminationResult | None = None
+        # A stopped process can't act on a close request, and on POSIX SIGTERM stays pending
+        self._resume_app(running.app.app_id)
+        try:
+            result = self._terminate(running, deadline=deadline)
+            outcome = result.outcome
+        except Exception:
+            self._log_event("error", running.app.name, "Failed to stop")
+            logger.exception("Failed to stop: %s (pid=%s)", running.app.name, running.pid)
+            outcome = "failed"
+        report = AppStopReport(
+            app_id=running.app.app_id,
+            name=running.app.name,
+            pid=running.pid,
+            outcome=outcome,
+            duration_seconds=time.monotonic() - started,
+            result=result,
+        )
+        if result is not None:
+            self._log_event(
+                "stop", running.app.name,
+                f"Stopped (pid {running.pid}, {outcome}, {report.duration_seconds:.1f}s)",
+            )
+            logger.info(
+                "Stopped: %s (pid=%s, %s, %.2fs)",
+                running.app.name, running.pid, outcome, report.duration_seconds,
+            )
+            self._record_termination(running.app, result)
+        return report
+
+    def _record_termination(self, app: ManagedApp, result: TerminationResult) -> None:
+        with self._lock:
+            stats = self._termination_stats.setdefault(
+                app.app_id, {"name": app.name, "stops": 0, "kills": 0}
+            )
+            stats["stops"] += 1
+            self._counters[f"terminations_{result.outcome}"] += 1
+            stats["kills"] += int(result.killed)
+            stats["last_outcome"] = result.outcome
+            stats["last_duration_seconds"] = round(result.duration_seconds, 3)
+            close_s = result.close_phase_seconds()
+            if close_s is not None:
+                prev = stats.get("max_close_seconds") or 0.0
+                stats["max_close_seconds"] = round(max(prev, close_s), 3)
+        grace = float(app.shutdown_grace_seconds or 0.0)
+        if result.killed and grace > 0:
+            self._log_event(
+                "error", app.name,
+                f"Had to be killed after a {grace:g}s grace period — consider raising it",
+            )
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def get_metrics(self) -> dict:
+        """Point-in-time counters and gauges for ``metrics_exporter``."""
+        monitor = self._monitor.get_stats()
+        with self._lock:
+            counters = dict(self._counters)
+            iracing_running = self._iracing_running
+            managed = len(self._running)
+        return {
+            "process_scans_total": self._snapshots.scan_count,
+            "process_scan_seconds_total": self._snapshots.scan_seconds_total,
+            "poll_interval_seconds": monitor["poll_interval_seconds"],
+            "trigger_transitions_total": monitor["transitions"],
+            "iracing_running": iracing_running,
+            "managed_apps": managed,
+            "launches_total": counters.get("launches", 0),
+            "launch_failures_total": counters.get("launch_failures", 0),
+            "crashes_total": counters.get("crashes", 0),
+            "restarts_total": counters.get("restarts", 0),
+            "terminations_total": {
+                key[len("terminations_"):]: n
+                for key, n in counters.items() if key.startswith("terminations_")
+            },
+        }
+
+    def get_termination_stats(self) -> dict[str, dict]:
+        with self._lock:
+            return {k: dict(v) for k, v in self._termination_stats.items()}
+
+    def _terminate(
+        self, running: RunningApp, *, deadline: float | None = None
+    ) -> TerminationResult:
         grace = float(running.app.shutdown_grace_seconds or 0.0)
+        timeout = 5.0
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+            if grace > remaining:
+                self._log_event(
+                    "stop", running.app.name,
+                    f"Grace period cut to {remaining:.1f}s of {grace:.1f}s (shutdown deadline)",
+                )
+                logger.info(
+                    "Grace period cut for %s: %.2fs of %.2fs", running.app.name, remaining, grace
+                )
+                grace = remaining
+            timeout = min(timeout, max(0.0, remaining - grace))
         if running.app.kill_process_tree:
-            graceful_terminate_process_tree(running.pid, grace)
-        else:
-            graceful_terminate_process(running.pid, grace)
+            return graceful_terminate_process_tree(running.pid, grace, timeout_seconds=timeout)
+        return graceful_terminate_process(running.pid, grace, timeout_seconds=timeout)
 
     def _find_app(self, app_id: str) -> ManagedApp | None:
         profile = self._get_active_profile()
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
 import logging
+import queue
 import threading
 import time
-from typing import Callable
+from typing import Any, Callable
 
-from ignition.core.process_utils import any_process_name_running
+from ignition.core.process_events import (
+    ProcessEvents,
+    ProcessEventSource,
+    create_process_event_source,
+)
+from ignition.core.poll_scheduler import AdaptivePollScheduler
+from ignition.core.process_utils import ProcessSnapshotService, shared_process_snapshots
+from ignition.core.resource_governor import ResourceGovernor
 
 
 logger = logging.getLogger(__name__)
 
+UI_PROCESS_NAME = "iRacingUI.exe"
+SIM_PROCESS_NAME = "iRacingSim64DX11.exe"
+
 
 class IRacingMonitor:
     def __init__(
@@ -19,38 +30,124 @@ class IRacingMonitor:
         get_poll_interval_seconds: Callable[[], float],
         on_iracing_started: Callable[[], None],
         on_iracing_stopped: Callable[[], None],
+        on_armed: Callable[[], None] | None = None,
+        on_sim_changed: Callable[[bool], None] | None = None,
+        snapshots: ProcessSnapshotService | None = None,
+        event_source_factory: Callable[[], ProcessEventSource] = create_process_event_source,
+        scheduler: AdaptivePollScheduler | None = None,
+        governor: ResourceGovernor | None = None,
     ) -> None:
         self._get_trigger_process_names = get_trigger_process_names
         self._get_poll_interval_seconds = get_poll_interval_seconds
         self._on_iracing_started = on_iracing_started
         self._on_iracing_stopped = on_iracing_stopped
+        self._on_armed = on_armed  # runs on the monitor thread; must return quickly
+        self._on_sim_changed = on_sim_changed  # the sim itself appearing / exiting
+        self._snapshots = snapshots or shared_process_snapshots()
+        self._event_source_factory = event_source_factory
+        self._events: ProcessEventSource | None = None
+        self._scheduler = scheduler or AdaptivePollScheduler()
+        self._governor = governor  # stretches the interval while over the CPU budget
 
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
         self._was_running = False
+        self._was_armed = False
+        self._was_sim = False
+        # Sim transitions go through one thread so handlers see them in order.
+        self._sim_changes: queue.SimpleQueue[bool | None] = queue.SimpleQueue()
+        self._sim_thread: threading.Thread | None = None
+
+    @property
+    def event_source_name(self) -> str | None:
+        events = self._events
+        return events.name if events is not None else None
+
+    def get_stats(self) -> dict[str, Any]:
+        stats = self._scheduler.stats()
+        stats["event_source"] = self.event_source_name
+        return stats
 
     def start(self) -> None:
         if self._thread is not None:
             return
         self._stop_event.clear()
+        try:
+            self._events = self._event_source_factory()
+        except Exception:
+            logger.exception("Process event source failed to start; polling instead")
+            self._events = ProcessEventSource()
+        logger.info("Process event source: %s", self._events.name)
+        if self._on_sim_changed is not None:
+            self._sim_changes = queue.SimpleQueue()
+            self._sim_thread = threading.Thread(
+                target=self._dispatch_sim_changes,
+                args=(self._sim_changes,),
+                name="iracing-sim",
+                daemon=True,
+            )
+            self._sim_thread.start()
         self._thread = threading.Thread(target=self._run, name="iracing-monitor", daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._stop_event.set()
-        if self._thread is None:
-            return
-        self._thread.join(timeout=3.0)
-        self._thread = None
+        if self._events is not None:
+            self._events.wake()
+        if self._thread is not None:
+            self._thread.join(timeout=3.0)
+            self._thread = None
+        if self._sim_thread is not None:
+            self._sim_changes.put(None)  # after anything the loop queued
+            self._sim_thread.join(timeout=3.0)
+            self._sim_thread = None
+
+    def _dispatch_sim_changes(self, changes: queue.SimpleQueue[bool | None]) -> None:
+        while (running := changes.get()) is not None:
+            try:
+                self._on_sim_changed(running)
+            except Exception:
+                logger.exception("on_sim_changed handler failed")
 
     def _run(self) -> None:
+        events = self._events or ProcessEventSource()
+        try:
+            self._loop(events)
+        finally:
+            events.close()
+
+    def _loop(self, events: ProcessEventSource) -> None:
+        woke: ProcessEvents | None = None
         while not self._stop_event.is_set():
+            base = self._poll_interval()
+            names = self._get_trigger_process_names()
+            pids: list[int] = []
+            sim_pids: list[int] = []
+            armed = False
+            scan_started = time.monotonic()
             try:
-                running = any_process_name_running(self._get_trigger_process_names())
+                if woke is not None:
+                    self._snapshots.invalidate(woke.started | woke.exited)
+                # Half an interval keeps detection latency bounded while still letting
+                # other readers (status push, wait_for_process) share this walk.
+                snapshot = self._snapshots.get(
+                    max_age_seconds=self._scheduler.current_interval / 2
+                )
+                exited = woke.exited if woke is not None else set()
+                pids = [p for p in snapshot.pids_for_names(names) if p not in exited]
+                running = bool(pids)
+                armed = bool(names) and not running and snapshot.any_name_running([UI_PROCESS_NAME])
+                if self._on_sim_changed is not None:
+                    sim_pids = [
+                        p for p in snapshot.pids_for_names([SIM_PROCESS_NAME]) if p not in exited
+                    ]
             except Exception:
                 logger.exception("Process scan failed")
                 running = False
+            self._scheduler.record_scan(time.monotonic() - scan_started)
 
+            if running != self._was_running:
+                self._scheduler.record_transition()
             if running and not self._was_running:
                 self._was_running = True
                 try:
@@ -72,8 +169,32 @@ class IRacingMonitor:
                 except Exception:
                     logger.exception("on_iracing_stopped handler failed")
 
-            try:
-                interval = float(self._get_poll_interval_seconds())
-            except Exception:
-                interval = 1.0
-            time.sleep(max(0.25, interval))
+            if armed and not self._was_armed and self._on_armed is not None:
+                try:
+                    self._on_armed()
+                except Exception:
+                    logger.exception("on_armed handler failed")
+            self._was_armed = armed
+
+            sim = bool(sim_pids)
+            if sim != self._was_sim and self._on_sim_changed is not None:
+                self._was_sim = sim
+                self._sim_changes.put(sim)
+
+            if self._on_sim_changed is not None:
+                events.watch(
+                    names=[*names, SIM_PROCESS_NAME], pids=sorted({*pids, *sim_pids})
+                )
+            else:
+                events.watch(names=names, pids=pids)
+            interval = self._scheduler.next_interval(base, armed=armed)
+            if self._governor is not None:
+                interval = self._governor.stretch(interval)
+            woke = events.wait(interval)
+
+    def _poll_interval(self) -> float:
+        try:
+            interval = float(self._get_poll_interval_seconds())
+        except Exception:
+            interval = 1.0
+        return max(0.25, interval)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.wintypes
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from ignition.core.process_utils import ProcessSnapshotService
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the fixed latency buckets; one more bucket catches the rest.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000, 60_000,
+)
+
+# Launch phases, in the order they happen.
+PHASE_DELAY_ELAPSED = "delay_elapsed"    # start_delay_seconds (and dependencies) passed
+PHASE_WAIT_SATISFIED = "wait_satisfied"  # wait_for_process found (or none configured)
+PHASE_SPAWNED = "spawned"                # Popen returned
+PHASE_VISIBLE = "visible"                # first window (Windows) or child process seen
+PHASES = (PHASE_DELAY_ELAPSED, PHASE_WAIT_SATISFIED, PHASE_SPAWNED, PHASE_VISIBLE)
+
+
+class LatencyHistogram:
+    __slots__ = ("bounds", "counts", "count", "sum_ms", "max_ms")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        i = 0
+        while i < len(self.bounds) and ms > self.bounds[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q`` quantile (max for the overflow bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return float(self.bounds[i]) if i < len(self.bounds) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.sum_ms / self.count, 1) if self.count else None,
+            "max_ms": round(self.max_ms, 1),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "buckets": [
+                {"le_ms": b, "count": c}
+                for b, c in zip([*self.bounds, None], self.counts)
+            ],
+        }
+
+
+@dataclass
+class LaunchTimeline:
+    """Monotonic timestamps of one app's launch, relative to the session trigger."""
+
+    app_id: str
+    name: str
+    profile_id: str
+    trigger_at: float
+    delay_elapsed_at: float | None = None
+    wait_satisfied_at: float | None = None
+    spawned_at: float | None = None
+    visible_at: float | None = None
+
+    def mark(self, phase: str, at: float | None = None) -> None:
+        setattr(self, f"{phase}_at", time.monotonic() if at is None else at)
+
+    def phases_ms(self) -> dict[str, float | None]:
+        out: dict[str, float | None] = {}
+        for phase in PHASES:
+            at = getattr(self, f"{phase}_at")
+            out[phase] = None if at is None else round((at - self.trigger_at) * 1000.0, 1)
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"app_id": self.app_id, "name": self.name, "phases_ms": self.phases_ms()}
+
+
+class LaunchMetrics:
+    """Per-phase latency histograms, per app and per profile."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._apps: dict[str, dict[str, LatencyHistogram]] = {}
+        self._profiles: dict[str, dict[str, LatencyHistogram]] = {}
+        self._names: dict[str, str] = {}
+
+    def record(self, timeline: LaunchTimeline) -> None:
+        phases = timeline.phases_ms()
+        with self._lock:
+            self._names[timeline.app_id] = timeline.name
+            for scope, key in ((self._apps, timeline.app_id), (self._profiles, timeline.profile_id)):
+                hists = scope.setdefault(key, {})
+                for phase, ms in phases.items():
+                    if ms is not None:
+                        hists.setdefault(phase, LatencyHistogram()).observe(ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "buckets_ms": list(LATENCY_BUCKETS_MS),
+                "apps": {
+                    app_id: {
+                        "name": self._names.get(app_id, ""),
+                        "phases": {p: h.to_dict() for p, h in hists.items()},
+                    }
+                    for app_id, hists in self._apps.items()
+                },
+                "profiles": {
+                    profile_id: {p: h.to_dict() for p, h in hists.items()}
+                    for profile_id, hists in self._profiles.items()
+                },
+            }
+
+
+def _visible_window_pids() -> set[int]:
+    """Owner PIDs of every visible top-level window, from one ``EnumWindows`` pass."""
+    user32 = ctypes.windll.user32
+    owners: set[int] = set()
+
+    def _callback(hwnd: int, _: int) -> bool:
+        if user32.IsWindowVisible(hwnd):
+            owner = ctypes.wintypes.DWORD(0)
+            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(owner))
+            owners.add(owner.value)
+        return True
+
+    WNDENUMPROC = ctypes.WINFUNCTYPE(
+        ctypes.c_bool, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM
+    )
+    user32.EnumWindows(WNDENUMPROC(_callback), 0)
+    return owners
+
+
+@dataclass
+class _Watch:
+    pid: int
+    on_visible: Callable[[float | None], None]
+    started: float
+    deadline: float
+
+
+class FirstVisibleWatcher:
+    """Reports when launched apps first show a window (Windows) or a child process.
+
+    One thread serves every launch: each ``interval_seconds`` (stretched while
+    over the CPU budget) it reads children from the shared process snapshot
+    and, on Windows, enumerates top-level windows once for all watched apps.
+    """
+
+    def __init__(
+        self,
+        *,
+        snapshots: ProcessSnapshotService,
+        interval_seconds: float = 0.25,
+        timeout_seconds: float = 30.0,
+        stretch: Callable[[float], float] = lambda seconds: seconds,
+    ) -> None:
+        self._snapshots = snapshots
+        self._interval = interval_seconds
+        self._timeout = timeout_seconds
+        self._stretch = stretch
+        self._lock = threading.Lock()
+        self._watches: list[_Watch] = []
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def watch(self, pid: int, on_visible: Callable[[float | None], None]) -> None:
+        """Call ``on_visible(monotonic_time)`` once ``pid`` is visible.
+
+        ``on_visible(None)`` if that doesn't happen before the timeout or the
+        process exits first.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._watches.append(_Watch(pid, on_visible, now, now + self._timeout))
+            if self._thread is None:
+                self._stop_event.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="launch-visible", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=3.0)
+
+    def scan_once(self) -> bool:
+        """Settle what can be settled; returns whether anything is still watched."""
+        with self._lock:
+            watches = list(self._watches)
+        if not watches:
+            return False
+        snapshot = self._snapshots.get(max_age_seconds=self._interval)
+        now = time.monotonic()
+        live = {e.pid for e in snapshot.entries}
+        windows = _visible_window_pids() if os.name == "nt" else set()
+        done: list[tuple[_Watch, float | None]] = []
+        for watch in watches:
+            if snapshot.taken_at < watch.started:
+                continue  # taken before the launch; can't tell anything yet
+            if watch.pid not in live:
+                done.append((watch, None))
+                continue
+            children = snapshot.descendants(watch.pid)
+            if os.name == "nt":
+                visible = not windows.isdisjoint({watch.pid, *children})
+            else:
+                visible = bool(children)
+            if visible:
+                done.append((watch, now))
+            elif now >= watch.deadline:
+                done.append((watch, None))
+        with self._lock:
+            for watch, _ in done:
+                self._watches.remove(watch)
+            remaining = bool(self._watches)
+        for watch, at in done:
+            watch.on_visible(at)
+        return remaining
+
+    def _run(self) -> None:
+        while True:
+            try:
+                remaining = self.scan_once()
+            except Exception:
+                logger.exception("Launch visibility scan failed")
+                remaining = True
+            with self._lock:
+                if not remaining and not self._watches:
+                    self._thread = None
+                    return
+            if self._stop_event.wait(self._stretch(self._interval)):
+                return
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import ntpath
+from dataclasses import dataclass
+from typing import Any
+
+from ignition.core.models import ManagedApp
+
+
+@dataclass(frozen=True)
+class LaunchStep:
+    app: ManagedApp
+    offset_seconds: float
+    depends_on: tuple[str, ...]
+    level: int
+    earliest_start_seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "app_id": self.app.app_id,
+            "name": self.app.name,
+            "offset_seconds": self.offset_seconds,
+            "depends_on": list(self.depends_on),
+            "waits_for": self.app.wait_for_process,
+            "level": self.level,
+            "earliest_start_seconds": self.earliest_start_seconds,
+        }
+
+
+@dataclass(frozen=True)
+class LaunchPlan:
+    steps: tuple[LaunchStep, ...]
+    disabled: tuple[ManagedApp, ...] = ()
+
+    def step(self, app_id: str) -> LaunchStep | None:
+        return next((s for s in self.steps if s.app.app_id == app_id), None)
+
+    def levels(self) -> list[list[LaunchStep]]:
+        out: list[list[LaunchStep]] = []
+        for step in self.steps:
+            while len(out) <= step.level:
+                out.append([])
+            out[step.level].append(step)
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "steps": [s.to_dict() for s in self.steps],
+            "disabled": [{"app_id": a.app_id, "name": a.name} for a in self.disabled],
+        }
+
+
+def _exe_name(app: ManagedApp) -> str:
+    return ntpath.basename(app.executable_path.strip()).lower()
+
+
+def build_launch_plan(apps: list[ManagedApp], *, include_disabled: bool = False) -> LaunchPlan:
+    """Turn a profile's app list into a dependency graph.
+
+    An app whose ``wait_for_process`` names the executable of an app listed
+    *before* it depends on that app; list order keeps the graph acyclic.
+    Waits for anything else (e.g. iRacingSim64DX11.exe) stay inside the app's
+    own branch. ``start_delay_seconds`` is an offset from session start, not
+    from the previous app, so independent branches start side by side.
+    ``include_disabled`` keeps disabled apps in the graph, for stopping apps
+    that were switched off while running.
+    """
+    steps: list[LaunchStep] = []
+    disabled: list[ManagedApp] = []
+    providers: dict[str, list[LaunchStep]] = {}
+
+    for app in apps:
+        if not app.enabled and not include_disabled:
+            disabled.append(app)
+            continue
+        wanted = app.wait_for_process.strip().lower()
+        deps = providers.get(wanted, []) if wanted else []
+        offset = max(0.0, float(app.start_delay_seconds or 0.0))
+        step = LaunchStep(
+            app=app,
+            offset_seconds=offset,
+            depends_on=tuple(d.app.app_id for d in deps),
+            level=1 + max((d.level for d in deps), default=-1),
+            earliest_start_seconds=max([offset, *(d.earliest_start_seconds for d in deps)]),
+        )
+        steps.append(step)
+        providers.setdefault(_exe_name(app), []).append(step)
+
+    return LaunchPlan(steps=tuple(steps), disabled=tuple(disabled))
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+import shlex
+import stat
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from ignition.core.models import ManagedApp
+
+_PREFETCH_CHUNK = 1 << 20
+_PREFETCH_LIMIT = 256 << 20
+
+
+@dataclass(frozen=True)
+class LaunchSpec:
+    """Everything ``spawn_launch_spec`` needs, worked out ahead of the session."""
+
+    app_id: str
+    fingerprint: tuple[Any, ...]
+    args: tuple[str, ...]
+    cwd: str
+    start_minimized: bool
+    exe_mtime: float | None  # None when the executable could not be stat'ed
+    problems: tuple[str, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "app_id": self.app_id,
+            "args": list(self.args),
+            "cwd": self.cwd,
+            "start_minimized": self.start_minimized,
+            "problems": list(self.problems),
+        }
+
+
+def app_fingerprint(app: ManagedApp) -> tuple[Any, ...]:
+    """The ManagedApp fields a launch spec is compiled from."""
+    return (app.executable_path, app.arguments, app.working_directory, app.start_minimized)
+
+
+def _exe_mtime(path: str) -> float | None:
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return st.st_mtime if stat.S_ISREG(st.st_mode) else None
+
+
+def compile_launch_spec(app: ManagedApp) -> LaunchSpec:
+    exe = app.executable_path
+    problems: list[str] = []
+
+    mtime = _exe_mtime(exe) if exe else None
+    if not exe:
+        problems.append("Executable path is required")
+    elif mtime is None:
+        problems.append(f"Executable not found: {exe}")
+
+    args = [exe]
+    if app.arguments.strip():
+        try:
+            args.extend(shlex.split(app.arguments, posix=False))
+        except ValueError as exc:
+            problems.append(f"Invalid arguments: {exc}")
+
+    cwd = app.working_directory.strip() or str(Path(exe).parent)
+    if app.working_directory.strip() and not os.path.isdir(cwd):
+        problems.append(f"Working directory not found: {cwd}")
+
+    return LaunchSpec(
+        app_id=app.app_id,
+        fingerprint=app_fingerprint(app),
+        args=tuple(args),
+        cwd=cwd,
+        start_minimized=app.start_minimized,
+        exe_mtime=mtime,
+        problems=tuple(problems),
+    )
+
+
+def prefetch_executable(path: str) -> int:
+    """Read ``path`` once so its pages are in the OS file cache at launch; returns bytes read."""
+    total = 0
+    try:
+        with open(path, "rb", buffering=0) as fh:
+            while total < _PREFETCH_LIMIT:
+                chunk = fh.read(_PREFETCH_CHUNK)
+                if not chunk:
+                    break
+                total += len(chunk)
+    except OSError:
+        pass
+    return total
+
+
+class LaunchSpecCache:
+    """Compiled launch specs per app, recompiled when the app is edited or its exe changes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._specs: dict[str, LaunchSpec] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, app: ManagedApp) -> LaunchSpec:
+        """The cached spec, if still current; costs one ``stat`` of the executable."""
+        with self._lock:
+            spec = self._specs.get(app.app_id)
+        if (
+            spec is not None
+            and spec.fingerprint == app_fingerprint(app)
+            and spec.exe_mtime is not None
+            and spec.exe_mtime == _exe_mtime(app.executable_path)
+        ):
+            self.hits += 1
+            return spec
+        self.misses += 1
+        return self.refresh(app)
+
+    def refresh(self, app: ManagedApp) -> LaunchSpec:
+        spec = compile_launch_spec(app)
+        with self._lock:
+            self._specs[app.app_id] = spec
+        return spec
+
+    def retain(self, app_ids: Iterable[str]) -> None:
+        """Drop specs for apps that no longer exist."""
+        keep = set(app_ids)
+        with self._lock:
+            for app_id in [a for a in self._specs if a not in keep]:
+                del self._specs[app_id]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            size = len(self._specs)
+        return {"size": size, "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable
+
+import psutil
+
+from ignition.core.storage import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# name -> (type, help); values come from IgnitionController.get_metrics()
+_CONTROLLER_METRICS: dict[str, tuple[str, str]] = {
+    "process_scans_total": ("counter", "Process table scans performed."),
+    "process_scan_seconds_total": ("counter", "Time spent scanning the process table."),
+    "poll_interval_seconds": ("gauge", "Current monitor poll interval."),
+    "trigger_transitions_total": ("counter", "iRacing start/stop transitions seen."),
+    "iracing_running": ("gauge", "1 while the trigger process is running."),
+    "managed_apps": ("gauge", "Managed apps currently running."),
+    "launches_total": ("counter", "Apps launched."),
+    "launch_failures_total": ("counter", "App launches that failed."),
+    "crashes_total": ("counter", "Managed apps that exited unexpectedly during a session."),
+    "restarts_total": ("counter", "Crash restarts attempted."),
+}
+
+_SELF_METRICS: dict[str, tuple[str, str]] = {
+    "process_threads": ("gauge", "Threads in the iGnition process."),
+    "process_resident_memory_bytes": ("gauge", "Resident memory of the iGnition process."),
+    "process_cpu_seconds_total": ("counter", "CPU time used by the iGnition process."),
+}
+
+
+def _self_metrics() -> dict[str, float]:
+    proc = psutil.Process(os.getpid())
+    with proc.oneshot():
+        cpu = proc.cpu_times()
+        return {
+            "process_threads": float(proc.num_threads()),
+            "process_resident_memory_bytes": float(proc.memory_info().rss),
+            "process_cpu_seconds_total": float(cpu.user + cpu.system),
+        }
+
+
+def _fmt(value: Any) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def render_metrics(metrics: dict[str, Any], *, prefix: str = "ignition_") -> str:
+    """Prometheus text exposition of controller metrics plus this process's own usage."""
+    lines: list[str] = []
+
+    def emit(name: str, kind: str, help_text: str, samples: list[tuple[str, Any]]) -> None:
+        lines.append(f"# HELP {prefix}{name} {help_text}")
+        lines.append(f"# TYPE {prefix}{name} {kind}")
+        lines.extend(f"{prefix}{name}{labels} {_fmt(v)}" for labels, v in samples)
+
+    for name, (kind, help_text) in _CONTROLLER_METRICS.items():
+        if name in metrics:
+            emit(name, kind, help_text, [("", metrics[name])])
+    outcomes = metrics.get("terminations_total") or {}
+    emit(
+        "terminations_total", "counter", "App terminations by outcome.",
+        [(f'{{outcome="{k}"}}', v) for k, v in sorted(outcomes.items())],
+    )
+    try:
+        own = _self_metrics()
+    except psutil.Error:
+        own = {}
+    for name, (kind, help_text) in _SELF_METRICS.items():
+        emit(name, kind, help_text, [("", own[name])] if name in own else [])
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves ``/metrics`` on a loopback port from a daemon thread.
+
+    ``port=0`` picks a free port; read it back from ``port`` after ``start``.
+    """
+
+    def __init__(
+        self,
+        get_metrics: Callable[[], dict[str, Any]],
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self._get_metrics = get_metrics
+        self._host = host
+        self._port = port
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1] if self._server is not None else self._port
+
+    def start(self) -> None:
+        if self._server is not None:
+            return
+        get_metrics = self._get_metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                try:
+                    body = render_metrics(get_metrics()).encode("utf-8")
+                except Exception:
+                    logger.exception("Rendering metrics failed")
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("metrics: " + format, *args)
+
+        self._server = ThreadingHTTPServer((self._host, self._port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-http", daemon=True
+        )
+        self._thread.start()
+        logger.info("Metrics on http://%s:%s/metrics", self._host, self.port)
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=3.0)
+            self._thread = None
+
+
+class MetricsFileWriter:
+    """Rewrites ``path`` with the current metrics every ``interval_seconds``."""
+
+    def __init__(
+        self,
+        get_metrics: Callable[[], dict[str, Any]],
+        path: Path,
+        *,
+        interval_seconds: float = 15.0,
+    ) -> None:
+        self._get_metrics = get_metrics
+        self._path = path
+        self._interval = max(0.1, float(interval_seconds))
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def write_once(self) -> None:
+        atomic_write_text(self._path, render_metrics(self._get_metrics()), encoding="utf-8")
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-file", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=3.0)
+            self._thread = None
+        try:
+            self.write_once()
+        except Exception:
+            logger.exception("Writing metrics file failed")
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.write_once()
+            except Exception:
+                logger.exception("Writing metrics file failed")
+            if self._stop_event.wait(self._interval):
+                return
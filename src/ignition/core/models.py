@@ -2,6 +2,23 @@ from dataclasses import dataclass, field
 from typing import Any
 from uuid import uuid4
 
+from ignition.core.tuning_policy import IO_PRIORITY_LEVELS, normalize_priority, parse_cpu_list
+
+
+def _cpu_list(raw: Any) -> list[int]:
+    """CPU indices from a list or a ``"4-7,9"`` string; anything unparsable means all cores."""
+    if isinstance(raw, str):
+        try:
+            return parse_cpu_list(raw)
+        except ValueError:
+            return []
+    if isinstance(raw, list):
+        try:
+            return sorted({int(x) for x in raw if int(x) >= 0})
+        except (TypeError, ValueError):
+            return []
+    return []
+
 
 @dataclass
 class ManagedApp:
@@ -21,6 +38,10 @@ class ManagedApp:
     enabled: bool = True
     wait_for_process: str = ""
     wait_timeout_seconds: float = 30.0
+    priority: str = ""  # "" = unchanged, one of PRIORITY_LEVELS, or a nice value
+    cpu_affinity: list[int] = field(default_factory=list)  # cores to run on; empty = all
+    io_priority: str = ""  # "" = unchanged | very_low | low | normal | high
+    suspend_while_driving: bool = False  # frozen while the sim runs, thawed back in the UI
 
     @classmethod
     def create(cls, *, name: str, executable_path: str) -> "ManagedApp":
@@ -44,6 +65,10 @@ class ManagedApp:
             "enabled": self.enabled,
             "wait_for_process": self.wait_for_process,
             "wait_timeout_seconds": self.wait_timeout_seconds,
+            "priority": self.priority,
+            "cpu_affinity": list(self.cpu_affinity),
+            "io_priority": self.io_priority,
+            "suspend_while_driving": self.suspend_while_driving,
         }
 
     @classmethod
@@ -65,6 +90,37 @@ class ManagedApp:
             enabled=bool(raw.get("enabled", True)),
             wait_for_process=str(raw.get("wait_for_process") or ""),
             wait_timeout_seconds=float(raw.get("wait_timeout_seconds") or 30.0),
+            priority=normalize_priority(raw.get("priority")),
+            cpu_affinity=_cpu_list(raw.get("cpu_affinity")),
+            io_priority=(
+                str(raw.get("io_priority") or "")
+                if raw.get("io_priority") in IO_PRIORITY_LEVELS else ""
+            ),
+            suspend_while_driving=bool(raw.get("suspend_while_driving") or False),
+        )
+
+
+@dataclass
+class TriggerProcessPolicy:
+    """How a profile tunes the trigger process (the sim) for the length of a session."""
+
+    enabled: bool = False
+    priority: str = "above_normal"  # one of PRIORITY_LEVELS or a nice value
+    reserved_cores: list[int] = field(default_factory=list)  # sim pinned here, companions kept off
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "priority": self.priority,
+            "reserved_cores": list(self.reserved_cores),
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> "TriggerProcessPolicy":
+        return cls(
+            enabled=bool(raw.get("enabled") or False),
+            priority=normalize_priority(raw.get("priority", "above_normal")),
+            reserved_cores=_cpu_list(raw.get("reserved_cores")),
         )
 
 
@@ -77,6 +133,7 @@ class Profile:
     apps: list[ManagedApp] = field(default_factory=list)
     color: str = ""
     trigger_mode: str = ""  # "" = inherit global | "ui" | "race" | "custom"
+    trigger_policy: TriggerProcessPolicy = field(default_factory=TriggerProcessPolicy)
 
     @classmethod
     def create_default(cls) -> "Profile":
@@ -97,6 +154,7 @@ class Profile:
             "apps": [a.to_dict() for a in self.apps],
             "color": self.color,
             "trigger_mode": self.trigger_mode,
+            "trigger_policy": self.trigger_policy.to_dict(),
         }
 
     @classmethod
@@ -110,6 +168,9 @@ class Profile:
             apps=[ManagedApp.from_dict(x) for x in apps_raw if isinstance(x, dict)],
             color=str(raw.get("color") or ""),
             trigger_mode=str(raw.get("trigger_mode") or ""),
+            trigger_policy=TriggerProcessPolicy.from_dict(
+                raw.get("trigger_policy") if isinstance(raw.get("trigger_policy"), dict) else {}
+            ),
         )
 
 
@@ -123,6 +184,10 @@ class AppConfig:
     iracing_exe_path: str = ""
     trigger_mode: str = "ui"  # "ui" = iRacingUI.exe, "race" = iRacingSim64DX11.exe
     notification_mode: str = "always"  # "always" | "never"
+    shutdown_timeout_seconds: float = 10.0  # overall budget for stopping all apps on quit
+    prefetch_executables: bool = False  # warm the OS file cache with app executables
+    activity_log_capacity: int = 200  # entries kept in the in-memory activity log
+    cpu_budget_percent: float = 0.0  # own CPU cap (% of one core) during a session; 0 = off
 
     @classmethod
     def default(cls) -> "AppConfig":
@@ -147,6 +212,10 @@ class AppConfig:
             "iracing_exe_path": self.iracing_exe_path,
             "trigger_mode": self.trigger_mode,
             "notification_mode": self.notification_mode,
+            "shutdown_timeout_seconds": self.shutdown_timeout_seconds,
+            "prefetch_executables": self.prefetch_executables,
+            "activity_log_capacity": self.activity_log_capacity,
+            "cpu_budget_percent": self.cpu_budget_percent,
         }
 
     @classmethod
@@ -168,4 +237,8 @@ class AppConfig:
             iracing_exe_path=str(raw.get("iracing_exe_path") or ""),
             trigger_mode=str(raw.get("trigger_mode") or "ui"),
             notification_mode=str(raw.get("notification_mode") or "always"),
+            shutdown_timeout_seconds=float(raw.get("shutdown_timeout_seconds") or 10.0),
+            prefetch_executables=bool(raw.get("prefetch_executables") or False),
+            activity_log_capacity=max(1, int(raw.get("activity_log_capacity") or 200)),
+            cpu_budget_percent=max(0.0, float(raw.get("cpu_budget_percent") or 0.0)),
         )
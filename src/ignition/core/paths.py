@@ -17,6 +17,14 @@ class AppPaths:
     def session_history_file(self) -> Path:
         return self.config_dir / "session_history.json"
 
+    @property
+    def session_history_db(self) -> Path:
+        return self.config_dir / "session_history.sqlite3"
+
+    @property
+    def session_stats_file(self) -> Path:
+        return self.config_dir / "session_stats.json"
+
     @classmethod
     def default(cls) -> "AppPaths":
         dirs = PlatformDirs(appname="iGnition", appauthor=False)
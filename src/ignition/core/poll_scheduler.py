@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable
+
+
+class AdaptivePollScheduler:
+    """Chooses the monitor's next poll interval from recent activity.
+
+    - right after a start/stop transition, or while the sim is "armed"
+      (iRacingUI.exe up but the trigger not yet), poll at ``fast_interval``;
+    - after ``idle_after_seconds`` without a transition, back off to
+      ``base * idle_multiplier`` (capped at ``max_interval``);
+    - otherwise use the configured base interval.
+    """
+
+    def __init__(
+        self,
+        *,
+        fast_interval: float = 0.25,
+        fast_window_seconds: float = 120.0,
+        idle_after_seconds: float = 600.0,
+        idle_multiplier: float = 5.0,
+        max_interval: float = 10.0,
+        history_size: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.fast_interval = fast_interval
+        self.fast_window_seconds = fast_window_seconds
+        self.idle_after_seconds = idle_after_seconds
+        self.idle_multiplier = idle_multiplier
+        self.max_interval = max_interval
+        self._clock = clock
+        self._last_transition = clock()
+        self._had_transition = False
+        self.transition_count = 0
+        self._scan_costs: deque[float] = deque(maxlen=max(1, history_size))
+        self.current_interval = 0.0
+        self.mode = "normal"
+
+    def record_transition(self) -> None:
+        self._last_transition = self._clock()
+        self._had_transition = True
+        self.transition_count += 1
+
+    def record_scan(self, seconds: float) -> None:
+        self._scan_costs.append(max(0.0, seconds))
+
+    def recent_scan_costs(self) -> list[float]:
+        return list(self._scan_costs)
+
+    def next_interval(self, base: float, *, armed: bool = False) -> float:
+        since = self._clock() - self._last_transition
+        if armed or (self._had_transition and since < self.fast_window_seconds):
+            interval, mode = min(base, self.fast_interval), "fast"
+        elif since >= self.idle_after_seconds:
+            interval, mode = max(base, min(base * self.idle_multiplier, self.max_interval)), "idle"
+        else:
+            interval, mode = base, "normal"
+        self.current_interval = interval
+        self.mode = mode
+        return interval
+
+    def stats(self) -> dict:
+        costs = self.recent_scan_costs()
+        return {
+            "poll_interval_seconds": self.current_interval,
+            "poll_mode": self.mode,
+            "recent_scan_ms": [round(c * 1000.0, 3) for c in costs],
+            "avg_scan_ms": round(sum(costs) / len(costs) * 1000.0, 3) if costs else 0.0,
+            "transitions": self.transition_count,
+        }
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import logging
+import os
+import select
+import socket
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import psutil
+
+
+logger = logging.getLogger(__name__)
+
+_IS_LINUX = sys.platform.startswith("linux")
+
+# linux/connector.h, linux/cn_proc.h
+_NETLINK_CONNECTOR = 11
+_CN_IDX_PROC = 1
+_CN_VAL_PROC = 1
+_PROC_CN_MCAST_LISTEN = 1
+_PROC_CN_MCAST_IGNORE = 2
+_PROC_EVENT_EXEC = 0x00000002
+_PROC_EVENT_COMM = 0x00000200
+_PROC_EVENT_EXIT = 0x80000000
+_NLMSG_DONE = 3
+_NLMSG_HDR = struct.Struct("=IHHII")
+_CN_MSG_HDR = struct.Struct("=IIIIHH")
+_PROC_EVENT_HDR = struct.Struct("=IIQ")
+_PID_TGID = struct.Struct("=ii")
+
+
+@dataclass
+class ProcessEvents:
+    started: set[int] = field(default_factory=set)
+    exited: set[int] = field(default_factory=set)
+
+
+class ProcessEventSource:
+    """Tells the monitor when a rescan is worth doing.
+
+    ``watch`` declares which process names and PIDs are interesting; ``wait``
+    blocks until one of them may have started or exited, or the timeout
+    passes. The base class has no OS hooks, so it simply sleeps: that is the
+    polling fallback.
+    """
+
+    name = "polling"
+
+    def __init__(self) -> None:
+        self._wake_event = threading.Event()
+
+    def watch(self, *, names: Iterable[str], pids: Iterable[int]) -> None:
+        pass
+
+    def wait(self, timeout: float) -> ProcessEvents | None:
+        """Return the events that ended the wait, or None on timeout.
+
+        An empty ``ProcessEvents`` means "something changed, rescan".
+        """
+        if self._wake_event.wait(max(0.0, timeout)):
+            self._wake_event.clear()
+            return ProcessEvents()
+        return None
+
+    def wake(self) -> None:
+        self._wake_event.set()
+
+    def close(self) -> None:
+        self.wake()
+
+
+class _SelectEventSource(ProcessEventSource):
+    """Common plumbing for sources that block in ``select`` on file descriptors."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._names: set[str] = set()
+        self._pids: set[int] = set()
+        self._closed = False
+
+    def watch(self, *, names: Iterable[str], pids: Iterable[int]) -> None:
+        self._names = {n.strip().lower() for n in names if n.strip()}
+        self._pids = set(pids)
+
+    def wake(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _drain_wake(self) -> None:
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except OSError:
+            pass
+
+
+class PidfdEventSource(_SelectEventSource):
+    """Linux pidfd backend: exits of watched PIDs wake the waiter immediately.
+
+    Starts are still only found by the rescan at the end of each timeout.
+    """
+
+    name = "pidfd"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pidfds: dict[int, int] = {}
+
+    def watch(self, *, names: Iterable[str], pids: Iterable[int]) -> None:
+        super().watch(names=names, pids=pids)
+        for pid in set(self._pidfds) - self._pids:
+            os.close(self._pidfds.pop(pid))
+        for pid in self._pids - set(self._pidfds):
+            try:
+                self._pidfds[pid] = os.pidfd_open(pid)
+            except OSError:
+                continue
+
+    def wait(self, timeout: float) -> ProcessEvents | None:
+        fd_to_pid = {fd: pid for pid, fd in self._pidfds.items()}
+        try:
+            readable, _, _ = select.select([self._wake_r, *fd_to_pid], [], [], max(0.0, timeout))
+        except (OSError, ValueError):
+            return ProcessEvents()
+        if not readable:
+            return None
+        events = ProcessEvents()
+        for fd in readable:
+            if fd == self._wake_r:
+                self._drain_wake()
+                continue
+            pid = fd_to_pid[fd]
+            events.exited.add(pid)
+            os.close(self._pidfds.pop(pid))
+        return events
+
+    def close(self) -> None:
+        for fd in self._pidfds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._pidfds.clear()
+        super().close()
+
+
+class NetlinkEventSource(_SelectEventSource):
+    """Linux process-connector backend: exec, rename and exit are pushed by the kernel.
+
+    Needs CAP_NET_ADMIN; the constructor raises ``OSError`` without it.
+    """
+
+    name = "netlink"
+
+    def __init__(self) -> None:
+        super().__init__()
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, _NETLINK_CONNECTOR)
+        try:
+            sock.bind((os.getpid(), _CN_IDX_PROC))
+            sock.send(self._control_message(_PROC_CN_MCAST_LISTEN))
+        except OSError:
+            sock.close()
+            super().close()
+            raise
+        sock.setblocking(False)
+        self._sock = sock
+
+    @staticmethod
+    def _control_message(op: int) -> bytes:
+        payload = struct.pack("=I", op)
+        cn = _CN_MSG_HDR.pack(_CN_IDX_PROC, _CN_VAL_PROC, 0, 0, len(payload), 0) + payload
+        hdr = _NLMSG_HDR.pack(_NLMSG_HDR.size + len(cn), _NLMSG_DONE, 0, 0, os.getpid())
+        return hdr + cn
+
+    def wait(self, timeout: float) -> ProcessEvents | None:
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                readable, _, _ = select.select([self._wake_r, self._sock], [], [], remaining)
+            except (OSError, ValueError):
+                return ProcessEvents()
+            if self._wake_r in readable:
+                self._drain_wake()
+                return ProcessEvents()
+            if not readable:
+                return None
+            events = self._read_events()
+            if events is not None:
+                return events
+
+    def _read_events(self) -> ProcessEvents | None:
+        events = ProcessEvents()
+        overflow = False
+        while True:
+            try:
+                data = self._sock.recv(65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                # ENOBUFS: the kernel dropped events, so we can't trust our view.
+                overflow = True
+                break
+            self._parse(data, events)
+        if overflow or events.started or events.exited:
+            return events
+        return None
+
+    def _parse(self, data: bytes, events: ProcessEvents) -> None:
+        offset = 0
+        while offset + _NLMSG_HDR.size <= len(data):
+            msg_len = _NLMSG_HDR.unpack_from(data, offset)[0]
+            if msg_len < _NLMSG_HDR.size:
+                return
+            base = offset + _NLMSG_HDR.size + _CN_MSG_HDR.size
+            if base + _PROC_EVENT_HDR.size + _PID_TGID.size <= offset + msg_len:
+                what = _PROC_EVENT_HDR.unpack_from(data, base)[0]
+                pid, tgid = _PID_TGID.unpack_from(data, base + _PROC_EVENT_HDR.size)
+                if what in (_PROC_EVENT_EXEC, _PROC_EVENT_COMM):
+                    if pid == tgid and self._name_matches(tgid):
+                        events.started.add(tgid)
+                elif what == _PROC_EVENT_EXIT:
+                    if pid == tgid and tgid in self._pids:
+                        events.exited.add(tgid)
+            offset += (msg_len + 3) & ~3
+
+    def _name_matches(self, pid: int) -> bool:
+        if not self._names:
+            return False
+        try:
+            return psutil.Process(pid).name().lower() in self._names
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        try:
+            self._sock.setblocking(True)
+            self._sock.send(self._control_message(_PROC_CN_MCAST_IGNORE))
+        except OSError:
+            pass
+        self._sock.close()
+        super().close()
+
+
+def create_process_event_source() -> ProcessEventSource:
+    """Return the most responsive backend this platform and privilege level allow."""
+    if _IS_LINUX:
+        try:
+            return NetlinkEventSource()
+        except OSError as exc:
+            logger.info("Netlink process connector unavailable (%s); trying pidfd", exc)
+        if hasattr(os, "pidfd_open"):
+            try:
+                os.close(os.pidfd_open(os.getpid()))
+                return PidfdEventSource()
+            except OSError as exc:
+                logger.info("pidfd unavailable (%s); falling back to polling", exc)
+    return ProcessEventSource()
@@ -1,131 +1,227 @@
+from __future__ import annotations
+
 import ctypes
 import ctypes.wintypes
+import os
+import signal
 import time
+from dataclasses import dataclass
+from typing import Callable, Iterable
 
 import psutil
 
+# How a termination ended, mildest first.
+OUTCOME_GONE = "gone"              # already exited before we asked
+OUTCOME_GRACEFUL = "graceful"      # exited after the close request
+OUTCOME_TERMINATED = "terminated"  # exited after terminate()
+OUTCOME_KILLED = "killed"          # needed kill()
+
+# Phase in which an individual process exited.
+PHASE_CLOSE = "close"
+PHASE_TERMINATE = "terminate"
+PHASE_KILL = "kill"
+
+
+@dataclass(frozen=True)
+class ProcessExit:
+    pid: int
+    phase: str
+    seconds: float  # since the termination began
+
+
+@dataclass(frozen=True)
+class TerminationResult:
+    pid: int
+    exits: tuple[ProcessExit, ...]
+    duration_seconds: float
+    killed: bool
+
+    @property
+    def outcome(self) -> str:
+        phases = {e.phase for e in self.exits}
+        if self.killed or PHASE_KILL in phases:
+            return OUTCOME_KILLED
+        if PHASE_TERMINATE in phases:
+            return OUTCOME_TERMINATED
+        if PHASE_CLOSE in phases:
+            return OUTCOME_GRACEFUL
+        return OUTCOME_GONE
+
+    def close_phase_seconds(self) -> float | None:
+        """When the last process that honoured the close request exited."""
+        times = [e.seconds for e in self.exits if e.phase == PHASE_CLOSE]
+        return max(times) if times else None
+
+    def to_dict(self) -> dict:
+        return {
+            "pid": self.pid,
+            "outcome": self.outcome,
+            "killed": self.killed,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "exits": [
+                {"pid": e.pid, "phase": e.phase, "seconds": round(e.seconds, 3)}
+                for e in self.exits
+            ],
+        }
+
+
+def _request_close_windows(pids: set[int]) -> set[int]:
+    """One EnumWindows pass over the desktop, posting WM_CLOSE to every window owned by ``pids``.
+
+    PostMessageW only queues the message, so a hung window can't stall the others.
+    """
+    WM_CLOSE = 0x0010
+    user32 = ctypes.windll.user32
+    targets: list[tuple[int, int]] = []
+
+    def _callback(hwnd: int, _: int) -> bool:
+        buf = ctypes.wintypes.DWORD(0)
+        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(buf))
+        if buf.value in pids:
+            targets.append((hwnd, buf.value))
+        return True
+
+    WNDENUMPROC = ctypes.WINFUNCTYPE(
+        ctypes.c_bool, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM
+    )
+    user32.EnumWindows(WNDENUMPROC(_callback), 0)
+
+    sent: set[int] = set()
+    for hwnd, owner in targets:
+        if user32.PostMessageW(hwnd, WM_CLOSE, 0, 0):
+            sent.add(owner)
+    return sent
+
+
+def _request_close_posix(pids: set[int]) -> set[int]:
+    sent: set[int] = set()
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            continue
+        sent.add(pid)
+    return sent
 
-def _send_wm_close(pid: int) -> None:
-    try:
-        WM_CLOSE = 0x0010
-        SMTO_ABORTIFHUNG = 0x0002
-
-        def _callback(hwnd: int, _: int) -> bool:
-            buf = ctypes.wintypes.DWORD(0)
-            ctypes.windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(buf))
-            if buf.value == pid:
-                ctypes.windll.user32.SendMessageTimeoutW(
-                    hwnd, WM_CLOSE, 0, 0, SMTO_ABORTIFHUNG, 2000, None
-                )
-            return True
-
-        WNDENUMPROC = ctypes.WINFUNCTYPE(
-            ctypes.c_bool, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM
-        )
-        ctypes.windll.user32.EnumWindows(WNDENUMPROC(_callback), 0)
-    except Exception:
-        pass
 
+def request_close(pids: Iterable[int]) -> set[int]:
+    """Politely ask every process in ``pids`` to exit; returns the PIDs that were asked.
 
-def graceful_terminate_process(pid: int, grace_seconds: float) -> None:
-    if grace_seconds <= 0:
-        terminate_process(pid)
-        return
-    _send_wm_close(pid)
-    deadline = time.monotonic() + grace_seconds
+    Windows gets WM_CLOSE on each top-level window, POSIX gets SIGTERM.
+    Never blocks on the target processes.
+    """
+    wanted = {int(p) for p in pids}
+    if not wanted:
+        return set()
     try:
-        proc = psutil.Process(pid)
-        while time.monotonic() < deadline:
-            try:
-                if not proc.is_running() or proc.status() == psutil.STATUS_ZOMBIE:
-                    return
-            except psutil.NoSuchProcess:
-                return
-            time.sleep(0.3)
-    except psutil.NoSuchProcess:
-        return
-    terminate_process(pid)
+        if os.name == "nt":
+            return _request_close_windows(wanted)
+        return _request_close_posix(wanted)
+    except Exception:
+        return set()
 
 
-def graceful_terminate_process_tree(pid: int, grace_seconds: float) -> None:
-    if grace_seconds <= 0:
-        terminate_process_tree(pid)
-        return
+def _collect(pid: int, *, tree: bool) -> list[psutil.Process]:
     try:
         parent = psutil.Process(pid)
-        children = parent.children(recursive=True)
     except psutil.NoSuchProcess:
-        return
-    all_pids = [c.pid for c in children] + [pid]
-    for p in all_pids:
-        _send_wm_close(p)
-    deadline = time.monotonic() + grace_seconds
-    procs: list[psutil.Process] = []
-    for p in all_pids:
+        return []
+    children: list[psutil.Process] = []
+    if tree:
         try:
-            procs.append(psutil.Process(p))
-        except psutil.NoSuchProcess:
-            pass
-    while time.monotonic() < deadline and procs:
-        alive = []
-        for proc in procs:
+            children = parent.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            children = []
+    return [*children, parent]
+
+
+def _run_termination(
+    pid: int, procs: list[psutil.Process], grace_seconds: float, timeout_seconds: float
+) -> TerminationResult:
+    """Close → terminate → kill, moving on the moment every process in a phase has exited."""
+    started = time.monotonic()
+    exits: list[ProcessExit] = []
+
+    def recorder(phase: str) -> Callable[[psutil.Process], None]:
+        def on_exit(proc: psutil.Process) -> None:
+            exits.append(ProcessExit(pid=proc.pid, phase=phase, seconds=time.monotonic() - started))
+        return on_exit
+
+    alive = procs
+    if alive and grace_seconds > 0:
+        request_close(p.pid for p in alive)
+        _, alive = psutil.wait_procs(alive, timeout=grace_seconds, callback=recorder(PHASE_CLOSE))
+
+    if alive:
+        for proc in alive:
             try:
-                if proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE:
-                    alive.append(proc)
-            except psutil.NoSuchProcess:
-                pass
-        procs = alive
-        if not procs:
-            return
-        time.sleep(0.3)
-    if procs:
-        terminate_process_tree(pid)
-
-
-def terminate_process(pid: int, *, timeout_seconds: float = 5.0) -> None:
-    try:
-        proc = psutil.Process(pid)
-    except psutil.NoSuchProcess:
-        return
+                proc.terminate()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        _, alive = psutil.wait_procs(
+            alive, timeout=max(0.0, timeout_seconds), callback=recorder(PHASE_TERMINATE)
+        )
 
-    try:
-        proc.terminate()
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
-        return
+    killed = False
+    if alive:
+        for proc in alive:
+            try:
+                proc.kill()
+                killed = True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        psutil.wait_procs(alive, timeout=1.0, callback=recorder(PHASE_KILL))
 
-    try:
-        proc.wait(timeout=timeout_seconds)
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
-        return
-    except psutil.TimeoutExpired:
-        try:
-            proc.kill()
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return
+    return TerminationResult(
+        pid=pid,
+        exits=tuple(exits),
+        duration_seconds=time.monotonic() - started,
+        killed=killed,
+    )
 
 
-def terminate_process_tree(pid: int, *, timeout_seconds: float = 5.0) -> None:
-    try:
-        parent = psutil.Process(pid)
-    except psutil.NoSuchProcess:
-        return
+def graceful_terminate_process(
+    pid: int, grace_seconds: float, *, timeout_seconds: float = 5.0
+) -> TerminationResult:
+    return _run_termination(pid, _collect(pid, tree=False), grace_seconds, timeout_seconds)
 
-    children = []
-    try:
-        children = parent.children(recursive=True)
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
-        children = []
 
-    procs = [*children, parent]
-    for proc in procs:
+def graceful_terminate_process_tree(
+    pid: int, grace_seconds: float, *, timeout_seconds: float = 5.0
+) -> TerminationResult:
+    return _run_termination(pid, _collect(pid, tree=True), grace_seconds, timeout_seconds)
+
+
+def terminate_process(pid: int, *, timeout_seconds: float = 5.0) -> TerminationResult:
+    return graceful_terminate_process(pid, 0.0, timeout_seconds=timeout_seconds)
+
+
+def terminate_process_tree(pid: int, *, timeout_seconds: float = 5.0) -> TerminationResult:
+    return graceful_terminate_process_tree(pid, 0.0, timeout_seconds=timeout_seconds)
+
+
+def suspend_process_tree(pid: int, *, tree: bool = True) -> list[psutil.Process]:
+    """Suspend ``pid`` (and its descendants); returns what was suspended, for ``resume_processes``.
+
+    The parent goes first so it can't start new children mid-walk.
+    """
+    suspended: list[psutil.Process] = []
+    for proc in reversed(_collect(pid, tree=tree)):
         try:
-            proc.terminate()
+            proc.suspend()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
+        suspended.append(proc)
+    return suspended
 
-    _, alive = psutil.wait_procs(procs, timeout=timeout_seconds)
-    for proc in alive:
+
+def resume_processes(procs: Iterable[psutil.Process]) -> int:
+    """Resume processes from ``suspend_process_tree``; ones that have exited are skipped."""
+    resumed = 0
+    for proc in procs:
         try:
-            proc.kill()
+            proc.resume()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
+        resumed += 1
+    return resumed
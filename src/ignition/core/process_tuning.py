@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import psutil
+
+from ignition.core.tuning_policy import format_cpu_list, normalize_priority
+
+logger = logging.getLogger(__name__)
+
+# POSIX nice value per priority level; a plain integer in ``priority`` is used as-is.
+_NICE = {"idle": 19, "below_normal": 10, "normal": 0, "above_normal": -5, "high": -10}
+
+_WINDOWS_PRIORITY = {
+    "idle": "IDLE_PRIORITY_CLASS",
+    "below_normal": "BELOW_NORMAL_PRIORITY_CLASS",
+    "normal": "NORMAL_PRIORITY_CLASS",
+    "above_normal": "ABOVE_NORMAL_PRIORITY_CLASS",
+    "high": "HIGH_PRIORITY_CLASS",
+}
+_WINDOWS_IO = {"very_low": "IOPRIO_VERYLOW", "low": "IOPRIO_LOW",
+               "normal": "IOPRIO_NORMAL", "high": "IOPRIO_HIGH"}
+# Linux ionice: (class, level); real-time needs root, so "high" is best-effort level 0.
+_LINUX_IO = {"very_low": ("IOPRIO_CLASS_IDLE", None), "low": ("IOPRIO_CLASS_BE", 7),
+             "normal": ("IOPRIO_CLASS_BE", 4), "high": ("IOPRIO_CLASS_BE", 0)}
+
+
+@dataclass(frozen=True)
+class ProcessTuning:
+    priority: str = ""                # see normalize_priority
+    cpu_affinity: tuple[int, ...] = ()  # empty = every core
+    io_priority: str = ""             # one of IO_PRIORITY_LEVELS, or "" to leave unchanged
+
+    @classmethod
+    def from_app(cls, app) -> "ProcessTuning":
+        return cls(
+            priority=app.priority,
+            cpu_affinity=tuple(app.cpu_affinity),
+            io_priority=app.io_priority,
+        )
+
+    @property
+    def empty(self) -> bool:
+        return not (self.priority or self.cpu_affinity or self.io_priority)
+
+
+def _nearest_level(nice: int) -> str:
+    return min(_NICE, key=lambda level: abs(_NICE[level] - nice))
+
+
+def _set_priority(proc: psutil.Process, priority: str) -> None:
+    if os.name == "nt":
+        level = priority if priority in _NICE else _nearest_level(int(priority))
+        proc.nice(getattr(psutil, _WINDOWS_PRIORITY[level]))
+        return
+    proc.nice(_NICE[priority] if priority in _NICE else int(priority))
+
+
+def _set_io_priority(proc: psutil.Process, io_priority: str) -> None:
+    if os.name == "nt":
+        proc.ionice(getattr(psutil, _WINDOWS_IO[io_priority]))
+        return
+    ioclass, value = _LINUX_IO[io_priority]
+    proc.ionice(getattr(psutil, ioclass), value)
+
+
+def _describe(exc: BaseException) -> str:
+    if isinstance(exc, psutil.AccessDenied):
+        return "access denied"
+    return str(exc) or type(exc).__name__
+
+
+def apply_tuning(pid: int, tuning: ProcessTuning) -> list[str]:
+    """Apply ``tuning`` to ``pid``; returns one message per setting that failed.
+
+    A process that has already exited is not a failure.
+    """
+    if tuning.empty:
+        return []
+    try:
+        proc = psutil.Process(pid)
+        return _apply(proc, tuning)
+    except psutil.NoSuchProcess:
+        return []
+
+
+def _apply(proc: psutil.Process, tuning: ProcessTuning) -> list[str]:
+    failures: list[str] = []
+    if tuning.priority:
+        try:
+            _set_priority(proc, tuning.priority)
+        except psutil.NoSuchProcess:
+            raise
+        except (psutil.Error, OSError, ValueError) as exc:
+            failures.append(f"priority {tuning.priority}: {_describe(exc)}")
+    if tuning.cpu_affinity:
+        count = psutil.cpu_count() or 1
+        cpus = [c for c in tuning.cpu_affinity if c < count]
+        if not hasattr(proc, "cpu_affinity"):
+            failures.append("CPU affinity: not supported on this platform")
+        elif not cpus:
+            failures.append(
+                f"CPU affinity {format_cpu_list(tuning.cpu_affinity)}: only {count} cores"
+            )
+        else:
+            try:
+                proc.cpu_affinity(cpus)
+            except psutil.NoSuchProcess:
+                raise
+            except (psutil.Error, OSError, ValueError) as exc:
+                failures.append(
+                    f"CPU affinity {format_cpu_list(cpus)}: {_describe(exc)}"
+                )
+    if tuning.io_priority:
+        if not hasattr(proc, "ionice"):
+            failures.append("I/O priority: not supported on this platform")
+        else:
+            try:
+                _set_io_priority(proc, tuning.io_priority)
+            except psutil.NoSuchProcess:
+                raise
+            except (psutil.Error, OSError, ValueError, AttributeError) as exc:
+                failures.append(f"I/O priority {tuning.io_priority}: {_describe(exc)}")
+    return failures
+
+
+def without_cores(tuning: ProcessTuning, reserved: Iterable[int]) -> ProcessTuning:
+    """``tuning`` with ``reserved`` cores taken out of its affinity (every core if unset).
+
+    An app pinned only to reserved cores keeps its own setting.
+    """
+    reserved = set(reserved)
+    if not reserved:
+        return tuning
+    cores = tuning.cpu_affinity or tuple(range(psutil.cpu_count() or 1))
+    allowed = tuple(c for c in cores if c not in reserved)
+    if not allowed:
+        return tuning
+    return ProcessTuning(
+        priority=tuning.priority, cpu_affinity=allowed, io_priority=tuning.io_priority
+    )
+
+
+@dataclass(frozen=True)
+class SavedTuning:
+    """A process's priority and affinity before it was tuned, for ``restore_tuning``."""
+
+    pid: int
+    create_time: float
+    nice: int | None
+    cpu_affinity: tuple[int, ...] | None
+
+
+def capture_tuning(pid: int) -> SavedTuning | None:
+    try:
+        proc = psutil.Process(pid)
+        with proc.oneshot():
+            create_time = proc.create_time()
+            try:
+                nice = proc.nice()
+            except psutil.AccessDenied:
+                nice = None
+            try:
+                affinity = tuple(proc.cpu_affinity()) if hasattr(proc, "cpu_affinity") else None
+            except psutil.AccessDenied:
+                affinity = None
+    except psutil.Error:
+        return None
+    return SavedTuning(pid=pid, create_time=create_time, nice=nice, cpu_affinity=affinity)
+
+
+def restore_tuning(saved: SavedTuning) -> list[str]:
+    """Put back what ``capture_tuning`` saw; a process that has since exited is skipped."""
+    failures: list[str] = []
+    try:
+        proc = psutil.Process(saved.pid)
+        if proc.create_time() != saved.create_time:
+            return []
+        if saved.nice is not None:
+            try:
+                proc.nice(saved.nice)
+            except psutil.AccessDenied as exc:
+                failures.append(f"priority: {_describe(exc)}")
+        if saved.cpu_affinity:
+            try:
+                proc.cpu_affinity(list(saved.cpu_affinity))
+            except (psutil.AccessDenied, ValueError) as exc:
+                failures.append(f"CPU affinity: {_describe(exc)}")
+    except psutil.NoSuchProcess:
+        return []
+    return failures
+
+
+@dataclass
+class _Tracked:
+    pid: int
+    tuning: ProcessTuning
+    seen: set[int]
+    reported: bool = False
+
+
+class DescendantTuner:
+    """Re-applies an app's tuning to descendants that show up after launch.
+
+    Launchers and updaters often start the real process later, so every
+    ``interval_seconds`` the tracked trees are walked and new PIDs tuned.
+    ``on_failure(key, messages)`` is called at most once per tracked app.
+    """
+
+    def __init__(
+        self,
+        on_failure: Callable[[str, list[str]], None],
+        *,
+        interval_seconds: float = 2.0,
+        stretch: Callable[[float], float] = lambda seconds: seconds,
+    ) -> None:
+        self._on_failure = on_failure
+        self._interval = interval_seconds
+        self._stretch = stretch
+        self._lock = threading.Lock()
+        self._tracked: dict[str, _Tracked] = {}
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.tuned_count = 0
+
+    def track(self, key: str, pid: int, tuning: ProcessTuning) -> None:
+        if tuning.empty:
+            return
+        with self._lock:
+            self._tracked[key] = _Tracked(pid=pid, tuning=tuning, seen={pid})
+            if self._thread is None:
+                self._stop_event.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="descendant-tuner", daemon=True
+                )
+                self._thread.start()
+
+    def untrack(self, key: str) -> None:
+        with self._lock:
+            self._tracked.pop(key, None)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=3.0)
+
+    def scan_once(self) -> None:
+        with self._lock:
+            tracked = list(self._tracked.items())
+        for key, entry in tracked:
+            try:
+                children = psutil.Process(entry.pid).children(recursive=True)
+            except psutil.Error:
+                continue
+            failures: list[str] = []
+            for child in children:
+                if child.pid in entry.seen:
+                    continue
+                entry.seen.add(child.pid)
+                self.tuned_count += 1
+                failures += apply_tuning(child.pid, entry.tuning)
+            if failures and not entry.reported:
+                entry.reported = True
+                self._on_failure(key, failures)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._stretch(self._interval)):
+            try:
+                self.scan_once()
+            except Exception:
+                logger.exception("Descendant tuning failed")
@@ -1,5 +1,12 @@
+from __future__ import annotations
+
 import os
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
+from typing import Callable, Iterable
 
 import psutil
 
@@ -11,35 +18,375 @@ def normalize_windows_path(path: str) -> str:
         return os.path.normcase(os.path.abspath(path)).lower()
 
 
-def any_process_name_running(process_names: list[str]) -> bool:
-    if not process_names:
-        return False
-    wanted = {n.strip().lower() for n in process_names if n.strip()}
-    if not wanted:
-        return False
-
-    for proc in psutil.process_iter(attrs=["name"]):
-        try:
-            name = (proc.info.get("name") or "").lower()
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
-        if name in wanted:
-            return True
-    return False
-
-
-def any_process_exe_running(exe_path: str) -> bool:
-    if not exe_path:
-        return False
-    target = normalize_windows_path(exe_path)
-
-    for proc in psutil.process_iter(attrs=["exe"]):
-        try:
-            exe = proc.info.get("exe")
-            if not exe:
+@dataclass(frozen=True)
+class ProcessEntry:
+    pid: int
+    name: str  # lower-cased
+    exe: str   # as reported by psutil, "" when unavailable
+    create_time: float = 0.0
+    ppid: int = 0
+
+    @property
+    def key(self) -> tuple[int, float]:
+        return self.pid, self.create_time
+
+
+class ExePathCache:
+    """Normalized executable path per process lifetime, keyed by (pid, create_time).
+
+    ``normalize_windows_path`` hits the filesystem, so it runs once per process
+    rather than once per query; entries are evicted when the process exits.
+    With ``live_only`` a path is only kept for processes announced through
+    ``add_live`` and not evicted since, so a reader holding an old snapshot
+    can't bring back a process that has already gone. Safe to share between
+    threads.
+    """
+
+    def __init__(self, *, live_only: bool = False) -> None:
+        self._lock = threading.Lock()
+        self._paths: dict[tuple[int, float], str] = {}
+        self._live: set[tuple[int, float]] | None = set() if live_only else None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._paths)
+
+    def get(self, entry: ProcessEntry) -> str:
+        key = entry.key
+        with self._lock:
+            path = self._paths.get(key)
+            if path is not None:
+                self.hits += 1
+                return path
+            self.misses += 1
+        path = normalize_windows_path(entry.exe) if entry.exe else ""
+        with self._lock:
+            if self._live is None or key in self._live:
+                self._paths[key] = path
+        return path
+
+    def add_live(self, entries: Iterable[ProcessEntry]) -> None:
+        with self._lock:
+            if self._live is not None:
+                self._live.update(e.key for e in entries)
+
+    def evict(self, entries: Iterable[ProcessEntry]) -> None:
+        with self._lock:
+            for entry in entries:
+                self._paths.pop(entry.key, None)
+                if self._live is not None:
+                    self._live.discard(entry.key)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._paths), "hits": self.hits, "misses": self.misses}
+
+
+@dataclass(frozen=True)
+class ProcessSnapshot:
+    """The process table at ``taken_at``.
+
+    With ``on_stale`` set, every PID a name or exe query matches is checked
+    against the create_time of whatever holds that PID now: a process that has
+    exited, or whose PID was handed to another one, is left out of the result
+    and reported to ``on_stale``. Only matches pay for the check, so a query
+    costs one syscall per hit rather than one per process in the table.
+    """
+
+    taken_at: float
+    entries: tuple[ProcessEntry, ...]
+    scan_seconds: float = 0.0
+    exe_paths: ExePathCache | None = field(default=None, compare=False, repr=False)
+    on_stale: Callable[[list[int]], None] | None = field(default=None, compare=False, repr=False)
+
+    def _current(self, matches: Iterable[ProcessEntry]) -> Iterable[ProcessEntry]:
+        """``matches`` that are still the process the snapshot saw, lazily."""
+        if self.on_stale is None:
+            yield from matches
+            return
+        for entry in matches:
+            create_time = _current_create_time(entry.pid)
+            if create_time is not None and (
+                create_time == 0.0 or entry.create_time in (0.0, create_time)
+            ):
+                yield entry
+            else:
+                self.on_stale([entry.pid])
+
+    @cached_property
+    def _children(self) -> dict[int, list[ProcessEntry]]:
+        children: dict[int, list[ProcessEntry]] = {}
+        for entry in self.entries:
+            children.setdefault(entry.ppid, []).append(entry)
+        return children
+
+    def descendants(self, pid: int) -> list[int]:
+        """PIDs started by ``pid``, directly or further down.
+
+        A "child" created before its parent holds a reused parent PID and is skipped.
+        """
+        found: list[int] = []
+        seen = {pid}
+        stack = [(pid, next((e.create_time for e in self.entries if e.pid == pid), 0.0))]
+        while stack:
+            parent, parent_created = stack.pop()
+            for child in self._children.get(parent, ()):
+                if child.pid in seen or child.create_time < parent_created:
+                    continue
+                seen.add(child.pid)
+                found.append(child.pid)
+                stack.append((child.pid, child.create_time))
+        return found
+
+    def pids_for_names(self, process_names: list[str]) -> list[int]:
+        wanted = {n.strip().lower() for n in process_names if n.strip()}
+        if not wanted:
+            return []
+        return [e.pid for e in self._current(e for e in self.entries if e.name in wanted)]
+
+    def any_name_running(self, process_names: list[str]) -> bool:
+        wanted = {n.strip().lower() for n in process_names if n.strip()}
+        if not wanted:
+            return False
+        return any(True for _ in self._current(e for e in self.entries if e.name in wanted))
+
+    def pids_for_exe(self, exe_path: str) -> list[int]:
+        if not exe_path:
+            return []
+        target = normalize_windows_path(exe_path)
+        cache = self.exe_paths if self.exe_paths is not None else ExePathCache()
+        matches = (e for e in self.entries if e.exe and cache.get(e) == target)
+        return [e.pid for e in self._current(matches)]
+
+    def any_exe_running(self, exe_path: str) -> bool:
+        return bool(self.pids_for_exe(exe_path))
+
+    def running_executables(self, exe_paths: Iterable[str]) -> dict[str, list[int]]:
+        """Which of ``exe_paths`` are running, with their PIDs, in a single pass.
+
+        Keys are the paths as given; paths with no running process are left out.
+        """
+        wanted: dict[str, list[str]] = {}
+        for path in exe_paths:
+            if path:
+                wanted.setdefault(normalize_windows_path(path), []).append(path)
+        if not wanted:
+            return {}
+        cache = self.exe_paths if self.exe_paths is not None else ExePathCache()
+        found: dict[str, list[int]] = {}
+        matches = (e for e in self.entries if e.exe and cache.get(e) in wanted)
+        for entry in self._current(matches):
+            for path in wanted[cache.get(entry)]:
+                found.setdefault(path, []).append(entry.pid)
+        return found
+
+
+def _resolve_entry(pid: int) -> ProcessEntry | None:
+    try:
+        proc = psutil.Process(pid)
+        with proc.oneshot():
+            # A zombie has already exited; it only lingers until its parent reaps it.
+            if os.name != "nt" and proc.status() == psutil.STATUS_ZOMBIE:
+                return None
+            try:
+                create_time = proc.create_time()
+            except psutil.AccessDenied:
+                create_time = 0.0
+            try:
+                name = (proc.name() or "").lower()
+            except psutil.AccessDenied:
+                name = ""
+            try:
+                exe = proc.exe() or ""
+            except (psutil.AccessDenied, psutil.ZombieProcess, OSError):
+                exe = ""
+            try:
+                ppid = proc.ppid()
+            except psutil.AccessDenied:
+                ppid = 0
+    except psutil.NoSuchProcess:
+        return None
+    return ProcessEntry(pid=pid, name=name, exe=exe, create_time=create_time, ppid=ppid)
+
+
+def _current_create_time(pid: int) -> float | None:
+    """create_time of whatever holds ``pid`` now: None if nothing does, 0.0 if unreadable."""
+    try:
+        return psutil.Process(pid).create_time()
+    except psutil.AccessDenied:
+        return 0.0
+    except psutil.NoSuchProcess:
+        return None
+
+
+class ProcessTable:
+    """Process table maintained by diffing PID sets between refreshes.
+
+    Attributes are only fetched for PIDs that were not present last time, and
+    entries are evicted as soon as their PID disappears, so a refresh costs
+    roughly one ``psutil.pids()`` call plus the churn since the previous one.
+    A PID seen in consecutive refreshes is assumed to be the same process;
+    a reused PID is caught when a query matches it (see ``ProcessSnapshot``)
+    and dropped with ``forget``. New entries are resolved once more on the
+    following refresh, which catches a process that was first seen between
+    fork and exec (or before it renamed itself).
+    """
+
+    def __init__(self) -> None:
+        self._by_pid: dict[int, ProcessEntry] = {}
+        self._young: set[int] = set()
+        self.resolved_count = 0
+        self.evicted_count = 0
+
+    def __len__(self) -> int:
+        return len(self._by_pid)
+
+    def entries(self) -> tuple[ProcessEntry, ...]:
+        return tuple(self._by_pid.values())
+
+    def get(self, pid: int) -> ProcessEntry | None:
+        return self._by_pid.get(pid)
+
+    def forget(self, pids: Iterable[int]) -> list[ProcessEntry]:
+        """Drop entries so they are resolved afresh on the next refresh."""
+        dropped = [self._by_pid.pop(pid) for pid in pids if pid in self._by_pid]
+        self.evicted_count += len(dropped)
+        return dropped
+
+    def refresh(self) -> tuple[list[ProcessEntry], list[ProcessEntry]]:
+        """Sync with the OS and return ``(added, removed)`` entries."""
+        pids = set(psutil.pids())
+
+        removed = [self._by_pid.pop(pid) for pid in self._by_pid.keys() - pids]
+
+        added = []
+        for pid in self._young & self._by_pid.keys():
+            entry = _resolve_entry(pid)
+            self.resolved_count += 1
+            if entry is None or entry == self._by_pid[pid]:
                 continue
-            if normalize_windows_path(exe) == target:
-                return True
-        except (psutil.NoSuchProcess, psutil.AccessDenied, OSError):
-            continue
-    return False
+            removed.append(self._by_pid.pop(pid))
+            self._by_pid[pid] = entry
+            added.append(entry)
+
+        young = set()
+        for pid in pids - self._by_pid.keys():
+            entry = _resolve_entry(pid)
+            self.resolved_count += 1
+            if entry is None:
+                continue
+            self._by_pid[pid] = entry
+            young.add(pid)
+            added.append(entry)
+        self._young = young
+
+        self.evicted_count += len(removed)
+        return added, removed
+
+
+class ProcessSnapshotService:
+    """Shares one process-table walk between every consumer.
+
+    Callers ask for a snapshot no older than ``max_age_seconds``; the first
+    caller past that age pays for a new walk, everyone else reuses it.
+    """
+
+    def __init__(self, *, max_age_seconds: float = 1.0) -> None:
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._table = ProcessTable()
+        self._exe_paths = ExePathCache(live_only=True)
+        self._snapshot: ProcessSnapshot | None = None
+        self.scan_count = 0
+        self.scan_seconds_total = 0.0
+
+    def get(self, *, max_age_seconds: float | None = None) -> ProcessSnapshot:
+        max_age = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+        with self._lock:
+            snap = self._snapshot
+            if snap is None or time.monotonic() - snap.taken_at > max_age:
+                snap = self._refresh()
+                self._snapshot = snap
+                self.scan_count += 1
+                self.scan_seconds_total += snap.scan_seconds
+            return snap
+
+    def _refresh(self) -> ProcessSnapshot:
+        started = time.monotonic()
+        added, removed = self._table.refresh()
+        self._exe_paths.evict(removed)
+        self._exe_paths.add_live(added)
+        finished = time.monotonic()
+        return ProcessSnapshot(
+            taken_at=finished,
+            entries=self._table.entries(),
+            scan_seconds=finished - started,
+            exe_paths=self._exe_paths,
+            on_stale=self._forget_stale,
+        )
+
+    def _forget_stale(self, pids: list[int]) -> None:
+        # The PID is resolved afresh on the next refresh, as whatever holds it then.
+        with self._lock:
+            self._exe_paths.evict(self._table.forget(pids))
+
+    def invalidate(self, pids: Iterable[int] = ()) -> None:
+        """Force the next ``get`` to rescan, re-resolving ``pids`` from scratch."""
+        with self._lock:
+            self._snapshot = None
+            self._exe_paths.evict(self._table.forget(pids))
+
+    def exe_cache_stats(self) -> dict[str, int]:
+        return self._exe_paths.stats()
+
+    def any_name_running(
+        self, process_names: list[str], *, max_age_seconds: float | None = None
+    ) -> bool:
+        if not process_names:
+            return False
+        return self.get(max_age_seconds=max_age_seconds).any_name_running(process_names)
+
+    def any_exe_running(self, exe_path: str, *, max_age_seconds: float | None = None) -> bool:
+        if not exe_path:
+            return False
+        return self.get(max_age_seconds=max_age_seconds).any_exe_running(exe_path)
+
+    def pids_for_names(
+        self, process_names: list[str], *, max_age_seconds: float | None = None
+    ) -> list[int]:
+        if not process_names:
+            return []
+        return self.get(max_age_seconds=max_age_seconds).pids_for_names(process_names)
+
+    def running_executables(
+        self, exe_paths: Iterable[str], *, max_age_seconds: float | None = None
+    ) -> dict[str, list[int]]:
+        paths = [p for p in exe_paths if p]
+        if not paths:
+            return {}
+        return self.get(max_age_seconds=max_age_seconds).running_executables(paths)
+
+
+_shared_snapshots = ProcessSnapshotService()
+
+
+def shared_process_snapshots() -> ProcessSnapshotService:
+    return _shared_snapshots
+
+
+def any_process_name_running(
+    process_names: list[str], *, max_age_seconds: float | None = None
+) -> bool:
+    return _shared_snapshots.any_name_running(process_names, max_age_seconds=max_age_seconds)
+
+
+def any_process_exe_running(exe_path: str, *, max_age_seconds: float | None = None) -> bool:
+    return _shared_snapshots.any_exe_running(exe_path, max_age_seconds=max_age_seconds)
+
+
+def running_executables(
+    exe_paths: Iterable[str], *, max_age_seconds: float | None = None
+) -> dict[str, list[int]]:
+    return _shared_snapshots.running_executables(exe_paths, max_age_seconds=max_age_seconds)
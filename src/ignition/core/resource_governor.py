@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable
+
+import psutil
+
+
+def _own_cpu_seconds() -> float:
+    times = psutil.Process(os.getpid()).cpu_times()
+    return times.user + times.system
+
+
+class ResourceGovernor:
+    """Keeps iGnition's own CPU use under a budget while a session is running.
+
+    Usage is sampled at most once per ``sample_seconds`` (lazily, by whoever
+    asks) and smoothed, in percent of one core. While enforcing and over
+    budget, ``stretch`` lengthens poll intervals in proportion to the
+    overshoot (up to ``max_stretch``) and ``allow_optional`` turns down work
+    nobody is waiting on. A budget of 0 disables it.
+    """
+
+    def __init__(
+        self,
+        *,
+        get_budget_percent: Callable[[], float],
+        sample_seconds: float = 1.0,
+        smoothing: float = 0.5,
+        max_stretch: float = 4.0,
+        clock: Callable[[], float] = time.monotonic,
+        cpu_seconds: Callable[[], float] = _own_cpu_seconds,
+    ) -> None:
+        self._get_budget_percent = get_budget_percent
+        self._sample_seconds = sample_seconds
+        self._smoothing = smoothing
+        self._max_stretch = max_stretch
+        self._clock = clock
+        self._cpu_seconds = cpu_seconds
+        self._lock = threading.Lock()
+        self._enforcing = False
+        self._last_wall: float | None = None
+        self._last_cpu = 0.0
+        self._usage = 0.0
+        self.throttled_count = 0  # decisions that shed or delayed work
+
+    def set_enforcing(self, enforcing: bool) -> None:
+        """Turned on for the length of a session."""
+        with self._lock:
+            self._enforcing = enforcing
+
+    def _budget(self) -> float:
+        try:
+            return max(0.0, float(self._get_budget_percent()))
+        except Exception:
+            return 0.0
+
+    def usage_percent(self) -> float:
+        with self._lock:
+            now = self._clock()
+            if self._last_wall is None:
+                self._last_wall, self._last_cpu = now, self._sample_cpu()
+            elif now - self._last_wall >= self._sample_seconds:
+                cpu = self._sample_cpu()
+                instant = max(0.0, cpu - self._last_cpu) / (now - self._last_wall) * 100.0
+                self._usage += self._smoothing * (instant - self._usage)
+                self._last_wall, self._last_cpu = now, cpu
+            return self._usage
+
+    def _sample_cpu(self) -> float:
+        try:
+            return self._cpu_seconds()
+        except (psutil.Error, OSError):
+            return self._last_cpu
+
+    def over_budget(self) -> bool:
+        budget = self._budget()
+        if not self._enforcing or budget <= 0:
+            return False
+        return self.usage_percent() > budget
+
+    def stretch(self, interval: float) -> float:
+        """``interval``, lengthened while over budget."""
+        budget = self._budget()
+        if not self.over_budget():
+            return interval
+        self.throttled_count += 1
+        return interval * min(self._max_stretch, max(1.0, self._usage / budget))
+
+    def allow_optional(self) -> bool:
+        """False while over budget: skip work that can wait or be redone later."""
+        if self.over_budget():
+            self.throttled_count += 1
+            return False
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        usage = self.usage_percent()
+        budget = self._budget()
+        over = self.over_budget()
+        return {
+            "cpu_percent": round(usage, 2),
+            "budget_percent": budget,
+            "enforcing": self._enforcing and budget > 0,
+            "over_budget": over,
+            "stretch": round(min(self._max_stretch, usage / budget), 2) if over else 1.0,
+            "throttled": self.throttled_count,
+        }
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id               INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at       TEXT NOT NULL,
+    ended_at         TEXT,
+    duration_seconds INTEGER,
+    profile_id       TEXT,
+    profile_name     TEXT,
+    data             TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_started_at ON sessions (started_at);
+CREATE INDEX IF NOT EXISTS sessions_profile ON sessions (profile_id, started_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_MIGRATED_KEY = "migrated_session_history_json"
+
+
+class SessionHistoryStore:
+    """Session history in SQLite; one row per session, newest read first.
+
+    The database is opened on first use, so constructing the store costs
+    nothing. A legacy ``session_history.json`` is imported once, then renamed
+    to ``.json.migrated``.
+    """
+
+    def __init__(self, path: Path, *, legacy_json: Path | None = None) -> None:
+        self._path = path
+        self._legacy_json = legacy_json
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._migrate_legacy_json(conn)
+        return self._conn
+
+    def _migrate_legacy_json(self, conn: sqlite3.Connection) -> None:
+        legacy = self._legacy_json
+        if legacy is None or not legacy.exists():
+            return
+        done = conn.execute("SELECT 1 FROM meta WHERE key = ?", (_MIGRATED_KEY,)).fetchone()
+        if done is None:
+            try:
+                data = json.loads(legacy.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = []
+            entries = [e for e in data if isinstance(e, dict)] if isinstance(data, list) else []
+            with conn:
+                conn.executemany(
+                    "INSERT INTO sessions (started_at, ended_at, duration_seconds,"
+                    " profile_id, profile_name, data) VALUES (?, ?, ?, ?, ?, ?)",
+                    [self._row(e) for e in entries],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    (_MIGRATED_KEY, str(len(entries))),
+                )
+            logger.info("Migrated %d sessions from %s", len(entries), legacy)
+        try:
+            legacy.replace(legacy.with_suffix(".json.migrated"))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _row(entry: dict[str, Any]) -> tuple:
+        return (
+            str(entry.get("started_at") or ""),
+            entry.get("ended_at"),
+            entry.get("duration_seconds"),
+            entry.get("profile_id"),
+            entry.get("profile_name"),
+            json.dumps(entry, ensure_ascii=False),
+        )
+
+    def add(self, entry: dict[str, Any]) -> int:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                cur = conn.execute(
+                    "INSERT INTO sessions (started_at, ended_at, duration_seconds,"
+                    " profile_id, profile_name, data) VALUES (?, ?, ?, ?, ?, ?)",
+                    self._row(entry),
+                )
+            return int(cur.lastrowid)
+
+    def page(
+        self, *, limit: int = 50, offset: int = 0, profile_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Sessions newest first."""
+        sql = "SELECT data FROM sessions"
+        params: list[Any] = []
+        if profile_id:
+            sql += " WHERE profile_id = ?"
+            params.append(profile_id)
+        sql += " ORDER BY started_at DESC, id DESC LIMIT ? OFFSET ?"
+        params += [max(0, int(limit)), max(0, int(offset))]
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        out = []
+        for (data,) in rows:
+            try:
+                out.append(json.loads(data))
+            except ValueError:
+                continue
+        return out
+
+    def iter_entries(self, *, batch: int = 500) -> Iterator[dict[str, Any]]:
+        """Every session, oldest first, fetched ``batch`` rows at a time."""
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT id, data FROM sessions WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch),
+                ).fetchall()
+            if not rows:
+                return
+            for row_id, data in rows:
+                last_id = row_id
+                try:
+                    yield json.loads(data)
+                except ValueError:
+                    continue
+
+    def count(self, *, profile_id: str | None = None) -> int:
+        with self._lock:
+            conn = self._connect()
+            if profile_id:
+                row = conn.execute(
+                    "SELECT COUNT(*) FROM sessions WHERE profile_id = ?", (profile_id,)
+                ).fetchone()
+            else:
+                row = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        return int(row[0])
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM sessions")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
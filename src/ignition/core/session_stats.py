@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+from pathlib import Path
+from typing import Any, Iterable
+
+from ignition.core.storage import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+_VERSION = 1
+_MAX_DAYS = 400  # day buckets older than this are dropped; week buckets are kept
+
+
+def _bucket(totals: dict[str, list], key: str, seconds: float) -> None:
+    slot = totals.setdefault(key, [0, 0.0])
+    slot[0] += 1
+    slot[1] += seconds
+
+
+class SessionAnalytics:
+    """Running totals over session history, updated once per finished session.
+
+    Nothing here scans history: each ``record`` touches a handful of
+    buckets, and ``summary`` only reads buckets, so answering stays cheap
+    however long the history grows.
+    """
+
+    def __init__(self) -> None:
+        self.sessions = 0
+        self.total_seconds = 0.0
+        self.profiles: dict[str, dict[str, Any]] = {}  # id -> name, sessions, seconds
+        self.apps: dict[str, int] = {}                  # app name -> launches
+        self.days: dict[str, list] = {}                 # YYYY-MM-DD -> [sessions, seconds]
+        self.weeks: dict[str, list] = {}                # YYYY-Www -> [sessions, seconds]
+
+    def record(self, entry: dict[str, Any]) -> None:
+        seconds = float(entry.get("duration_seconds") or 0.0)
+        self.sessions += 1
+        self.total_seconds += seconds
+
+        profile_id = str(entry.get("profile_id") or "")
+        profile = self.profiles.setdefault(
+            profile_id, {"name": "", "sessions": 0, "seconds": 0.0}
+        )
+        profile["name"] = str(entry.get("profile_name") or profile["name"])
+        profile["sessions"] += 1
+        profile["seconds"] += seconds
+
+        for name in entry.get("apps_launched") or []:
+            self.apps[str(name)] = self.apps.get(str(name), 0) + 1
+
+        try:
+            started = datetime.date.fromisoformat(str(entry.get("started_at") or "")[:10])
+        except ValueError:
+            return
+        _bucket(self.days, started.isoformat(), seconds)
+        year, week, _ = started.isocalendar()
+        _bucket(self.weeks, f"{year}-W{week:02d}", seconds)
+        if len(self.days) > _MAX_DAYS:
+            for day in sorted(self.days)[: len(self.days) - _MAX_DAYS]:
+                del self.days[day]
+
+    def summary(self, *, weeks: int = 12, days: int = 30) -> dict[str, Any]:
+        avg = self.total_seconds / self.sessions if self.sessions else 0.0
+        return {
+            "sessions": self.sessions,
+            "total_seconds": round(self.total_seconds),
+            "total_hours": round(self.total_seconds / 3600, 2),
+            "average_seconds": round(avg),
+            "profiles": sorted(
+                (
+                    {
+                        "profile_id": pid,
+                        "name": p["name"],
+                        "sessions": p["sessions"],
+                        "total_seconds": round(p["seconds"]),
+                        "total_hours": round(p["seconds"] / 3600, 2),
+                        "average_seconds": round(p["seconds"] / p["sessions"]),
+                    }
+                    for pid, p in self.profiles.items() if p["sessions"]
+                ),
+                key=lambda p: -p["total_seconds"],
+            ),
+            "apps": [
+                {"name": name, "launches": count}
+                for name, count in sorted(self.apps.items(), key=lambda kv: (-kv[1], kv[0]))
+            ],
+            "weeks": [
+                {"week": k, "sessions": v[0], "total_seconds": round(v[1])}
+                for k, v in sorted(self.weeks.items())[-weeks:]
+            ],
+            "days": [
+                {"day": k, "sessions": v[0], "total_seconds": round(v[1])}
+                for k, v in sorted(self.days.items())[-days:]
+            ],
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": _VERSION,
+            "sessions": self.sessions,
+            "total_seconds": self.total_seconds,
+            "profiles": self.profiles,
+            "apps": self.apps,
+            "days": self.days,
+            "weeks": self.weeks,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> "SessionAnalytics":
+        stats = cls()
+        stats.sessions = int(raw.get("sessions") or 0)
+        stats.total_seconds = float(raw.get("total_seconds") or 0.0)
+        stats.profiles = {str(k): dict(v) for k, v in (raw.get("profiles") or {}).items()}
+        stats.apps = {str(k): int(v) for k, v in (raw.get("apps") or {}).items()}
+        stats.days = {str(k): list(v) for k, v in (raw.get("days") or {}).items()}
+        stats.weeks = {str(k): list(v) for k, v in (raw.get("weeks") or {}).items()}
+        return stats
+
+    @classmethod
+    def rebuild(cls, entries: Iterable[dict[str, Any]]) -> "SessionAnalytics":
+        stats = cls()
+        for entry in entries:
+            stats.record(entry)
+        return stats
+
+    @classmethod
+    def load(cls, path: Path) -> "SessionAnalytics | None":
+        """The persisted aggregates, or ``None`` if missing or unreadable."""
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(raw, dict) or raw.get("version") != _VERSION:
+            return None
+        try:
+            return cls.from_dict(raw)
+        except (TypeError, ValueError, AttributeError):
+            return None
+
+    def save(self, path: Path) -> None:
+        atomic_write_text(path, json.dumps(self.to_dict(), ensure_ascii=False), encoding="utf-8")
@@ -1,8 +1,15 @@
+from __future__ import annotations
+
+import logging
 import threading
+from pathlib import Path
 
 from ignition.core.config_store import ConfigStore
 from ignition.core.ignition_controller import IgnitionController
 from ignition.core.logging_setup import configure_logging
+from ignition.core.metrics_exporter import MetricsFileWriter, MetricsServer
+
+logger = logging.getLogger(__name__)
 
 
 class AppState:
@@ -17,13 +24,39 @@ class AppState:
         controller = IgnitionController(config_store=config_store)
         return cls(config_store=config_store, controller=controller)
 
-    def run_headless(self) -> int:
+    def run_headless(
+        self,
+        *,
+        metrics_port: int | None = None,
+        metrics_file: Path | None = None,
+        metrics_interval: float = 15.0,
+        stop_event: threading.Event | None = None,
+    ) -> int:
+        exporters: list[MetricsServer | MetricsFileWriter] = []
+        if metrics_port is not None:
+            exporters.append(MetricsServer(self.controller.get_metrics, port=metrics_port))
+        if metrics_file is not None:
+            exporters.append(MetricsFileWriter(
+                self.controller.get_metrics, metrics_file, interval_seconds=metrics_interval
+            ))
+
         self.controller.start()
-        stop_event = threading.Event()
+        stop_event = stop_event or threading.Event()
+        started: list[MetricsServer | MetricsFileWriter] = []
         try:
+            for exporter in exporters:
+                try:
+                    exporter.start()
+                except OSError:
+                    # e.g. the metrics port is taken; the controller still runs without it
+                    logger.exception("Metrics exporter failed to start; continuing without it")
+                    continue
+                started.append(exporter)
             stop_event.wait()
         except KeyboardInterrupt:
             return 0
         finally:
             self.controller.stop()
+            for exporter in started:
+                exporter.stop()
         return 0
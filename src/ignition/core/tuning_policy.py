@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+PRIORITY_LEVELS = ("idle", "below_normal", "normal", "above_normal", "high")
+IO_PRIORITY_LEVELS = ("very_low", "low", "normal", "high")
+
+
+def parse_cpu_list(text: str) -> list[int]:
+    """``"4-7,9"`` -> ``[4, 5, 6, 7, 9]``; raises ``ValueError`` on anything else."""
+    cpus: set[int] = set()
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        lo, sep, hi = part.partition("-")
+        first, last = int(lo), int(hi) if sep else int(lo)
+        if first < 0 or last < first:
+            raise ValueError(f"bad CPU range: {part}")
+        cpus.update(range(first, last + 1))
+    return sorted(cpus)
+
+
+def format_cpu_list(cpus: Iterable[int]) -> str:
+    """Inverse of ``parse_cpu_list``, collapsing runs into ranges."""
+    out: list[str] = []
+    run: list[int] = []
+    for cpu in sorted(set(cpus)):
+        if run and cpu == run[-1] + 1:
+            run.append(cpu)
+            continue
+        if run:
+            out.append(f"{run[0]}-{run[-1]}" if len(run) > 1 else str(run[0]))
+        run = [cpu]
+    if run:
+        out.append(f"{run[0]}-{run[-1]}" if len(run) > 1 else str(run[0]))
+    return ",".join(out)
+
+
+def normalize_priority(value: object) -> str:
+    """A known level, a nice value as a string, or "" (leave unchanged)."""
+    text = str(value or "").strip().lower()
+    if text in PRIORITY_LEVELS:
+        return text
+    try:
+        return str(max(-20, min(19, int(text))))
+    except ValueError:
+        return ""
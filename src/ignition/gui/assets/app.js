@@ -149,6 +149,8 @@ function callApi(method, ...args) {
 // Status push (called by runner.py via evaluate_js)
 
 let _runningAppIds = new Set();
+let _suspendedAppIds = new Set();
+let _launchProblems = {};
 let _sessionTimerInterval = null;
 let _sessionTimerStartMs = null;
 
@@ -177,7 +179,15 @@ function _stopSessionTimer() {
   if (el) el.style.display = 'none';
 }
 
+let _lastStatus = {};
+
+// Delta push: only the fields that changed since the previous update.
+window.__ignitionStatusPatch = function(changes, newLogEntries) {
+  window.__ignitionStatusUpdate(Object.assign({}, _lastStatus, changes), newLogEntries);
+};
+
 window.__ignitionStatusUpdate = function(status, newLogEntries) {
+  _lastStatus = status;
   const dot  = $('#status-dot');
   const text = $('#status-text');
   if (status.iracing_running) {
@@ -207,11 +217,21 @@ window.__ignitionStatusUpdate = function(status, newLogEntries) {
   // sync running indicators
   const prevRunning = _runningAppIds;
   _runningAppIds = new Set(status.running_app_ids || []);
+  const prevSuspended = _suspendedAppIds;
+  _suspendedAppIds = new Set(status.suspended_app_ids || []);
   if (prevRunning.size !== _runningAppIds.size ||
       [..._runningAppIds].some(id => !prevRunning.has(id)) ||
-      [...prevRunning].some(id => !_runningAppIds.has(id))) {
+      [...prevRunning].some(id => !_runningAppIds.has(id)) ||
+      prevSuspended.size !== _suspendedAppIds.size ||
+      [..._suspendedAppIds].some(id => !prevSuspended.has(id))) {
     _updateAppRunningIndicators();
   }
+  // launch warm-up problems
+  const problems = status.launch_problems || {};
+  if (JSON.stringify(problems) !== JSON.stringify(_launchProblems)) {
+    _launchProblems = problems;
+    _updateAppProblemIndicators();
+  }
   // Session timer
   if (status.iracing_running && status.session_start_at) {
     if (!_sessionTimerStartMs) _startSessionTimer(status.session_start_at);
@@ -253,29 +273,38 @@ function appendLogEntries(entries) {
 function _updateAppRunningIndicators() {
   $$('#apps-list .app-card').forEach(card => {
     card.classList.toggle('running', _runningAppIds.has(card.dataset.id));
+    const suspended = _suspendedAppIds.has(card.dataset.id);
+    card.classList.toggle('suspended', suspended);
+    const pip = card.querySelector('.app-running-pip');
+    if (pip) pip.textContent = suspended ? 'Suspended' : 'Running';
   });
 }
 
-function renderLog() {
-  const list = $('#log-list');
-  if (!list) return;
-  if (!_logEntries.length) {
-    list.innerHTML = '<div class="log-empty">No events yet. Start iRacing to see activity.</div>';
-    return;
-  }
-  const _SESSION_TYPES = new Set(['iracing_start', 'iracing_stop']);
-  const filtered = _logFilter === 'error' ? _logEntries.filter(e => e.type === 'error') :
-    _logFilter === 'session' ? _logEntries.filter(e => _SESSION_TYPES.has(e.type)) :
-    _logEntries;
-  if (!filtered.length) {
-    list.innerHTML = '<div class="log-empty">No matching events.</div>';
-    return;
-  }
-  // show newest first, max 200 rows
-  list.innerHTML = [...filtered].reverse().slice(0, 200).map(e => {
+function _updateAppProblemIndicators() {
+  $$('#apps-list .app-card').forEach(card => {
+    const problems = _launchProblems[card.dataset.id] || [];
+    card.classList.toggle('launch-problem', problems.length > 0);
+    const pip = card.querySelector('.app-problem-pip');
+    if (pip) {
+      pip.textContent = problems.join(' · ');
+      pip.title = problems.join('\n');
+    }
+  });
+}
+
+// Filtered views are answered by the on-disk journal, newest first
+const _LOG_FILTER_TYPES = {
+  error:   ['error'],
+  session: ['iracing_start', 'iracing_stop'],
+};
+let _logOlderCursor = null;
+
+function _logRowsHtml(entries) {
+  return entries.map(e => {
     const meta = _LOG_META[e.type] || { sym: '·', cls: '' };
     const appSpan = e.app ? `<span class="log-app">${esc(e.app)}</span>` : '';
-    return `<div class="log-row ${meta.cls}">` +
+    const title = e.date ? ` title="${esc(e.date)}"` : '';
+    return `<div class="log-row ${meta.cls}"${title}>` +
       `<span class="log-time">${esc(e.time)}</span>` +
       `<span class="log-sym">${meta.sym}</span>` +
       appSpan +
@@ -284,6 +313,50 @@ function renderLog() {
   }).join('');
 }
 
+function _logOlderBtnHtml() {
+  return _logOlderCursor ? '<button class="btn log-older-btn" id="log-older-btn">Load older</button>' : '';
+}
+
+function _queryLog(types, before) {
+  return callApi('query_activity_log', JSON.stringify({ types, before, limit: 200 }));
+}
+
+function renderLog() {
+  const list = $('#log-list');
+  if (!list) return;
+  const types = _LOG_FILTER_TYPES[_logFilter];
+  if (!types) {
+    if (!_logEntries.length) {
+      list.innerHTML = '<div class="log-empty">No events yet. Start iRacing to see activity.</div>';
+      return;
+    }
+    // show newest first, max 200 rows
+    list.innerHTML = _logRowsHtml([..._logEntries].reverse().slice(0, 200));
+    return;
+  }
+  _queryLog(types, null).then(res => {
+    if (_LOG_FILTER_TYPES[_logFilter] !== types) return;  // filter changed meanwhile
+    const entries = (res && res.ok) ? res.entries : [];
+    _logOlderCursor = (res && res.ok) ? res.next_cursor : null;
+    if (!entries.length) {
+      list.innerHTML = '<div class="log-empty">No matching events.</div>';
+      return;
+    }
+    list.innerHTML = _logRowsHtml(entries) + _logOlderBtnHtml();
+  }).catch(() => toast('Failed to load log', 'error'));
+}
+
+$('#log-list').addEventListener('click', async e => {
+  const btn = e.target.closest('#log-older-btn');
+  if (!btn || !_logOlderCursor) return;
+  const types = _LOG_FILTER_TYPES[_logFilter];
+  const res = await _queryLog(types, _logOlderCursor).catch(() => null);
+  if (!res || !res.ok || _LOG_FILTER_TYPES[_logFilter] !== types) return;
+  _logOlderCursor = res.next_cursor;
+  btn.remove();
+  $('#log-list').insertAdjacentHTML('beforeend', _logRowsHtml(res.entries) + _logOlderBtnHtml());
+});
+
 $('#clear-log-btn').addEventListener('click', async () => {
   if (_logTab === 'history') {
     await callApi('clear_session_history');
@@ -327,16 +400,24 @@ $('#clear-history-btn').addEventListener('click', async () => {
   toast('History cleared', 'info');
 });
 
-async function renderHistory() {
+const _HISTORY_PAGE = 50;
+let _historyShown = 0;
+
+async function renderHistory(more = false) {
   const list = $('#session-list');
   if (!list) return;
+  const offset = more ? _historyShown : 0;
   let sessions;
-  try { sessions = await callApi('get_session_history'); } catch(e) { return; }
-  if (!sessions || !sessions.length) {
+  try { sessions = await callApi('get_session_history', _HISTORY_PAGE, offset); } catch(e) { return; }
+  if (!more && (!sessions || !sessions.length)) {
     list.innerHTML = '<div class="log-empty">No sessions recorded yet. They appear here after iRacing closes.</div>';
     return;
   }
-  list.innerHTML = sessions.map(s => {
+  sessions = sessions || [];
+  _historyShown = offset + sessions.length;
+  const olderBtn = sessions.length === _HISTORY_PAGE
+    ? '<button class="btn log-older-btn" id="history-older-btn">Load older</button>' : '';
+  const html = sessions.map(s => {
     const dur  = _fmtDuration(s.duration_seconds);
     const date = _fmtDate(s.started_at);
     const chips = (s.apps_launched || []).map(a =>
@@ -351,9 +432,20 @@ async function renderHistory() {
         ? `<div class="session-apps">${chips}</div>`
         : '<div style="color:var(--text-muted);font-size:12px">No apps launched</div>'}
     </div>`;
-  }).join('');
+  }).join('') + olderBtn;
+  if (more) {
+    const btn = $('#history-older-btn');
+    if (btn) btn.remove();
+    list.insertAdjacentHTML('beforeend', html);
+  } else {
+    list.innerHTML = html;
+  }
 }
 
+$('#session-list').addEventListener('click', e => {
+  if (e.target.closest('#history-older-btn')) renderHistory(true);
+});
+
 function _fmtDuration(secs) {
   if (!secs || secs < 60) return `${Math.round(secs || 0)}s`;
   const m = Math.floor(secs / 60), s = Math.round(secs % 60);
@@ -428,17 +520,21 @@ function appCard(a) {
   if (a.start_minimized)          badges.push('<span class="app-badge">Minimized</span>');
   if (a.start_if_already_running) badges.push('<span class="app-badge">Allow duplicate</span>');
   if (!a.kill_on_iracing_exit)    badges.push('<span class="app-badge keep">Keeps running</span>');
+  if (a.suspend_while_driving)    badges.push('<span class="app-badge">Suspended while driving</span>');
   if (a.enabled === false)        badges.push('<span class="app-badge" style="color:var(--text-muted)">Disabled</span>');
   const badgeHtml = badges.length ? `<div class="app-card-badges">${badges.join('')}</div>` : '';
   const isRunning   = _runningAppIds.has(a.app_id);
   const disabledClass = a.enabled === false ? ' disabled' : '';
-  const runningClass  = isRunning ? ' running' : '';
+  const isSuspended   = _suspendedAppIds.has(a.app_id);
+  const runningClass  = isRunning ? (isSuspended ? ' running suspended' : ' running') : '';
+  const problems      = _launchProblems[a.app_id] || [];
+  const problemClass  = problems.length ? ' launch-problem' : '';
   const toggleTitle = a.enabled !== false ? 'Disable app' : 'Enable app';
   const toggleIcon = a.enabled !== false
     ? `<svg viewBox="0 0 16 16" fill="none" width="14" height="14"><path d="M3 8l4 4 6-7" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/><rect x="1.5" y="1.5" width="13" height="13" rx="2" stroke="currentColor" stroke-width="1.4"/></svg>`
     : `<svg viewBox="0 0 16 16" fill="none" width="14" height="14"><circle cx="8" cy="8" r="6" stroke="currentColor" stroke-width="1.4"/><path d="M5.5 5.5l5 5M10.5 5.5l-5 5" stroke="currentColor" stroke-width="1.4" stroke-linecap="round"/></svg>`;
   return `
-    <div class="app-card${disabledClass}${runningClass}" data-id="${esc(a.app_id)}" data-exe="${esc(a.executable_path)}" draggable="true">
+    <div class="app-card${disabledClass}${runningClass}${problemClass}" data-id="${esc(a.app_id)}" data-exe="${esc(a.executable_path)}" draggable="true">
       <div class="drag-handle" title="Drag to reorder">
         <svg viewBox="0 0 16 16" fill="none" width="12" height="12"><path d="M3 5h10M3 8h10M3 11h10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/></svg>
       </div>
@@ -455,7 +551,8 @@ function appCard(a) {
         <div class="app-card-name">${esc(a.name)}</div>
         <div class="app-card-path" title="${esc(a.executable_path)}">${esc(a.executable_path)}</div>
         ${badgeHtml}
-        <div class="app-running-pip">Running</div>
+        <div class="app-running-pip">${isSuspended ? 'Suspended' : 'Running'}</div>
+        <div class="app-problem-pip" title="${esc(problems.join('\n'))}">${esc(problems.join(' · '))}</div>
       </div>
       <div class="app-card-actions">
         <button class="icon-btn" title="${esc(toggleTitle)}" data-action="toggle">${toggleIcon}</button>
@@ -623,11 +720,15 @@ function openAppModal(appId) {
     $('#fm-kill-on-exit').checked  = true;
     $('#fm-kill-tree').checked     = true;
     $('#fm-restart-on-crash').checked = false;
+    $('#fm-suspend-driving').checked = false;
     $('#fm-max-restarts').value = '3';
     $('#fm-max-restarts-group').style.display = 'none';
     $('#fm-grace').value = '0';
     $('#fm-wait-for').value = '';
     $('#fm-wait-timeout').value = '30';
+    setSelectValue($('#fm-priority'), '', 'Nice');
+    $('#fm-affinity').value = '';
+    $('#fm-io-priority').value = '';
     const _wtg = $('#fm-wait-timeout-group');
     if (_wtg) _wtg.style.display = 'none';
     openModal('app-modal-backdrop');
@@ -649,17 +750,47 @@ function openAppModal(appId) {
     $('#fm-kill-on-exit').checked  = a.kill_on_iracing_exit !== false;
     $('#fm-kill-tree').checked     = a.kill_process_tree !== false;
     $('#fm-restart-on-crash').checked = !!a.restart_on_crash;
+    $('#fm-suspend-driving').checked = !!a.suspend_while_driving;
     $('#fm-max-restarts').value   = a.max_restart_attempts || 3;
     $('#fm-max-restarts-group').style.display = a.restart_on_crash ? '' : 'none';
     $('#fm-grace').value   = a.shutdown_grace_seconds || 0;
     $('#fm-wait-for').value = a.wait_for_process || '';
     $('#fm-wait-timeout').value   = a.wait_timeout_seconds || 30;
+    setSelectValue($('#fm-priority'), a.priority || '', 'Nice');
+    $('#fm-affinity').value = formatCpuList(a.cpu_affinity || []);
+    $('#fm-io-priority').value = a.io_priority || '';
     const _wtg2 = $('#fm-wait-timeout-group');
     if (_wtg2) _wtg2.style.display = (a.wait_for_process || '').trim() ? '' : 'none';
     openModal('app-modal-backdrop');
   });
 }
 
+// A value set in the config file (e.g. a raw nice value) may have no named
+// option; add one so it stays selectable instead of being lost on save.
+function setSelectValue(sel, value, label) {
+  sel.querySelectorAll('option[data-custom]').forEach(o => o.remove());
+  if (value && ![...sel.options].some(o => o.value === value)) {
+    const opt = document.createElement('option');
+    opt.value = value;
+    opt.textContent = `${label} ${value}`;
+    opt.dataset.custom = '1';
+    sel.appendChild(opt);
+  }
+  sel.value = value;
+}
+
+function formatCpuList(cpus) {
+  const sorted = [...new Set(cpus)].sort((a, b) => a - b);
+  const parts = [];
+  for (let i = 0; i < sorted.length; i++) {
+    let j = i;
+    while (j + 1 < sorted.length && sorted[j + 1] === sorted[j] + 1) j++;
+    parts.push(j > i ? `${sorted[i]}-${sorted[j]}` : `${sorted[i]}`);
+    i = j;
+  }
+  return parts.join(',');
+}
+
 $('#app-modal-save').addEventListener('click', async () => {
   const name = $('#fm-name').value.trim();
   const exe  = $('#fm-exe').value.trim();
@@ -677,10 +808,14 @@ $('#app-modal-save').addEventListener('click', async () => {
     kill_on_iracing_exit: $('#fm-kill-on-exit').checked,
     kill_process_tree:    $('#fm-kill-tree').checked,
     restart_on_crash:     $('#fm-restart-on-crash').checked,
+    suspend_while_driving: $('#fm-suspend-driving').checked,
     max_restart_attempts: parseInt($('#fm-max-restarts').value) || 3,
     shutdown_grace_seconds: parseFloat($('#fm-grace').value) || 0,
     wait_for_process:     $('#fm-wait-for').value.trim(),
     wait_timeout_seconds: parseFloat($('#fm-wait-timeout').value) || 30,
+    priority:             $('#fm-priority').value,
+    cpu_affinity:         $('#fm-affinity').value.trim(),
+    io_priority:          $('#fm-io-priority').value,
   };
 
   const json = JSON.stringify(appData);
@@ -976,9 +1111,26 @@ async function openTriggersModal(profileId) {
   if (modeRadio) modeRadio.checked = true;
   const customGroup = $('#triggers-custom-group');
   if (customGroup) customGroup.style.display = mode === 'custom' ? '' : 'none';
+  const policy = p.trigger_policy || {};
+  $('#triggers-policy-enabled').checked = !!policy.enabled;
+  setSelectValue($('#triggers-policy-priority'), policy.priority || 'above_normal', 'Nice');
+  $('#triggers-policy-cores').value = formatCpuList(policy.reserved_cores || []);
+  $('#triggers-policy-group').style.display = policy.enabled ? '' : 'none';
   openModal('triggers-modal-backdrop');
 }
 
+$('#triggers-policy-enabled').addEventListener('change', e => {
+  $('#triggers-policy-group').style.display = e.target.checked ? '' : 'none';
+});
+
+async function saveTriggerPolicy(id) {
+  return callApi('set_profile_trigger_policy', id, JSON.stringify({
+    enabled:        $('#triggers-policy-enabled').checked,
+    priority:       $('#triggers-policy-priority').value,
+    reserved_cores: $('#triggers-policy-cores').value.trim(),
+  }));
+}
+
 $$('input[name="trigger-mode-profile"]').forEach(r => {
   r.addEventListener('change', () => {
     const customGroup = $('#triggers-custom-group');
@@ -990,6 +1142,11 @@ $$('input[name="trigger-mode-profile"]').forEach(r => {
 
 $('#triggers-modal-save').addEventListener('click', async () => {
   const id   = $('#triggers-profile-id').value;
+  const policyRes = await saveTriggerPolicy(id);
+  if (!policyRes || !policyRes.ok) {
+    toast((policyRes && policyRes.error) || 'Failed to save trigger tuning', 'error');
+    return;
+  }
   const mode = (document.querySelector('input[name="trigger-mode-profile"]:checked') || {}).value || 'custom';
   if (mode !== 'custom') {
     const res = await callApi('set_profile_trigger_mode', id, mode);
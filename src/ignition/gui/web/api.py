@@ -12,13 +12,24 @@ from uuid import uuid4
 import webview
 
 from ignition.core.app_launcher import launch_executable
-from ignition.core.models import ManagedApp, Profile
+from ignition.core.models import ManagedApp, Profile, TriggerProcessPolicy
 from ignition.core.state import AppState
+from ignition.core.tuning_policy import parse_cpu_list
 from ignition.core.windows_autostart import WindowsAutostart
 
 logger = logging.getLogger(__name__)
 
 
+def _validate_cpu_list(raw: Any) -> str | None:
+    if not isinstance(raw, str):
+        return None
+    try:
+        parse_cpu_list(raw)
+    except ValueError:
+        return f"CPU cores must look like 4-7 or 0,2,4 (got {raw!r})."
+    return None
+
+
 class IgnitionApi:
     """JS-to-Python bridge exposed via window.pywebview.api."""
 
@@ -72,14 +83,20 @@ class IgnitionApi:
         paused = self._state.controller.is_paused()
         session_type = self._state.controller.get_session_type() if iracing_running else None
         running_app_ids = self._state.controller.get_running_app_ids()
+        suspended_app_ids = self._state.controller.get_suspended_app_ids()
         session_start_at = self._state.controller.get_session_start_at()
+        launch_problems = self._state.controller.get_launch_problems()
+        resource_usage = self._state.controller.get_resource_usage()
         return {
             "iracing_running": iracing_running,
             "managed_count": managed_count,
             "paused": paused,
             "session_type": session_type,
             "running_app_ids": running_app_ids,
+            "suspended_app_ids": suspended_app_ids,
             "session_start_at": session_start_at,
+            "launch_problems": launch_problems,
+            "resource_usage": resource_usage,
         }
 
     def get_profiles(self) -> list[dict[str, Any]]:
@@ -139,6 +156,7 @@ class IgnitionApi:
             return {"ok": False, "error": "Profile not found."}
         cfg.active_profile_id = profile_id
         self._state.config_store.save()
+        self._state.controller.schedule_warm_up()
         self._notify_profiles_changed()
         return {"ok": True}
 
@@ -169,6 +187,24 @@ class IgnitionApi:
         self._state.config_store.save()
         return {"ok": True}
 
+    def set_profile_trigger_policy(self, profile_id: str, policy_json: str) -> dict[str, Any]:
+        try:
+            raw = json.loads(policy_json)
+        except json.JSONDecodeError as exc:
+            return {"ok": False, "error": str(exc)}
+        if not isinstance(raw, dict):
+            return {"ok": False, "error": "Invalid policy."}
+        error = _validate_cpu_list(raw.get("reserved_cores"))
+        if error:
+            return {"ok": False, "error": error}
+        cfg = self._state.config_store.config
+        profile = next((p for p in cfg.profiles if p.profile_id == profile_id), None)
+        if profile is None:
+            return {"ok": False, "error": "Profile not found."}
+        profile.trigger_policy = TriggerProcessPolicy.from_dict(raw)
+        self._state.config_store.save()
+        return {"ok": True}
+
     def rename_profile(self, profile_id: str, name: str) -> dict[str, Any]:
         name = name.strip()
         if not name:
@@ -215,10 +251,14 @@ class IgnitionApi:
             return {"ok": False, "error": "Executable path is required."}
         if not name:
             return {"ok": False, "error": "Name is required."}
+        error = _validate_cpu_list(raw.get("cpu_affinity"))
+        if error:
+            return {"ok": False, "error": error}
 
         app = ManagedApp.from_dict({**raw, "app_id": str(uuid4())})
         self._active_profile().apps.append(app)
         self._state.config_store.save()
+        self._state.controller.schedule_warm_up()
         return {"ok": True, "app_id": app.app_id}
 
     def edit_app(self, app_json: str) -> dict[str, Any]:
@@ -235,9 +275,13 @@ class IgnitionApi:
         idx = next((i for i, a in enumerate(profile.apps) if a.app_id == app_id), None)
         if idx is None:
             return {"ok": False, "error": "App not found."}
+        error = _validate_cpu_list(raw.get("cpu_affinity"))
+        if error:
+            return {"ok": False, "error": error}
 
         profile.apps[idx] = ManagedApp.from_dict(raw)
         self._state.config_store.save()
+        self._state.controller.schedule_warm_up()
         return {"ok": True}
 
     def remove_app(self, app_id: str) -> dict[str, Any]:
@@ -257,6 +301,7 @@ class IgnitionApi:
         pos = max(0, min(int(position), len(profile.apps)))
         profile.apps.insert(pos, app)
         self._state.config_store.save()
+        self._state.controller.schedule_warm_up()
         return {"ok": True}
 
     def reorder_apps(self, ordered_ids_json: str) -> dict[str, Any]:
@@ -278,6 +323,7 @@ class IgnitionApi:
             return {"ok": False, "error": "App not found."}
         app.enabled = not app.enabled
         self._state.config_store.save()
+        self._state.controller.schedule_warm_up()
         return {"ok": True, "enabled": app.enabled}
 
     def test_launch_app(self, app_id: str) -> dict[str, Any]:
@@ -329,6 +375,15 @@ class IgnitionApi:
             self._state.controller.resume()
         return {"ok": True, "paused": paused}
 
+    def get_launch_plan(self) -> dict[str, Any]:
+        return self._state.controller.get_launch_plan()
+
+    def get_launch_metrics(self) -> dict[str, Any]:
+        return self._state.controller.get_launch_metrics()
+
+    def get_termination_stats(self) -> dict[str, dict]:
+        return self._state.controller.get_termination_stats()
+
     def get_log_since(self, seq: int) -> list[dict]:
         return self._state.controller.get_log_since(seq)
 
@@ -336,8 +391,37 @@ class IgnitionApi:
         self._state.controller.clear_log()
         return {"ok": True}
 
-    def get_session_history(self) -> list[dict]:
-        return self._state.controller.get_session_history()
+    def query_activity_log(self, query_json: str) -> dict[str, Any]:
+        """Page through the on-disk activity journal, newest first.
+
+        Accepts ``since``/``until`` (epoch seconds), ``types`` (list), ``app``,
+        ``before`` (the previous page's ``next_cursor``) and ``limit``.
+        """
+        try:
+            raw = json.loads(query_json or "{}")
+            page = self._state.controller.query_journal(
+                since=float(raw["since"]) if raw.get("since") is not None else None,
+                until=float(raw["until"]) if raw.get("until") is not None else None,
+                types=[str(t) for t in raw.get("types") or []] or None,
+                app=str(raw.get("app") or "") or None,
+                before=str(raw.get("before") or "") or None,
+                limit=min(max(int(raw.get("limit") or 100), 1), 500),
+            )
+        except (json.JSONDecodeError, TypeError, ValueError) as exc:
+            return {"ok": False, "error": str(exc)}
+        return {"ok": True, **page.to_dict()}
+
+    def get_session_history(
+        self, limit: int = 50, offset: int = 0, profile_id: str = ""
+    ) -> list[dict]:
+        return self._state.controller.get_session_history(
+            limit=min(max(int(limit), 1), 500),
+            offset=max(int(offset), 0),
+            profile_id=profile_id or None,
+        )
+
+    def get_session_stats(self) -> dict[str, Any]:
+        return self._state.controller.get_session_stats()
 
     def clear_session_history(self) -> dict[str, Any]:
         self._state.controller.clear_session_history()
@@ -463,6 +547,10 @@ class IgnitionApi:
             "iracing_exe_path": cfg.iracing_exe_path,
             "trigger_mode": cfg.trigger_mode,
             "notification_mode": cfg.notification_mode,
+            "shutdown_timeout_seconds": cfg.shutdown_timeout_seconds,
+            "prefetch_executables": cfg.prefetch_executables,
+            "activity_log_capacity": cfg.activity_log_capacity,
+            "cpu_budget_percent": cfg.cpu_budget_percent,
         }
 
     def save_settings(self, settings_json: str) -> dict[str, Any]:
@@ -474,6 +562,17 @@ class IgnitionApi:
         if poll_interval <= 0:
             return {"ok": False, "error": "Poll interval must be greater than zero."}
         cfg = self._state.config_store.config
+        shutdown_timeout = float(
+            raw.get("shutdown_timeout_seconds") or cfg.shutdown_timeout_seconds
+        )
+        if shutdown_timeout <= 0:
+            return {"ok": False, "error": "Shutdown timeout must be greater than zero."}
+        log_capacity = int(raw.get("activity_log_capacity") or cfg.activity_log_capacity)
+        if log_capacity < 1:
+            return {"ok": False, "error": "Activity log size must be at least one entry."}
+        cpu_budget = float(raw.get("cpu_budget_percent", cfg.cpu_budget_percent) or 0.0)
+        if cpu_budget < 0:
+            return {"ok": False, "error": "CPU budget cannot be negative."}
         cfg.poll_interval_seconds = poll_interval
         cfg.minimize_to_tray = bool(raw.get("minimize_to_tray", True))
         cfg.iracing_exe_path = str(raw.get("iracing_exe_path") or "").strip()
@@ -495,7 +594,15 @@ class IgnitionApi:
         cfg.notification_mode = str(raw.get("notification_mode") or "always")
         if cfg.notification_mode not in ("always", "never"):
             cfg.notification_mode = "always"
+        cfg.shutdown_timeout_seconds = shutdown_timeout
+        cfg.prefetch_executables = bool(
+            raw.get("prefetch_executables", cfg.prefetch_executables)
+        )
+        cfg.activity_log_capacity = log_capacity
+        cfg.cpu_budget_percent = cpu_budget
         self._state.config_store.save()
+        self._state.controller.set_log_capacity(log_capacity)
+        self._state.controller.schedule_warm_up()
         return {"ok": True}
 
     def launch_iracing(self) -> dict[str, Any]:
@@ -610,6 +717,7 @@ class IgnitionApi:
     def import_config(self, path: str) -> dict[str, Any]:
         try:
             self._state.config_store.import_from_file(Path(path))
+            self._state.controller.schedule_warm_up()
             self._notify_profiles_changed()
             return {"ok": True}
         except Exception as exc:
@@ -627,7 +735,12 @@ class IgnitionApi:
     def quit_app(self) -> None:
         if self._force_quit_setter is not None:
             self._force_quit_setter()
-        self._state.controller.stop()
+        reports = self._state.controller.stop()
+        if reports:
+            logger.info(
+                "Shutdown: %s",
+                ", ".join(f"{r.name}={r.outcome} ({r.duration_seconds:.1f}s)" for r in reports),
+            )
         if self._window is not None:
             self._window.destroy()
 
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import json
 import logging
 import sys
 import threading
-import time
 from pathlib import Path
 
 import webview
@@ -12,6 +10,7 @@ import webview
 from ignition.core.state import AppState
 from ignition.gui.tray import SystemTray
 from ignition.gui.web.api import IgnitionApi
+from ignition.gui.web.status_push import StatusPusher
 
 
 logger = logging.getLogger(__name__)
@@ -26,51 +25,20 @@ def _get_assets_dir() -> Path:
 _ASSETS_DIR = _get_assets_dir()
 
 
-def _run_status_push(api: IgnitionApi, window: webview.Window, stop_event: threading.Event) -> None:
-    """Background thread: push iRacing status + log updates to the frontend."""
-    last_log_seq = 0
-
-    while not stop_event.is_set():
-        time.sleep(0.8)
-        if stop_event.is_set():
-            return
-        try:
-            status = api.get_status()
-            new_entries = api.get_log_since(last_log_seq)
-            if new_entries:
-                last_log_seq = new_entries[-1]["seq"] + 1
-
-            status_js = json.dumps({
-                "iracing_running":  status["iracing_running"],
-                "managed_count":    status["managed_count"],
-                "paused":           status["paused"],
-                "session_type":     status.get("session_type"),
-                "running_app_ids":  status.get("running_app_ids", []),
-                "session_start_at": status.get("session_start_at"),
-            })
-            entries_js = json.dumps(new_entries)
-            js = (
-                f"window.__ignitionStatusUpdate && "
-                f"window.__ignitionStatusUpdate({status_js}, {entries_js})"
-            )
-            window.evaluate_js(js)
-        except Exception:
-            continue
-
-
 def run_webview(*, state: AppState, start_in_background: bool) -> int:
     api = IgnitionApi(state=state)
     state.controller.start()
 
     _window_ref: list[webview.Window | None] = [None]
-    _push_stop = threading.Event()
     _force_quit: list[bool] = [False]
+    _push_started: list[bool] = [False]
 
     def tray_open() -> None:
         w = _window_ref[0]
         if w:
             try:
                 w.show()
+                pusher.set_visible(True)
             except Exception:
                 pass
 
@@ -101,6 +69,13 @@ def run_webview(*, state: AppState, start_in_background: bool) -> int:
     )
 
     _window_ref[0] = window
+    pusher = StatusPusher(
+        get_status=api.get_status,
+        get_log_since=api.get_log_since,
+        evaluate_js=window.evaluate_js,
+        visible=not start_in_background,
+    )
+    state.controller.add_change_listener(pusher.mark_changed)
     api.bind_window(window)
     api.bind_force_quit(lambda: _force_quit.__setitem__(0, True))
     api.bind_profiles_changed(tray.rebuild_menu)
@@ -147,13 +122,11 @@ def run_webview(*, state: AppState, start_in_background: bool) -> int:
             pass
 
     def on_loaded() -> None:
-        push_thread = threading.Thread(
-            target=_run_status_push,
-            args=(api, window, _push_stop),
-            daemon=True,
-            name="status-push",
-        )
-        push_thread.start()
+        if not _push_started[0]:
+            _push_started[0] = True
+            threading.Thread(target=pusher.run, daemon=True, name="status-push").start()
+        else:
+            pusher.resync()  # page reloaded: its state is gone
         icon_thread = threading.Thread(target=_apply_window_icon, daemon=True, name="win-icon")
         icon_thread.start()
 
@@ -163,6 +136,7 @@ def run_webview(*, state: AppState, start_in_background: bool) -> int:
         if state.config_store.config.minimize_to_tray:
             try:
                 window.hide()
+                pusher.set_visible(False)
             except Exception:
                 pass
             return False
@@ -170,11 +144,14 @@ def run_webview(*, state: AppState, start_in_background: bool) -> int:
 
     window.events.loaded += on_loaded
     window.events.closing += on_closing
+    window.events.shown += lambda: pusher.set_visible(True)
+    window.events.minimized += lambda: pusher.set_visible(False)
+    window.events.restored += lambda: pusher.set_visible(True)
 
     try:
         webview.start(debug=False, private_mode=False)
     finally:
-        _push_stop.set()
+        pusher.stop()
         state.controller.stop()
         tray.stop()
 
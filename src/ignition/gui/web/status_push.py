@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+FRAME_SECONDS = 1 / 60
+
+_MISSING = object()
+
+
+class StatusPusher:
+    """Pushes status and log updates to the frontend when something changed.
+
+    ``mark_changed`` (hooked to the controller's change listener) only sets a
+    flag; the push thread folds every change within a frame into one update
+    that carries just the fields that differ from the last one sent. Nothing
+    is pushed, or computed, while the window is hidden; showing it sends one
+    full snapshot.
+    """
+
+    def __init__(
+        self,
+        *,
+        get_status: Callable[[], dict[str, Any]],
+        get_log_since: Callable[[int], list[dict]],
+        evaluate_js: Callable[[str], Any],
+        visible: bool = True,
+        frame_seconds: float = FRAME_SECONDS,
+    ) -> None:
+        self._get_status = get_status
+        self._get_log_since = get_log_since
+        self._evaluate_js = evaluate_js
+        self._frame_seconds = frame_seconds
+        self._cond = threading.Condition(threading.Lock())
+        self._visible = visible
+        self._dirty = False
+        self._needs_full = True
+        self._stopped = False
+        self._sent: dict[str, Any] = {}
+        self._log_seq = 0
+        self.push_count = 0
+
+    def mark_changed(self) -> None:
+        with self._cond:
+            self._dirty = True
+            self._cond.notify()
+
+    def set_visible(self, visible: bool) -> None:
+        with self._cond:
+            if visible and not self._visible:
+                self._needs_full = True
+            self._visible = visible
+            self._cond.notify()
+
+    def resync(self) -> None:
+        """Send a full snapshot next, e.g. after the page reloaded."""
+        with self._cond:
+            self._needs_full = True
+            self._cond.notify()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped and not (
+                    self._visible and (self._dirty or self._needs_full)
+                ):
+                    self._cond.wait()
+                if self._stopped:
+                    return
+            # Give the rest of a burst a frame to land, so it goes out as one push.
+            if self._frame_seconds > 0:
+                time.sleep(self._frame_seconds)
+            with self._cond:
+                full, self._needs_full = self._needs_full, False
+                self._dirty = False
+            try:
+                self.push(full=full)
+            except Exception:
+                logger.debug("Status push failed", exc_info=True)
+                if full:
+                    self._sent = {}  # the next push carries every field
+
+    def push(self, *, full: bool = False) -> bool:
+        """Send what changed since the last push (everything if ``full``); False if nothing did.
+
+        Nothing is recorded as sent unless ``evaluate_js`` returns, so a failed
+        push is folded into the next one.
+        """
+        status = self._get_status()
+        entries = self._get_log_since(self._log_seq)
+        if full:
+            changes = status
+        else:
+            changes = {k: v for k, v in status.items() if self._sent.get(k, _MISSING) != v}
+            if not changes and not entries:
+                return False
+        handler = "__ignitionStatusUpdate" if full else "__ignitionStatusPatch"
+        self._evaluate_js(
+            f"window.{handler} && window.{handler}({json.dumps(changes)}, {json.dumps(entries)})"
+        )
+        self._sent.update(changes)
+        if entries:
+            self._log_seq = entries[-1]["seq"] + 1
+        self.push_count += 1
+        return True
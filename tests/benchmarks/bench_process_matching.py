@@ -0,0 +1,226 @@
+"""Process-matching benchmarks over synthetic process tables.
+
+Run directly to print a report, or with ``--update-baseline`` to store the
+current numbers as the reference the regression test compares against::
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_process_matching [--update-baseline]
+
+Latencies are stored in units of a fixed pure-Python calibration loop rather
+than seconds, so a baseline recorded on one machine is still meaningful on
+another. Allocations are the tracemalloc peak of a single call.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from ignition.core import process_utils
+from ignition.core.process_utils import ExePathCache, ProcessTable
+
+from tests.benchmarks.fake_processes import FakeProcessTable, fake_psutil
+
+SIZES = (100, 1_000, 10_000)
+BASELINE_DIR = Path(__file__).with_name("baselines")
+
+# A measurement regresses when it exceeds baseline * ratio (+ slack for allocations).
+LATENCY_TOLERANCE = 2.0
+ALLOC_TOLERANCE = 1.25
+ALLOC_SLACK_KIB = 4.0
+
+_TRIGGERS = ["iRacingUI.exe", "iRacingSim64DX11.exe"]
+_MISSING_EXE = r"C:\Program Files (x86)\iRacing\ui\iRacingUI.exe"
+
+
+def _case_table_refresh_cold(table: FakeProcessTable) -> Callable[[], Any]:
+    return lambda: ProcessTable().refresh()
+
+
+def _case_table_refresh_steady(table: FakeProcessTable) -> Callable[[], Any]:
+    warm = ProcessTable()
+    warm.refresh()
+    warm.refresh()  # second pass re-checks the young entries; steady state from here
+    return warm.refresh
+
+
+def _case_any_process_name_running(table: FakeProcessTable) -> Callable[[], Any]:
+    process_utils.any_process_name_running(_TRIGGERS, max_age_seconds=3600)
+    return lambda: process_utils.any_process_name_running(_TRIGGERS, max_age_seconds=3600)
+
+
+def _case_any_process_exe_running(table: FakeProcessTable) -> Callable[[], Any]:
+    process_utils.any_process_exe_running(_MISSING_EXE, max_age_seconds=3600)
+    return lambda: process_utils.any_process_exe_running(_MISSING_EXE, max_age_seconds=3600)
+
+
+def _case_any_process_exe_running_cold(table: FakeProcessTable) -> Callable[[], Any]:
+    """Every path normalized afresh: what each query cost before the exe cache."""
+    snap = process_utils.shared_process_snapshots().get(max_age_seconds=3600)
+
+    def run() -> Any:
+        object.__setattr__(snap, "exe_paths", ExePathCache())
+        return snap.any_exe_running(_MISSING_EXE)
+
+    return run
+
+
+def _case_normalize_windows_path(table: FakeProcessTable) -> Callable[[], Any]:
+    paths = [info.exe for info in table.by_pid.values()]
+    state = {"i": 0}
+
+    def run() -> Any:
+        i = state["i"] = (state["i"] + 1) % len(paths)
+        return process_utils.normalize_windows_path(paths[i])
+
+    return run
+
+
+CASES: dict[str, Callable[[FakeProcessTable], Callable[[], Any]]] = {
+    "table_refresh_cold": _case_table_refresh_cold,
+    "table_refresh_steady": _case_table_refresh_steady,
+    "any_process_name_running": _case_any_process_name_running,
+    "any_process_exe_running": _case_any_process_exe_running,
+    "any_process_exe_running_cold": _case_any_process_exe_running_cold,
+    "normalize_windows_path": _case_normalize_windows_path,
+}
+
+
+def _per_call_seconds(fn: Callable[[], Any], *, min_total: float = 0.02, repeat: int = 5) -> float:
+    """Best-of-``repeat`` mean per call, each round running for at least ``min_total``."""
+    started = time.perf_counter()
+    fn()
+    single = max(time.perf_counter() - started, 1e-7)
+    number = max(1, int(min_total / single))
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+def _peak_alloc_kib(fn: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0.0, (peak - before) / 1024.0)
+
+
+def calibrate() -> float:
+    """Seconds for a fixed dict/str/sort workload; the unit latencies are stored in."""
+
+    def work() -> None:
+        table = {i: f"proc{i}.exe" for i in range(2_000)}
+        sorted(v.lower() for v in table.values())
+
+    return _per_call_seconds(work, repeat=7)
+
+
+def run(sizes: tuple[int, ...] = SIZES, cases: tuple[str, ...] | None = None) -> dict[str, Any]:
+    unit = calibrate()
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for size in sizes:
+        for name in cases or tuple(CASES):
+            with fake_psutil(FakeProcessTable(size)) as table:
+                fn = CASES[name](table)
+                seconds = _per_call_seconds(fn)
+                alloc = _peak_alloc_kib(fn)
+            results.setdefault(name, {})[str(size)] = {
+                "us_per_call": round(seconds * 1e6, 2),
+                "latency_units": round(seconds / unit, 4),
+                "peak_alloc_kib": round(alloc, 1),
+            }
+    return {"platform": sys.platform, "calibration_us": round(unit * 1e6, 2), "results": results}
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    latency_tolerance: float = LATENCY_TOLERANCE,
+    alloc_tolerance: float = ALLOC_TOLERANCE,
+) -> list[str]:
+    """Human-readable regressions of ``current`` against ``baseline``; empty when none."""
+    problems = []
+    for name, by_size in current["results"].items():
+        for size, got in by_size.items():
+            ref = baseline.get("results", {}).get(name, {}).get(size)
+            if ref is None:
+                continue
+            limit = ref["latency_units"] * latency_tolerance
+            if got["latency_units"] > limit:
+                problems.append(
+                    f"{name}[{size}] latency {got['latency_units']:.4g} units"
+                    f" > {limit:.4g} (baseline {ref['latency_units']:.4g})"
+                )
+            limit = ref["peak_alloc_kib"] * alloc_tolerance + ALLOC_SLACK_KIB
+            if got["peak_alloc_kib"] > limit:
+                problems.append(
+                    f"{name}[{size}] peak alloc {got['peak_alloc_kib']:.1f} KiB"
+                    f" > {limit:.1f} (baseline {ref['peak_alloc_kib']:.1f})"
+                )
+    return problems
+
+
+def baseline_path(platform: str = sys.platform) -> Path:
+    return BASELINE_DIR / f"{platform}.json"
+
+
+def load_baseline(platform: str = sys.platform) -> dict[str, Any] | None:
+    try:
+        return json.loads(baseline_path(platform).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def format_report(report: dict[str, Any]) -> str:
+    lines = [f"calibration unit: {report['calibration_us']} us ({report['platform']})"]
+    lines.append(f"{'case':<30} {'procs':>6} {'us/call':>12} {'units':>10} {'peak KiB':>10}")
+    for name, by_size in report["results"].items():
+        for size, r in by_size.items():
+            lines.append(
+                f"{name:<30} {size:>6} {r['us_per_call']:>12.2f}"
+                f" {r['latency_units']:>10.4f} {r['peak_alloc_kib']:>10.1f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--case", action="append", choices=sorted(CASES), dest="cases")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run(tuple(args.sizes), tuple(args.cases) if args.cases else None)
+    print(format_report(report))
+
+    if args.update_baseline:
+        path = baseline_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {path}")
+        return 0
+
+    baseline = load_baseline()
+    if baseline is None:
+        print(f"no baseline for {sys.platform}; run with --update-baseline")
+        return 0
+    problems = compare(report, baseline)
+    for problem in problems:
+        print(f"REGRESSION: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""End-to-end session lifecycle benchmark against real processes (Linux only).
+
+A real ``IgnitionController`` runs against a throwaway ``ConfigStore``. A
+dummy process renamed to ``iRacingUI.exe`` acts as the trigger, and the
+profile's apps are dummies too: start delays, a ``wait_for_process`` chain,
+a kill-tree app with children, one that takes its grace period and one
+that ignores SIGTERM until it is killed. Each round measures::
+
+    first_launch_ms    trigger spawned -> first app started
+    all_launched_ms    trigger spawned -> every app started
+    all_stopped_ms     trigger exited  -> every app (and child) gone
+    cpu_ms             CPU used by iGnition's threads over the round
+    idle_cpu_percent   iGnition's CPU while monitoring with no trigger running
+
+Run it with ``PYTHONPATH=src python -m tests.benchmarks.bench_session_lifecycle``;
+``--update-baseline`` stores the medians the regression test compares against.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import psutil
+
+from ignition.core.config_store import ConfigStore
+from ignition.core.ignition_controller import IgnitionController
+from ignition.core.models import AppConfig, ManagedApp
+from ignition.core.paths import AppPaths
+
+DUMMY = Path(__file__).with_name("dummy_process.py")
+BASELINE_PATH = Path(__file__).with_name("baselines") / "lifecycle-linux.json"
+TRIGGER_NAME = "iRacingUI.exe"
+
+# Regression limits: baseline * ratio + slack. Latencies here are dominated
+# by poll intervals and configured delays, so they are compared in plain ms.
+LATENCY_TOLERANCE = 1.5
+LATENCY_SLACK_MS = 250.0
+CPU_TOLERANCE = 2.0
+CPU_SLACK_MS = 100.0
+
+METRICS = ("first_launch_ms", "all_launched_ms", "all_stopped_ms", "cpu_ms", "idle_cpu_percent")
+
+
+def _dummy_app(name: str, *, children: int = 0, ignore_term: bool = False,
+               exit_delay: float = 0.0, **fields: Any) -> ManagedApp:
+    app = ManagedApp.create(name=name, executable_path=sys.executable)
+    args = [str(DUMMY), "--name", name, "--children", str(children)]
+    if ignore_term:
+        args.append("--ignore-term")
+    if exit_delay:
+        args += ["--exit-delay", str(exit_delay)]
+    app.arguments = " ".join(args)
+    app.start_if_already_running = True
+    for key, value in fields.items():
+        setattr(app, key, value)
+    return app
+
+
+def scenario_apps() -> list[ManagedApp]:
+    return [
+        _dummy_app("overlay.exe", children=2, kill_process_tree=True),
+        _dummy_app("telemetry.exe", start_delay_seconds=0.3),
+        _dummy_app("spotter.exe", wait_for_process="overlay.exe", wait_timeout_seconds=10),
+        _dummy_app("relay.exe", wait_for_process="spotter.exe", wait_timeout_seconds=10),
+        _dummy_app("hud.exe", exit_delay=0.2, shutdown_grace_seconds=1.0),
+        _dummy_app("stubborn.exe", ignore_term=True, shutdown_grace_seconds=0.5),
+    ]
+
+
+def make_controller(root: Path, apps: list[ManagedApp], *, poll_interval: float) -> IgnitionController:
+    paths = AppPaths(config_dir=root / "config", log_dir=root / "logs")
+    config = AppConfig.default()
+    config.notification_mode = "never"
+    config.poll_interval_seconds = poll_interval
+    config.profiles[0].trigger_process_names = [TRIGGER_NAME]
+    config.profiles[0].apps = apps
+    ConfigStore._save_to_file(paths.config_file, config)
+    return IgnitionController(ConfigStore(paths=paths, config=config))
+
+
+class _OwnCpu:
+    """CPU time of this process minus the calling (harness) thread."""
+
+    def __init__(self) -> None:
+        self._proc = psutil.Process()
+        self._main_tid = threading.get_native_id()
+
+    def _sample(self) -> float:
+        times = self._proc.cpu_times()
+        main = next(
+            (t.user_time + t.system_time for t in self._proc.threads() if t.id == self._main_tid),
+            0.0,
+        )
+        return times.user + times.system - main
+
+    def __enter__(self) -> "_OwnCpu":
+        self.seconds = 0.0
+        self._start = self._sample()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.seconds = self._sample() - self._start
+
+
+def _wait_for_events(
+    controller: IgnitionController, seq: int, event_type: str, count: int, timeout: float
+) -> tuple[list[float], int]:
+    """Monotonic arrival times of the next ``count`` ``event_type`` log entries."""
+    seen: list[float] = []
+    deadline = time.monotonic() + timeout
+    while len(seen) < count:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"saw {len(seen)}/{count} {event_type!r} events")
+        entries = controller.wait_for_log(seq, timeout=remaining)
+        now = time.monotonic()
+        for entry in entries:
+            seq = entry["seq"] + 1
+            if entry["type"] == event_type:
+                seen.append(now)
+    return seen, seq
+
+
+def _alive(pid: int) -> bool:
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
+
+
+def run_round(controller: IgnitionController, app_count: int, *, timeout: float = 30.0) -> dict:
+    backlog = controller.get_log_since(0)
+    seq = backlog[-1]["seq"] + 1 if backlog else 0
+    with _OwnCpu() as cpu:
+        t_trigger = time.monotonic()
+        trigger = psutil.Popen([sys.executable, str(DUMMY), "--name", TRIGGER_NAME])
+        try:
+            launched, seq = _wait_for_events(controller, seq, "launch", app_count, timeout)
+            # Everything iGnition spawned is a child of this process, as is the trigger.
+            tree = {p.pid for p in psutil.Process().children(recursive=True)} - {trigger.pid}
+        finally:
+            trigger.terminate()
+            trigger.wait(5)
+        t_exit = time.monotonic()
+        _wait_for_events(controller, seq, "stop", app_count, timeout)
+        gone_deadline = time.monotonic() + timeout
+        while any(_alive(p) for p in tree):
+            if time.monotonic() > gone_deadline:
+                raise TimeoutError("managed processes still running")
+            time.sleep(0.01)
+        t_stopped = time.monotonic()
+    return {
+        "first_launch_ms": (launched[0] - t_trigger) * 1000.0,
+        "all_launched_ms": (launched[-1] - t_trigger) * 1000.0,
+        "all_stopped_ms": (t_stopped - t_exit) * 1000.0,
+        "cpu_ms": cpu.seconds * 1000.0,
+    }
+
+
+def run(*, rounds: int = 3, poll_interval: float = 0.25, idle_seconds: float = 2.0) -> dict:
+    if not sys.platform.startswith("linux"):
+        raise RuntimeError("the lifecycle benchmark needs Linux (prctl process renaming)")
+    apps = scenario_apps()
+    root = Path(tempfile.mkdtemp(prefix="ignition-bench-"))
+    controller = make_controller(root, apps, poll_interval=poll_interval)
+    controller.start()
+    try:
+        with _OwnCpu() as idle:
+            time.sleep(idle_seconds)
+        samples = [run_round(controller, len(apps)) for _ in range(rounds)]
+    finally:
+        controller.stop()
+        shutil.rmtree(root, ignore_errors=True)
+    summary: dict[str, Any] = {
+        key: round(statistics.median(s[key] for s in samples), 1) for key in METRICS[:-1]
+    }
+    summary["idle_cpu_percent"] = round(idle.seconds / idle_seconds * 100.0, 2)
+    return {
+        "platform": sys.platform,
+        "poll_interval_seconds": poll_interval,
+        "rounds": rounds,
+        "summary": summary,
+        "samples": [{k: round(v, 1) for k, v in s.items()} for s in samples],
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    problems = []
+    for key in METRICS:
+        got, ref = current["summary"].get(key), baseline.get("summary", {}).get(key)
+        if got is None or ref is None:
+            continue
+        if key.endswith("_ms") and key != "cpu_ms":
+            limit = ref * LATENCY_TOLERANCE + LATENCY_SLACK_MS
+        elif key == "cpu_ms":
+            limit = ref * CPU_TOLERANCE + CPU_SLACK_MS
+        else:
+            limit = ref * CPU_TOLERANCE + 1.0  # idle percent
+        if got > limit:
+            problems.append(f"{key} {got:g} > {limit:.1f} (baseline {ref:g})")
+    return problems
+
+
+def load_baseline() -> dict[str, Any] | None:
+    try:
+        return json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run(rounds=args.rounds, poll_interval=args.poll_interval)
+    for key, value in report["summary"].items():
+        print(f"{key:<18} {value:>10}")
+
+    if args.update_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {BASELINE_PATH}")
+        return 0
+    baseline = load_baseline()
+    if baseline is None:
+        print("no baseline; run with --update-baseline")
+        return 0
+    problems = compare(report, baseline)
+    for problem in problems:
+        print(f"REGRESSION: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
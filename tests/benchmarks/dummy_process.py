@@ -0,0 +1,52 @@
+"""A stand-in app for the lifecycle benchmark: renames itself, optionally forks children.
+
+    python dummy_process.py --name iRacingUI.exe [--children 2] [--ignore-term] [--exit-delay 0.2]
+
+The name is set with ``prctl(PR_SET_NAME)``, which is what psutil reports as
+the process name on Linux (at most 15 characters).
+"""
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import signal
+import subprocess
+import sys
+import time
+
+PR_SET_NAME = 15
+
+
+def set_process_name(name: str) -> None:
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    if libc.prctl(PR_SET_NAME, name.encode()[:15], 0, 0, 0) != 0:
+        raise OSError(ctypes.get_errno(), f"prctl(PR_SET_NAME, {name!r}) failed")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--name", required=True)
+    parser.add_argument("--children", type=int, default=0)
+    parser.add_argument("--ignore-term", action="store_true", help="only SIGKILL stops it")
+    parser.add_argument("--exit-delay", type=float, default=0.0, help="seconds to exit on SIGTERM")
+    args = parser.parse_args(argv)
+
+    set_process_name(args.name)
+    for i in range(args.children):
+        subprocess.Popen(
+            [sys.executable, __file__, "--name", f"{args.name[:10]}-c{i}"],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+
+    def on_term(signum: int, frame: object) -> None:
+        time.sleep(args.exit_delay)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, signal.SIG_IGN if args.ignore_term else on_term)
+    while True:
+        time.sleep(3600)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""A synthetic, deterministic stand-in for the parts of psutil that process_utils uses."""
+from __future__ import annotations
+
+import contextlib
+import random
+import types
+from dataclasses import dataclass
+from typing import Iterator
+
+import psutil
+
+from ignition.core import process_utils
+
+_NAMES = (
+    "svchost.exe", "explorer.exe", "chrome.exe", "RuntimeBroker.exe", "SimHub.exe",
+    "Discord.exe", "steam.exe", "conhost.exe", "dwm.exe", "OneDrive.exe",
+)
+
+
+@dataclass(frozen=True)
+class FakeProcessInfo:
+    pid: int
+    name: str
+    exe: str
+    create_time: float
+    access_denied: bool = False  # exe()/create_time() raise AccessDenied
+    vanished: bool = False       # listed by pids() but gone by the time it is looked up
+
+
+class FakeProcess:
+    def __init__(self, table: "FakeProcessTable", pid: int) -> None:
+        info = table.by_pid.get(pid)
+        if info is None or info.vanished:
+            raise psutil.NoSuchProcess(pid)
+        self._info = info
+        self.pid = pid
+
+    @contextlib.contextmanager
+    def oneshot(self) -> Iterator[None]:
+        yield
+
+    def status(self) -> str:
+        return psutil.STATUS_RUNNING
+
+    def name(self) -> str:
+        return self._info.name
+
+    def exe(self) -> str:
+        if self._info.access_denied:
+            raise psutil.AccessDenied(self.pid)
+        return self._info.exe
+
+    def create_time(self) -> float:
+        if self._info.access_denied:
+            raise psutil.AccessDenied(self.pid)
+        return self._info.create_time
+
+    def ppid(self) -> int:
+        return 1
+
+
+class FakeProcessTable:
+    """``size`` processes; about 10% access-denied and 2% vanishing, seeded for repeatability."""
+
+    def __init__(
+        self,
+        size: int,
+        *,
+        seed: int = 1234,
+        denied_ratio: float = 0.10,
+        vanished_ratio: float = 0.02,
+    ) -> None:
+        rng = random.Random(seed)
+        self.by_pid: dict[int, FakeProcessInfo] = {}
+        pid = 4
+        for i in range(size):
+            pid += rng.randint(1, 8) * 4
+            name = _NAMES[i % len(_NAMES)] if i % 7 else f"tool{i}.exe"
+            roll = rng.random()
+            self.by_pid[pid] = FakeProcessInfo(
+                pid=pid,
+                name=name,
+                exe=rf"C:\Program Files\Vendor{i % 50}\{name}",
+                create_time=1_700_000_000.0 + i,
+                access_denied=roll < denied_ratio,
+                vanished=denied_ratio <= roll < denied_ratio + vanished_ratio,
+            )
+        self._next_pid = pid
+
+    def pids(self) -> list[int]:
+        return list(self.by_pid)
+
+    def churn(self, count: int) -> None:
+        """Replace the ``count`` oldest processes with new ones."""
+        for old in list(self.by_pid)[:count]:
+            del self.by_pid[old]
+        for _ in range(count):
+            self._next_pid += 4
+            self.by_pid[self._next_pid] = FakeProcessInfo(
+                pid=self._next_pid,
+                name="new.exe",
+                exe=r"C:\New\new.exe",
+                create_time=1_800_000_000.0 + self._next_pid,
+            )
+
+    def psutil_module(self) -> types.SimpleNamespace:
+        return types.SimpleNamespace(
+            pids=self.pids,
+            Process=lambda pid: FakeProcess(self, pid),
+            NoSuchProcess=psutil.NoSuchProcess,
+            AccessDenied=psutil.AccessDenied,
+            ZombieProcess=psutil.ZombieProcess,
+            STATUS_ZOMBIE=psutil.STATUS_ZOMBIE,
+        )
+
+
+@contextlib.contextmanager
+def fake_psutil(table: FakeProcessTable) -> Iterator[FakeProcessTable]:
+    """Point ``process_utils`` at ``table`` instead of the real OS for the duration.
+
+    The module-level helpers get a fresh shared snapshot service too, so
+    nothing cached from the real process table leaks in (or out).
+    """
+    real_psutil, real_shared = process_utils.psutil, process_utils._shared_snapshots
+    process_utils.psutil = table.psutil_module()
+    process_utils._shared_snapshots = process_utils.ProcessSnapshotService()
+    try:
+        yield table
+    finally:
+        process_utils.psutil, process_utils._shared_snapshots = real_psutil, real_shared
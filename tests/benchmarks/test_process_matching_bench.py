@@ -0,0 +1,83 @@
+"""Regression gate for the process-matching benchmarks.
+
+The fake process source and the comparison are always checked. The timed
+runs only happen with ``IGNITION_BENCH=1`` (``IGNITION_BENCH=full`` adds the
+10,000-process tables), since wall-clock numbers on a busy CI box are noise.
+"""
+import os
+
+import pytest
+
+from ignition.core import process_utils
+from ignition.core.process_utils import ProcessTable
+
+from tests.benchmarks import bench_process_matching as bench
+from tests.benchmarks.fake_processes import FakeProcessTable, fake_psutil
+
+_BENCH = os.environ.get("IGNITION_BENCH", "")
+
+
+class TestFakeProcessSource:
+    def test_vanished_entries_are_skipped_and_denied_ones_kept(self):
+        table = FakeProcessTable(500)
+        vanished = {p for p, info in table.by_pid.items() if info.vanished}
+        denied = {p for p, info in table.by_pid.items() if info.access_denied}
+        assert vanished and denied
+
+        with fake_psutil(table):
+            added, _ = ProcessTable().refresh()
+
+        by_pid = {e.pid: e for e in added}
+        assert not vanished & by_pid.keys()
+        assert denied <= by_pid.keys()
+        assert all(by_pid[p].exe == "" and by_pid[p].create_time == 0.0 for p in denied)
+
+    def test_module_helpers_see_the_fake_table_and_are_restored(self):
+        real = process_utils.shared_process_snapshots()
+        table = FakeProcessTable(50)
+        with fake_psutil(table):
+            assert process_utils.any_process_name_running(["svchost.exe"])
+            assert not process_utils.any_process_name_running(["iRacingUI.exe"])
+        assert process_utils.shared_process_snapshots() is real
+
+    def test_churn_replaces_processes(self):
+        table = FakeProcessTable(100)
+        before = set(table.pids())
+        table.churn(10)
+        after = set(table.pids())
+        assert len(after) == 100
+        assert len(before - after) == 10
+
+
+class TestCompare:
+    BASE = {"results": {"case": {"100": {"latency_units": 1.0, "peak_alloc_kib": 100.0}}}}
+
+    def _current(self, units, kib):
+        return {"results": {"case": {"100": {"latency_units": units, "peak_alloc_kib": kib}}}}
+
+    def test_within_tolerance_passes(self):
+        assert bench.compare(self._current(1.4, 120.0), self.BASE) == []
+
+    def test_slower_and_fatter_are_reported(self):
+        problems = bench.compare(self._current(5.0, 400.0), self.BASE)
+        assert len(problems) == 2
+        assert "latency" in problems[0] and "peak alloc" in problems[1]
+
+    def test_cases_missing_from_baseline_are_ignored(self):
+        current = {"results": {"new_case": {"100": {"latency_units": 9, "peak_alloc_kib": 9}}}}
+        assert bench.compare(current, self.BASE) == []
+
+
+@pytest.mark.skipif(not _BENCH, reason="set IGNITION_BENCH=1 to run the timed benchmarks")
+def test_no_regression_against_baseline():
+    baseline = bench.load_baseline()
+    if baseline is None:
+        pytest.skip(f"no stored baseline for this platform at {bench.baseline_path()}")
+    sizes = bench.SIZES if _BENCH == "full" else bench.SIZES[:2]
+    report = bench.run(sizes)
+    print(bench.format_report(report))
+    if bench.compare(report, baseline):
+        # One re-measure before failing, so a single noisy-neighbour blip doesn't.
+        report = bench.run(sizes)
+        print(bench.format_report(report))
+    assert bench.compare(report, baseline) == []
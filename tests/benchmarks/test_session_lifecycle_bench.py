@@ -0,0 +1,55 @@
+"""Regression gate for the end-to-end session lifecycle benchmark.
+
+Spawns real processes for several seconds, so it only runs on Linux with
+``IGNITION_BENCH`` set; the comparison itself is always checked.
+"""
+import os
+import sys
+
+import pytest
+
+from tests.benchmarks import bench_session_lifecycle as bench
+
+
+class TestCompare:
+    BASE = {"summary": {
+        "first_launch_ms": 100.0, "all_launched_ms": 1000.0, "all_stopped_ms": 500.0,
+        "cpu_ms": 200.0, "idle_cpu_percent": 1.0,
+    }}
+
+    def test_same_numbers_pass(self):
+        assert bench.compare(self.BASE, self.BASE) == []
+
+    def test_slow_launch_is_reported(self):
+        current = {"summary": dict(self.BASE["summary"], all_launched_ms=5000.0)}
+        problems = bench.compare(current, self.BASE)
+        assert len(problems) == 1 and problems[0].startswith("all_launched_ms")
+
+    def test_cpu_regression_is_reported(self):
+        current = {"summary": dict(self.BASE["summary"], cpu_ms=900.0, idle_cpu_percent=9.0)}
+        assert [p.split()[0] for p in bench.compare(current, self.BASE)] == [
+            "cpu_ms", "idle_cpu_percent",
+        ]
+
+
+class TestScenario:
+    def test_apps_cover_the_lifecycle_features(self):
+        apps = bench.scenario_apps()
+        assert any(a.start_delay_seconds for a in apps)
+        assert any(a.wait_for_process for a in apps)
+        assert any(a.shutdown_grace_seconds for a in apps)
+        assert any("--children" in a.arguments and "--children 0" not in a.arguments for a in apps)
+        assert any("--ignore-term" in a.arguments for a in apps)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("IGNITION_BENCH") or not sys.platform.startswith("linux"),
+    reason="set IGNITION_BENCH=1 on Linux to run the lifecycle benchmark",
+)
+def test_no_regression_against_baseline():
+    baseline = bench.load_baseline()
+    if baseline is None:
+        pytest.skip(f"no stored baseline at {bench.BASELINE_PATH}")
+    report = bench.run(rounds=3, poll_interval=baseline.get("poll_interval_seconds", 0.25))
+    print(report["summary"])
+    assert bench.compare(report, baseline) == []
@@ -0,0 +1,30 @@
+"""Fixtures shared by the tests that run real child processes."""
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import psutil
+import pytest
+
+
+@pytest.fixture
+def spawn():
+    """Start ``python -c code``; whatever is still running, children included, is killed after."""
+    procs: list[subprocess.Popen] = []
+
+    def _spawn(code: str = "import time; time.sleep(30)") -> subprocess.Popen:
+        proc = subprocess.Popen([sys.executable, "-c", code])
+        procs.append(proc)
+        return proc
+
+    yield _spawn
+    for proc in procs:
+        if proc.poll() is None:
+            try:
+                for child in psutil.Process(proc.pid).children(recursive=True):
+                    child.kill()
+            except psutil.Error:
+                pass
+            proc.kill()
+        proc.wait(5)
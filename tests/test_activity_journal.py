@@ -0,0 +1,80 @@
+"""Tests for the on-disk activity journal."""
+from ignition.core.activity_journal import ActivityJournal
+
+
+def _fill(journal: ActivityJournal, count: int, *, t0: float = 1000.0) -> None:
+    for i in range(count):
+        event_type = "error" if i % 5 == 0 else "launch"
+        journal.append(t0 + i, event_type, f"app{i % 3}", f"msg {i}")
+
+
+class TestActivityJournal:
+    def test_newest_first_paging(self, tmp_path):
+        journal = ActivityJournal(tmp_path, index_every=4)
+        _fill(journal, 10)
+        page = journal.query(limit=4)
+        assert [e["msg"] for e in page.entries] == ["msg 9", "msg 8", "msg 7", "msg 6"]
+        older = journal.query(limit=4, before=page.next_cursor)
+        assert [e["msg"] for e in older.entries] == ["msg 5", "msg 4", "msg 3", "msg 2"]
+        last = journal.query(limit=4, before=older.next_cursor)
+        assert [e["msg"] for e in last.entries] == ["msg 1", "msg 0"]
+        assert last.next_cursor is None
+
+    def test_filters(self, tmp_path):
+        journal = ActivityJournal(tmp_path, index_every=4)
+        _fill(journal, 20)
+        errors = journal.query(types=["error"])
+        assert [e["msg"] for e in errors.entries] == ["msg 15", "msg 10", "msg 5", "msg 0"]
+        by_app = journal.query(app="APP1", limit=3)
+        assert [e["msg"] for e in by_app.entries] == ["msg 19", "msg 16", "msg 13"]
+        window = journal.query(since=1005.0, until=1007.0)
+        assert [e["msg"] for e in window.entries] == ["msg 7", "msg 6", "msg 5"]
+
+    def test_time_range_reads_only_needed_chunks(self, tmp_path, monkeypatch):
+        journal = ActivityJournal(tmp_path, index_every=10)
+        _fill(journal, 100)
+        reads: list[int] = []
+        original = ActivityJournal._read_chunk
+
+        def counting(path, line0, start, end):
+            reads.append(line0)
+            return original(path, line0, start, end)
+
+        monkeypatch.setattr(ActivityJournal, "_read_chunk", staticmethod(counting))
+        page = journal.query(since=1042.0, until=1047.0)
+        assert len(page.entries) == 6
+        assert reads == [40]
+
+    def test_rotation_and_retention(self, tmp_path):
+        journal = ActivityJournal(tmp_path, max_file_bytes=1024, max_files=3, index_every=8)
+        _fill(journal, 200)
+        paths = journal.segment_paths()
+        assert len(paths) == 3
+        assert all(p.stat().st_size <= 1024 for p in paths)
+        assert len(list(tmp_path.glob("*.idx"))) == 3
+        newest = journal.query(limit=1).entries[0]
+        assert newest["msg"] == "msg 199"
+
+    def test_reopen_continues_and_rebuilds_index(self, tmp_path):
+        journal = ActivityJournal(tmp_path, index_every=4)
+        _fill(journal, 6)
+        journal.close()
+        for idx in tmp_path.glob("*.idx"):
+            idx.unlink()
+
+        reopened = ActivityJournal(tmp_path, index_every=4)
+        reopened.append(2000.0, "stop", None, "after restart")
+        msgs = [e["msg"] for e in reopened.query(limit=3).entries]
+        assert msgs == ["after restart", "msg 5", "msg 4"]
+        assert len(reopened.query(limit=100).entries) == 7
+        reopened.close()
+
+    def test_corrupt_line_is_skipped(self, tmp_path):
+        journal = ActivityJournal(tmp_path)
+        _fill(journal, 2)
+        journal.close()
+        path = journal.segment_paths()[0]
+        with open(path, "ab") as fh:
+            fh.write(b"{not json\n")
+        reopened = ActivityJournal(tmp_path)
+        assert [e["msg"] for e in reopened.query().entries] == ["msg 1", "msg 0"]
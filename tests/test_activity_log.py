@@ -0,0 +1,64 @@
+"""Tests for the ring-buffer activity log."""
+import threading
+import time
+
+from ignition.core.activity_log import ActivityLog
+
+
+def _fill(log: ActivityLog, count: int) -> None:
+    for i in range(count):
+        log.append("launch", f"app{i}", f"msg {i}")
+
+
+class TestActivityLog:
+    def test_cursor_reads_only_new_entries(self):
+        log = ActivityLog(capacity=10)
+        _fill(log, 3)
+        assert [e.seq for e in log.since(0)] == [0, 1, 2]
+        assert [e.seq for e in log.since(2)] == [2]
+        assert log.since(3) == []
+
+    def test_overflow_keeps_newest(self):
+        log = ActivityLog(capacity=4)
+        _fill(log, 10)
+        assert len(log) == 4
+        assert [e.seq for e in log.since(0)] == [6, 7, 8, 9]
+        assert [e.app for e in log.since(8)] == ["app8", "app9"]
+
+    def test_clear_keeps_sequence_running(self):
+        log = ActivityLog(capacity=4)
+        _fill(log, 3)
+        log.clear()
+        assert log.since(0) == []
+        entry = log.append("stop", None, "after clear")
+        assert entry.seq == 3
+        assert log.since(0) == [entry]
+
+    def test_resize_keeps_newest_entries(self):
+        log = ActivityLog(capacity=8)
+        _fill(log, 6)
+        log.resize(3)
+        assert [e.seq for e in log.since(0)] == [3, 4, 5]
+        log.resize(10)
+        _fill(log, 2)
+        assert [e.seq for e in log.since(0)] == [3, 4, 5, 6, 7]
+
+    def test_to_dict_shape(self):
+        log = ActivityLog()
+        d = log.append("error", "SimHub", "boom").to_dict()
+        assert set(d) == {"seq", "time", "type", "app", "msg"}
+        assert len(d["time"]) == 8
+
+    def test_wait_for_wakes_on_append(self):
+        log = ActivityLog()
+        _fill(log, 1)
+        timer = threading.Timer(0.1, lambda: log.append("stop", None, "late"))
+        timer.start()
+        started = time.monotonic()
+        entries = log.wait_for(1, timeout=5.0)
+        assert [e.msg for e in entries] == ["late"]
+        assert time.monotonic() - started < 2.0
+
+    def test_wait_for_times_out_empty(self):
+        log = ActivityLog()
+        assert log.wait_for(0, timeout=0.05) == []
@@ -0,0 +1,117 @@
+"""Tests for the process exit watcher used by the crash watchdog."""
+import errno
+import os
+import threading
+import time
+
+import pytest
+
+from ignition.core import exit_watcher
+from ignition.core.exit_watcher import ProcessExitWatcher, create_exit_watcher
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.exits: list[tuple[str, int]] = []
+        self.event = threading.Event()
+
+    def __call__(self, key: str, pid: int) -> None:
+        self.exits.append((key, pid))
+        self.event.set()
+
+
+@pytest.fixture(params=["native", "polling"])
+def make_watcher(request):
+    watchers = []
+
+    def factory(on_exit):
+        w = create_exit_watcher(on_exit) if request.param == "native" else ProcessExitWatcher(on_exit)
+        watchers.append(w)
+        return w
+
+    yield factory
+    for w in watchers:
+        w.stop()
+
+
+class TestProcessExitWatcher:
+    def test_reports_exit_promptly(self, make_watcher, spawn):
+        rec = _Recorder()
+        watcher = make_watcher(rec)
+        proc = spawn()
+        watcher.watch("app", proc.pid, proc)
+        time.sleep(0.05)
+        started = time.monotonic()
+        proc.kill()
+        assert rec.event.wait(3.0)
+        assert rec.exits == [("app", proc.pid)]
+        assert time.monotonic() - started < 1.5
+        assert proc.returncode is not None  # reaped by the watcher
+        assert watcher.watched_keys() == []
+
+    def test_only_the_exited_app_is_reported(self, make_watcher, spawn):
+        rec = _Recorder()
+        watcher = make_watcher(rec)
+        a, b = spawn(), spawn()
+        try:
+            watcher.watch("a", a.pid, a)
+            watcher.watch("b", b.pid, b)
+            b.kill()
+            assert rec.event.wait(3.0)
+            assert rec.exits == [("b", b.pid)]
+            assert watcher.watched_keys() == ["a"]
+        finally:
+            a.kill()
+            a.wait()
+
+    def test_unwatched_exit_is_ignored(self, make_watcher, spawn):
+        rec = _Recorder()
+        watcher = make_watcher(rec)
+        proc = spawn()
+        watcher.watch("app", proc.pid, proc)
+        watcher.unwatch("app")
+        proc.kill()
+        proc.wait()
+        assert not rec.event.wait(0.5)
+
+    def test_already_gone_process_reported(self, make_watcher, spawn):
+        rec = _Recorder()
+        watcher = make_watcher(rec)
+        proc = spawn()
+        proc.kill()
+        proc.wait()
+        watcher.watch("app", proc.pid)
+        assert rec.event.wait(3.0)
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd backend")
+class TestPidfdFallback:
+    def test_process_polled_when_pidfd_cannot_be_opened(self, monkeypatch, spawn):
+        rec = _Recorder()
+        watcher = create_exit_watcher(rec)
+        if watcher.name != "pidfd":
+            pytest.skip("pidfd unavailable here")
+        a, b = spawn(), spawn()
+        try:
+            watcher.watch("a", a.pid, a)
+
+            def out_of_fds(pid: int) -> int:
+                raise OSError(errno.EMFILE, "Too many open files")
+
+            monkeypatch.setattr(exit_watcher.os, "pidfd_open", out_of_fds)
+            watcher.watch("b", b.pid, b)
+            monkeypatch.undo()
+
+            b.kill()
+            assert rec.event.wait(3.0)
+            assert rec.exits == [("b", b.pid)]
+            rec.event.clear()
+            a.kill()
+            assert rec.event.wait(3.0)
+            assert rec.exits[-1] == ("a", a.pid)
+        finally:
+            for proc in (a, b):
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+            watcher.stop()
@@ -0,0 +1,528 @@
+"""Tests for IgnitionController orchestration, using real short-lived dummy apps."""
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+import time
+
+import psutil
+import pytest
+
+from ignition.core import ignition_controller
+from ignition.core.config_store import ConfigStore
+from ignition.core.ignition_controller import IgnitionController
+from ignition.core.iracing_monitor import SIM_PROCESS_NAME, UI_PROCESS_NAME
+from ignition.core.launch_plan import build_launch_plan
+from ignition.core.models import AppConfig, ManagedApp, TriggerProcessPolicy
+from ignition.core.paths import AppPaths
+from ignition.core.process_killer import suspend_process_tree
+from ignition.core.process_utils import ProcessSnapshotService
+
+_DUMMY = "import time\ntime.sleep(60)\n"
+
+
+def _make_controller(tmp_path: pathlib.Path, apps: list[ManagedApp]) -> IgnitionController:
+    paths = AppPaths(config_dir=tmp_path / "config", log_dir=tmp_path / "logs")
+    config = AppConfig.default()
+    config.notification_mode = "never"
+    config.profiles[0].apps = apps
+    ConfigStore._save_to_file(paths.config_file, config)
+    return IgnitionController(ConfigStore(paths=paths, config=config))
+
+
+def _dummy_app(tmp_path: pathlib.Path, name: str, **fields) -> ManagedApp:
+    script = tmp_path / f"{name}.py"
+    script.write_text(_DUMMY, encoding="utf-8")
+    app = ManagedApp.create(name=name, executable_path=sys.executable)
+    app.arguments = str(script)
+    app.start_if_already_running = True
+    for key, value in fields.items():
+        setattr(app, key, value)
+    return app
+
+
+def _stopped(proc: psutil.Process) -> bool:
+    """Whether ``proc`` is stopped, allowing for the signal to land."""
+    deadline = time.monotonic() + 2.0
+    while proc.status() != psutil.STATUS_STOPPED and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return proc.status() == psutil.STATUS_STOPPED
+
+
+@pytest.fixture
+def controllers():
+    made: list[IgnitionController] = []
+    yield made
+    for c in made:
+        c._on_iracing_stopped()
+        c.stop()
+
+
+class TestLaunchScheduling:
+    def test_independent_delays_run_concurrently(self, tmp_path, controllers):
+        apps = [_dummy_app(tmp_path, f"app{i}", start_delay_seconds=0.5) for i in range(4)]
+        controller = _make_controller(tmp_path, apps)
+        controllers.append(controller)
+
+        started = time.monotonic()
+        controller._on_iracing_started()
+        elapsed = time.monotonic() - started
+
+        assert len(controller.get_running_app_ids()) == 4
+        assert elapsed < 1.5  # sequential delays would take at least 2 s
+
+    def test_already_running_checked_once_per_session(self, tmp_path, controllers):
+        apps = []
+        for i in range(5):
+            exe = tmp_path / f"tool{i}.exe"
+            exe.write_bytes(b"")
+            apps.append(_dummy_app(tmp_path, f"tool{i}", executable_path=str(exe)))
+        apps.append(_dummy_app(tmp_path, "python"))
+        for app in apps:
+            app.start_if_already_running = False
+        controller = _make_controller(tmp_path, apps)
+        controllers.append(controller)
+        controller._snapshots = ProcessSnapshotService(max_age_seconds=60.0)
+
+        plan = build_launch_plan(apps)
+        running = controller._already_running(plan)
+
+        assert controller._snapshots.scan_count == 1
+        assert os.getpid() in running[sys.executable]
+        assert [running[a.executable_path] for a in apps[:5]] == [[]] * 5
+
+    def test_launch_plan_exposed(self, tmp_path, controllers):
+        apps = [_dummy_app(tmp_path, "a"), _dummy_app(tmp_path, "b", wait_for_process="python")]
+        controller = _make_controller(tmp_path, apps)
+        controllers.append(controller)
+        plan = controller.get_launch_plan()
+        assert [s["name"] for s in plan["steps"]] == ["a", "b"]
+
+
+class TestWarmUp:
+    def test_problems_reported_before_session(self, tmp_path, controllers):
+        good = _dummy_app(tmp_path, "good")
+        bad = _dummy_app(tmp_path, "bad", executable_path=str(tmp_path / "gone.exe"))
+        controller = _make_controller(tmp_path, [good, bad])
+        controllers.append(controller)
+
+        problems = controller.warm_up()
+
+        assert list(problems) == [bad.app_id]
+        assert controller.get_launch_problems() == problems
+        errors = [e for e in controller.get_log_since(0) if e["type"] == "error"]
+        assert [e["app"] for e in errors] == ["bad"]
+        controller.warm_up()  # unchanged problems are not logged again
+        assert len([e for e in controller.get_log_since(0) if e["type"] == "error"]) == 1
+
+    def test_launch_uses_warm_spec(self, tmp_path, controllers):
+        app = _dummy_app(tmp_path, "app")
+        controller = _make_controller(tmp_path, [app])
+        controllers.append(controller)
+        controller.warm_up()
+        controller._on_iracing_started()
+        assert controller.get_running_app_ids() == [app.app_id]
+        assert controller._launch_specs.stats()["hits"] == 1
+
+
+@pytest.mark.skipif(os.name == "nt", reason="needs a copyable sleep binary")
+class TestCrashRestart:
+    def test_crashed_app_relaunched_despite_recent_snapshot(self, tmp_path, controllers):
+        # A private copy of ``sleep``, so only our own instance matches the exe check.
+        sleep = shutil.which("sleep")
+        if sleep is None:
+            pytest.skip("sleep binary not available")
+        exe = tmp_path / "crashy"
+        shutil.copy(sleep, exe)
+        app = ManagedApp.create(name="crashy", executable_path=str(exe))
+        app.arguments = "60"
+        app.restart_on_crash = True
+        controller = _make_controller(tmp_path, [app])
+        controllers.append(controller)
+        controller.start()
+        controller._on_iracing_started()
+        first = controller._running[app.app_id].pid
+        controller._snapshots.invalidate()
+        assert first in controller._snapshots.get().pids_for_exe(str(exe))  # now cached
+
+        psutil.Process(first).kill()
+        deadline = time.monotonic() + 5.0
+        while True:
+            running = controller._running.get(app.app_id)
+            if running is not None and running.pid != first:
+                break
+            assert time.monotonic() < deadline, controller.get_log_since(0)
+            time.sleep(0.05)
+        msgs = [e["msg"] for e in controller.get_log_since(0) if e["app"] == "crashy"]
+        assert not any(m.startswith("Skipped") for m in msgs)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux psutil APIs")
+class TestProcessTuning:
+    def test_applied_after_spawn_and_failures_logged(self, tmp_path, controllers):
+        good = _dummy_app(tmp_path, "good", priority="below_normal", cpu_affinity=[0])
+        bad = _dummy_app(tmp_path, "bad", cpu_affinity=[psutil.cpu_count() + 3])
+        controller = _make_controller(tmp_path, [good, bad])
+        controllers.append(controller)
+        controller._on_iracing_started()
+
+        proc = psutil.Process(controller._running[good.app_id].pid)
+        assert proc.nice() == 10
+        assert proc.cpu_affinity() == [0]
+        errors = [e for e in controller.get_log_since(0) if e["type"] == "error"]
+        assert [e["app"] for e in errors] == ["bad"]
+        assert "CPU affinity" in errors[0]["msg"]
+
+
+    def test_trigger_policy_applied_for_the_session_and_restored(self, tmp_path, controllers):
+        dummy = pathlib.Path(__file__).parent / "benchmarks" / "dummy_process.py"
+        trigger = subprocess.Popen([sys.executable, str(dummy), "--name", "simtrigger.exe"])
+        try:
+            deadline = time.monotonic() + 5
+            while psutil.Process(trigger.pid).name() != "simtrigger.exe":
+                assert time.monotonic() < deadline
+                time.sleep(0.02)
+            controller = _make_controller(tmp_path, [_dummy_app(tmp_path, "app")])
+            controllers.append(controller)
+            profile = controller._get_active_profile()
+            profile.trigger_process_names = ["simtrigger.exe"]
+            profile.trigger_policy = TriggerProcessPolicy(
+                enabled=True, priority="5", reserved_cores=[0]
+            )
+            proc = psutil.Process(trigger.pid)
+            before = proc.cpu_affinity()
+
+            controller._snapshots.invalidate()
+            controller._on_iracing_started()
+            assert proc.nice() == 5
+            assert proc.cpu_affinity() == [0]
+
+            controller._on_iracing_stopped()
+            assert proc.nice() == 0
+            assert proc.cpu_affinity() == before
+        finally:
+            trigger.kill()
+            trigger.wait(5)
+
+
+    def test_sim_started_after_the_ui_trigger_is_tuned(self, tmp_path, controllers):
+        sleep = shutil.which("sleep")
+        if sleep is None:
+            pytest.skip("sleep binary not available")
+        procs = []
+        try:
+            for name in (UI_PROCESS_NAME, SIM_PROCESS_NAME):
+                exe = tmp_path / name
+                shutil.copy(sleep, exe)
+                procs.append(subprocess.Popen([str(exe), "30"]))
+                if name == UI_PROCESS_NAME:
+                    controller = _make_controller(tmp_path, [])
+                    controllers.append(controller)
+                    profile = controller._get_active_profile()
+                    profile.trigger_process_names = [UI_PROCESS_NAME]  # "ui" trigger mode
+                    profile.trigger_policy = TriggerProcessPolicy(
+                        enabled=True, priority="5", reserved_cores=[0]
+                    )
+                    controller._snapshots.invalidate()
+                    controller._on_iracing_started()
+            ui, sim = (psutil.Process(p.pid) for p in procs)
+            assert sim.nice() == 0  # not up yet when the session started
+
+            controller._snapshots.invalidate()
+            controller._on_sim_changed(True)
+            assert (ui.nice(), sim.nice()) == (5, 5)
+            assert sim.cpu_affinity() == [0]
+
+            controller._on_iracing_stopped()
+            assert (ui.nice(), sim.nice()) == (0, 0)
+        finally:
+            for proc in procs:
+                proc.kill()
+                proc.wait(5)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="reads POSIX process states")
+class TestSuspendWhileDriving:
+    def test_suspended_while_sim_runs_and_resumed_after(self, tmp_path, controllers):
+        frozen = _dummy_app(tmp_path, "frozen", suspend_while_driving=True)
+        other = _dummy_app(tmp_path, "other")
+        controller = _make_controller(tmp_path, [frozen, other])
+        controllers.append(controller)
+        controller._on_iracing_started()
+        frozen_proc = psutil.Process(controller._running[frozen.app_id].pid)
+        other_proc = psutil.Process(controller._running[other.app_id].pid)
+
+        controller._on_sim_changed(True)
+        assert _stopped(frozen_proc)
+        assert other_proc.status() != psutil.STATUS_STOPPED
+        assert controller.get_suspended_app_ids() == [frozen.app_id]
+
+        time.sleep(0.5)  # the watchdog must not take a stopped process for a dead one
+        assert sorted(controller.get_running_app_ids()) == sorted([frozen.app_id, other.app_id])
+
+        controller._on_sim_changed(False)
+        assert frozen_proc.status() != psutil.STATUS_STOPPED
+        assert controller.get_suspended_app_ids() == []
+        types = [(e["type"], e["app"]) for e in controller.get_log_since(0)]
+        assert ("paused", "frozen") in types and ("resumed", "frozen") in types
+
+    def test_not_suspended_outside_a_session(self, tmp_path, controllers):
+        app = _dummy_app(tmp_path, "frozen", suspend_while_driving=True)
+        controller = _make_controller(tmp_path, [app])
+        controllers.append(controller)
+        controller.start_app_now(app_id=app.app_id)
+        controller._on_sim_changed(True)
+        assert controller.get_suspended_app_ids() == []
+
+    def test_suspended_app_stops_gracefully(self, tmp_path, controllers):
+        app = _dummy_app(tmp_path, "frozen", suspend_while_driving=True, shutdown_grace_seconds=3.0)
+        controller = _make_controller(tmp_path, [app])
+        controllers.append(controller)
+        controller._on_iracing_started()
+        controller._on_sim_changed(True)
+        assert controller.get_suspended_app_ids() == [app.app_id]
+
+        reports = controller.stop()
+        assert [r.outcome for r in reports] == ["graceful"]
+        assert controller.get_suspended_app_ids() == []
+
+
+    def test_sim_exit_while_suspending_leaves_the_app_running(
+        self, tmp_path, controllers, monkeypatch
+    ):
+        app = _dummy_app(tmp_path, "frozen", suspend_while_driving=True)
+        controller = _make_controller(tmp_path, [app])
+        controllers.append(controller)
+        controller._on_iracing_started()
+        proc = psutil.Process(controller._running[app.app_id].pid)
+
+        def suspend_then_sim_exits(pid, *, tree=True):
+            procs = suspend_process_tree(pid, tree=tree)
+            controller._on_sim_changed(False)  # the flap lands mid-suspend
+            return procs
+
+        monkeypatch.setattr(
+            ignition_controller, "suspend_process_tree", suspend_then_sim_exits
+        )
+        controller._on_sim_changed(True)
+        assert controller.get_suspended_app_ids() == []
+        deadline = time.monotonic() + 2.0
+        while proc.status() == psutil.STATUS_STOPPED and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert proc.status() != psutil.STATUS_STOPPED
+
+    def test_app_started_after_the_sim_exits_not_suspended(self, tmp_path, controllers):
+        app = _dummy_app(tmp_path, "frozen", suspend_while_driving=True)
+        controller = _make_controller(tmp_path, [])
+        controllers.append(controller)
+        controller._on_iracing_started()
+        controller._on_sim_changed(True)
+        controller._on_sim_changed(False)
+        controller._start_app(app)
+        assert controller.get_suspended_app_ids() == []
+
+
+class TestChangeListeners:
+    def test_notified_on_state_changes(self, tmp_path, controllers):
+        app = _dummy_app(tmp_path, "app")
+        controller = _make_controller(tmp_path, [app])
+        controllers.append(controller)
+        seen: list[list[str]] = []
+        controller.add_change_listener(lambda: seen.append(controller.get_running_app_ids()))
+
+        controller.pause()
+        controller.resume()
+        assert len(seen) == 2
+        controller.start_app_now(app_id=app.app_id)
+        assert seen[-1] == [app.app_id]
+        controller.stop_app_now(app_id=app.app_id)
+        assert seen[-1] == []
+
+    def test_notified_when_kept_apps_leave_the_running_set(self, tmp_path, controllers):
+        app = _dummy_app(tmp_path, "kept", kill_on_iracing_exit=False)
+        controller = _make_controller(tmp_path, [app])
+        controllers.append(controller)
+        controller._on_iracing_started()
+        pid = controller._running[app.app_id].pid
+        seen: list[list[str]] = []
+        controller.add_change_listener(lambda: seen.append(controller.get_running_app_ids()))
+        try:
+            controller._on_iracing_stopped()
+            assert seen[-1] == []
+        finally:
+            psutil.Process(pid).kill()
+
+    def test_session_type_known_without_a_scan(self, tmp_path, controllers):
+        controller = _make_controller(tmp_path, [])
+        controllers.append(controller)
+        seen: list[int] = []
+        controller.add_change_listener(lambda: seen.append(1))
+        controller._on_sim_changed(True)
+        scans = controller._snapshots.scan_count
+        assert controller.get_session_type() == "race"
+        assert controller._snapshots.scan_count == scans
+        assert seen
+
+
+class TestActivityJournal:
+    def test_events_survive_restart(self, tmp_path, controllers):
+        controller = _make_controller(tmp_path, [])
+        controller.pause()
+        controller.resume()
+        controller.stop()
+
+        again = _make_controller(tmp_path, [])
+        controllers.append(again)
+        assert again.get_log_since(0) == []
+        page = again.query_journal(types=["paused"])
+        assert [e["msg"] for e in page.entries] == ["Monitoring paused"]
+
+    def test_writes_deferred_while_over_cpu_budget(self, tmp_path, controllers):
+        controller = _make_controller(tmp_path, [])
+        controllers.append(controller)
+        controller._governor.allow_optional = lambda: False
+        controller.pause()
+        assert controller.get_resource_usage()["deferred_writes"] == 1
+        assert controller.query_journal(types=["paused"]).entries == []
+
+        del controller._governor.allow_optional
+        controller.resume()
+        assert controller.get_resource_usage()["deferred_writes"] == 0
+        assert len(controller.query_journal(types=["paused", "resumed"]).entries) == 2
+
+    def test_budget_not_enforced_for_a_skipped_session(self, tmp_path, controllers):
+        controller = _make_controller(tmp_path, [])
+        controllers.append(controller)
+        controller._config_store.config.cpu_budget_percent = 5.0
+        controller.pause()
+        controller._on_iracing_started()
+        assert controller.get_resource_usage()["enforcing"] is False
+
+        controller.resume()
+        controller._on_iracing_stopped()
+        controller._on_iracing_started()
+        assert controller.get_resource_usage()["enforcing"] is True
+
+
+class TestSessionStats:
+    def test_updated_per_session_and_rebuilt_when_missing(self, tmp_path, controllers):
+        app = _dummy_app(tmp_path, "app")
+        controller = _make_controller(tmp_path, [app])
+        controllers.append(controller)
+        for _ in range(2):
+            controller._on_iracing_started()
+            controller._on_iracing_stopped()
+
+        stats = controller.get_session_stats()
+        assert stats["sessions"] == 2
+        assert stats["apps"] == [{"name": "app", "launches": 2}]
+
+        paths = controller._config_store.paths
+        paths.session_stats_file.unlink()
+        again = _make_controller(tmp_path, [app])
+        controllers.append(again)
+        assert again.get_session_stats()["sessions"] == 2
+        assert paths.session_stats_file.exists()
+
+        again.clear_session_history()
+        assert again.get_session_stats()["sessions"] == 0
+
+
+class TestLaunchTimings:
+    def test_phases_recorded_in_history_and_metrics(self, tmp_path, controllers):
+        app = _dummy_app(tmp_path, "app", start_delay_seconds=0.2)
+        controller = _make_controller(tmp_path, [app])
+        controllers.append(controller)
+        controller._on_iracing_started()
+        controller._on_iracing_stopped()
+
+        timings = controller.get_session_history()[0]["launch_timings"]
+        assert [t["name"] for t in timings] == ["app"]
+        phases = timings[0]["phases_ms"]
+        assert phases["delay_elapsed"] >= 200
+        assert phases["delay_elapsed"] <= phases["wait_satisfied"] <= phases["spawned"]
+
+        deadline = time.monotonic() + 5.0
+        while not controller.get_launch_metrics()["apps"] and time.monotonic() < deadline:
+            time.sleep(0.05)  # recorded once the visibility watcher gives up on the dead app
+        metrics = controller.get_launch_metrics()
+        assert metrics["apps"][app.app_id]["phases"]["spawned"]["count"] == 1
+
+
+class TestShutdown:
+    def test_apps_stop_in_parallel(self, tmp_path, controllers):
+        apps = [
+            _dummy_app(tmp_path, f"app{i}", shutdown_grace_seconds=1.0, kill_process_tree=False)
+            for i in range(4)
+        ]
+        controller = _make_controller(tmp_path, apps)
+        controllers.append(controller)
+        controller._on_iracing_started()
+
+        started = time.monotonic()
+        reports = controller.stop()
+        elapsed = time.monotonic() - started
+
+        assert sorted(r.name for r in reports) == ["app0", "app1", "app2", "app3"]
+        assert elapsed < 3.0  # one at a time would take over 4 s
+        assert controller.get_running_app_ids() == []
+
+    def test_app_disabled_mid_session_still_stopped(self, tmp_path, controllers):
+        apps = [_dummy_app(tmp_path, "kept"), _dummy_app(tmp_path, "toggled")]
+        controller = _make_controller(tmp_path, apps)
+        controllers.append(controller)
+        controller._on_iracing_started()
+        procs = [psutil.Process(controller._running[a.app_id].pid) for a in apps]
+
+        apps[1].enabled = False  # toggled off in place, as toggle_app does
+        controller._on_iracing_stopped()
+        for proc in procs:
+            proc.wait(timeout=5.0)
+        assert controller.get_running_app_ids() == []
+
+    def test_deadline_bounds_stubborn_apps(self, tmp_path, controllers):
+        stubborn = (
+            "import signal, time\n"
+            "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+            "time.sleep(60)\n"
+        )
+        apps = []
+        for i in range(3):
+            app = _dummy_app(tmp_path, f"stubborn{i}", shutdown_grace_seconds=5.0)
+            pathlib.Path(app.arguments).write_text(stubborn, encoding="utf-8")
+            apps.append(app)
+        controller = _make_controller(tmp_path, apps)
+        controller._config_store.config.shutdown_timeout_seconds = 1.0
+        controllers.append(controller)
+        controller._on_iracing_started()
+        time.sleep(0.3)  # let the dummies install their signal handler
+
+        started = time.monotonic()
+        reports = controller.stop()
+        elapsed = time.monotonic() - started
+
+        assert [r.outcome for r in reports] == ["killed"] * 3
+        assert elapsed < 2.5
+        cut = [e for e in controller.get_log_since(0) if "Grace period cut" in e["msg"]]
+        assert len(cut) == 3
+
+    def test_iracing_exit_not_bound_by_the_shutdown_deadline(self, tmp_path, controllers):
+        slow = (
+            "import signal, sys, time\n"
+            "signal.signal(signal.SIGTERM, lambda *_: (time.sleep(1.0), sys.exit(0)))\n"
+            "time.sleep(60)\n"
+        )
+        app = _dummy_app(tmp_path, "slow", shutdown_grace_seconds=5.0)
+        pathlib.Path(app.arguments).write_text(slow, encoding="utf-8")
+        controller = _make_controller(tmp_path, [app])
+        controller._config_store.config.shutdown_timeout_seconds = 0.5
+        controllers.append(controller)
+        controller._on_iracing_started()
+        time.sleep(0.3)  # let the dummy install its signal handler
+
+        pid = controller._running[app.app_id].pid
+        controller._on_iracing_stopped()
+        assert any(
+            f"pid {pid}, graceful" in e["msg"] for e in controller.get_log_since(0)
+        )
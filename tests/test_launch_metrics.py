@@ -0,0 +1,123 @@
+"""Tests for launch latency histograms and phase timelines."""
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import psutil
+import pytest
+
+from ignition.core.launch_metrics import (
+    FirstVisibleWatcher,
+    LatencyHistogram,
+    LaunchMetrics,
+    LaunchTimeline,
+)
+from ignition.core.process_utils import ProcessSnapshotService
+
+
+class TestLatencyHistogram:
+    def test_fixed_buckets(self):
+        hist = LatencyHistogram(bounds=(100, 1000))
+        for ms in (10, 100, 150, 5000):
+            hist.observe(ms)
+        assert hist.counts == [2, 1, 1]
+        d = hist.to_dict()
+        assert d["count"] == 4
+        assert d["buckets"][-1] == {"le_ms": None, "count": 1}
+        assert d["p50_ms"] == 100.0
+        assert d["p95_ms"] == 5000
+
+    def test_empty(self):
+        assert LatencyHistogram().to_dict()["p50_ms"] is None
+
+
+class TestLaunchMetrics:
+    def test_records_per_app_and_profile(self):
+        metrics = LaunchMetrics()
+        for app_id, spawned in (("a", 10.2), ("a", 10.4), ("b", 10.9)):
+            t = LaunchTimeline(app_id=app_id, name=app_id.upper(), profile_id="p", trigger_at=10.0)
+            t.mark("delay_elapsed", 10.0)
+            t.mark("spawned", spawned)
+            metrics.record(t)
+        d = metrics.to_dict()
+        assert d["apps"]["a"]["name"] == "A"
+        assert d["apps"]["a"]["phases"]["spawned"]["count"] == 2
+        assert "visible" not in d["apps"]["a"]["phases"]
+        assert d["profiles"]["p"]["spawned"]["count"] == 3
+        assert d["profiles"]["p"]["spawned"]["max_ms"] == pytest.approx(900.0, abs=0.5)
+
+    def test_timeline_offsets(self):
+        t = LaunchTimeline(app_id="a", name="A", profile_id="p", trigger_at=100.0)
+        t.mark("delay_elapsed", 101.5)
+        assert t.phases_ms() == {
+            "delay_elapsed": 1500.0, "wait_satisfied": None, "spawned": None, "visible": None,
+        }
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX uses the first child process")
+class TestFirstVisibleWatcher:
+    def _watch(self, proc, timeout=5.0):
+        done = threading.Event()
+        seen: list = []
+
+        def on_visible(at):
+            seen.append(at)
+            done.set()
+
+        watcher = FirstVisibleWatcher(
+            snapshots=ProcessSnapshotService(), interval_seconds=0.02, timeout_seconds=timeout
+        )
+        watcher.watch(proc.pid, on_visible)
+        try:
+            assert done.wait(10.0)
+        finally:
+            watcher.stop()
+        return seen[0]
+
+    def test_child_counts_as_visible(self):
+        code = (
+            "import subprocess, sys, time\n"
+            "time.sleep(0.2)\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "time.sleep(30)\n"
+        )
+        proc = subprocess.Popen([sys.executable, "-c", code])
+        try:
+            assert self._watch(proc) is not None
+        finally:
+            for child in psutil.Process(proc.pid).children(recursive=True):
+                child.kill()
+            proc.kill()
+            proc.wait()
+
+    def test_exit_before_visible_reports_none(self):
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        assert self._watch(proc) is None
+
+    def test_one_shared_walk_per_interval(self):
+        procs = [
+            subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+            for _ in range(5)
+        ]
+        snapshots = ProcessSnapshotService()
+        watcher = FirstVisibleWatcher(
+            snapshots=snapshots, interval_seconds=0.1, timeout_seconds=0.5
+        )
+        settled = []
+        try:
+            for proc in procs:
+                watcher.watch(proc.pid, settled.append)
+            deadline = time.monotonic() + 5.0
+            while len(settled) < 5 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert settled == [None] * 5  # timed out: no child ever appeared
+            # one walk per 0.1 s tick for all five apps, not five per tick
+            assert snapshots.scan_count <= 10
+        finally:
+            watcher.stop()
+            for proc in procs:
+                proc.kill()
+                proc.wait()
@@ -0,0 +1,66 @@
+"""Tests for the dependency-graph launch plan."""
+from ignition.core.launch_plan import build_launch_plan
+from ignition.core.models import ManagedApp
+
+
+def _app(name: str, exe: str, *, delay: float = 0.0, wait: str = "", enabled: bool = True):
+    app = ManagedApp.create(name=name, executable_path=exe)
+    app.start_delay_seconds = delay
+    app.wait_for_process = wait
+    app.enabled = enabled
+    return app
+
+
+class TestBuildLaunchPlan:
+    def test_independent_apps_share_level_zero(self):
+        apps = [_app(f"A{i}", rf"C:\A{i}.exe", delay=3.0) for i in range(5)]
+        plan = build_launch_plan(apps)
+        assert [s.level for s in plan.steps] == [0] * 5
+        assert all(s.depends_on == () for s in plan.steps)
+        # delays are offsets from session start, not cumulative
+        assert [s.earliest_start_seconds for s in plan.steps] == [3.0] * 5
+
+    def test_wait_for_earlier_app_creates_edge(self):
+        simhub = _app("SimHub", r"C:\SimHub\SimHub.exe", delay=2.0)
+        dash = _app("Dash", r"C:\Dash\Dash.exe", delay=1.0, wait="simhub.EXE")
+        plan = build_launch_plan([simhub, dash])
+        step = plan.step(dash.app_id)
+        assert step.depends_on == (simhub.app_id,)
+        assert step.level == 1
+        assert step.earliest_start_seconds == 2.0
+
+    def test_wait_for_external_process_has_no_edge(self):
+        app = _app("Overlay", r"C:\Overlay.exe", wait="iRacingSim64DX11.exe")
+        plan = build_launch_plan([app])
+        assert plan.steps[0].depends_on == ()
+        assert plan.steps[0].level == 0
+
+    def test_later_provider_is_not_a_dependency(self):
+        dash = _app("Dash", r"C:\Dash.exe", wait="SimHub.exe")
+        simhub = _app("SimHub", r"C:\SimHub.exe")
+        plan = build_launch_plan([dash, simhub])
+        assert plan.step(dash.app_id).depends_on == ()
+
+    def test_disabled_apps_are_left_out(self):
+        off = _app("Off", r"C:\Off.exe", enabled=False)
+        on = _app("On", r"C:\On.exe", wait="Off.exe")
+        plan = build_launch_plan([off, on])
+        assert [s.app.name for s in plan.steps] == ["On"]
+        assert plan.disabled == (off,)
+        assert plan.step(on.app_id).depends_on == ()
+
+    def test_disabled_apps_kept_on_request(self):
+        on, off = _app("On", r"C:\On.exe"), _app("Off", r"C:\Off.exe", enabled=False)
+        plan = build_launch_plan([on, off], include_disabled=True)
+        assert [s.app.name for s in plan.steps] == ["On", "Off"]
+        assert plan.disabled == ()
+
+    def test_levels_and_to_dict(self):
+        a = _app("A", "/opt/a/a")
+        b = _app("B", "/opt/b/b", wait="a")
+        c = _app("C", "/opt/c/c", wait="b")
+        plan = build_launch_plan([a, b, c])
+        assert [[s.app.name for s in lvl] for lvl in plan.levels()] == [["A"], ["B"], ["C"]]
+        d = plan.to_dict()
+        assert [s["name"] for s in d["steps"]] == ["A", "B", "C"]
+        assert d["steps"][2]["depends_on"] == [b.app_id]
@@ -0,0 +1,91 @@
+"""Tests for precompiled launch specs and the warm-up cache."""
+import os
+import sys
+
+from ignition.core.app_launcher import spawn_launch_spec
+from ignition.core.launch_spec import LaunchSpecCache, compile_launch_spec, prefetch_executable
+from ignition.core.models import ManagedApp
+
+
+def _app(exe: str, **fields) -> ManagedApp:
+    app = ManagedApp.create(name="App", executable_path=exe)
+    for key, value in fields.items():
+        setattr(app, key, value)
+    return app
+
+
+class TestCompileLaunchSpec:
+    def test_valid_app(self, tmp_path):
+        spec = compile_launch_spec(_app(sys.executable, arguments='-c "pass"'))
+        assert spec.ok
+        assert spec.args == (sys.executable, "-c", '"pass"')
+        assert spec.cwd == os.path.dirname(sys.executable)
+
+    def test_problems_are_collected(self, tmp_path):
+        spec = compile_launch_spec(
+            _app(str(tmp_path / "missing.exe"), working_directory=str(tmp_path / "nope"))
+        )
+        assert not spec.ok
+        assert [p.split(":")[0] for p in spec.problems] == [
+            "Executable not found",
+            "Working directory not found",
+        ]
+
+    def test_directory_is_not_an_executable(self, tmp_path):
+        assert not compile_launch_spec(_app(str(tmp_path))).ok
+
+    def test_spawn_compiled_spec(self, tmp_path):
+        spec = compile_launch_spec(
+            _app(sys.executable, arguments="-c pass", working_directory=str(tmp_path))
+        )
+        result = spawn_launch_spec(spec)
+        assert result.process.wait(timeout=10.0) == 0
+
+
+class TestLaunchSpecCache:
+    def test_reused_until_edited(self, tmp_path):
+        exe = tmp_path / "tool.exe"
+        exe.write_bytes(b"MZ")
+        app = _app(str(exe))
+        cache = LaunchSpecCache()
+        first = cache.get(app)
+        assert cache.get(app) is first
+        app.arguments = "--fast"
+        second = cache.get(app)
+        assert second is not first
+        assert second.args[-1] == "--fast"
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 2}
+
+    def test_exe_mtime_change_recompiles(self, tmp_path):
+        exe = tmp_path / "tool.exe"
+        exe.write_bytes(b"MZ")
+        app = _app(str(exe))
+        cache = LaunchSpecCache()
+        first = cache.get(app)
+        st = exe.stat()
+        os.utime(exe, (st.st_atime, st.st_mtime + 10))
+        assert cache.get(app) is not first
+
+    def test_exe_appearing_later_is_picked_up(self, tmp_path):
+        exe = tmp_path / "tool.exe"
+        app = _app(str(exe))
+        cache = LaunchSpecCache()
+        assert not cache.get(app).ok
+        exe.write_bytes(b"MZ")
+        assert cache.get(app).ok
+
+    def test_retain_drops_removed_apps(self, tmp_path):
+        cache = LaunchSpecCache()
+        a, b = _app(sys.executable), _app(sys.executable)
+        cache.get(a)
+        cache.get(b)
+        cache.retain([b.app_id])
+        assert cache.stats()["size"] == 1
+
+
+class TestPrefetch:
+    def test_reads_whole_file(self, tmp_path):
+        exe = tmp_path / "tool.exe"
+        exe.write_bytes(b"x" * 3000)
+        assert prefetch_executable(str(exe)) == 3000
+        assert prefetch_executable(str(tmp_path / "missing.exe")) == 0
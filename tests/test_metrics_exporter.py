@@ -0,0 +1,140 @@
+"""Tests for the Prometheus metrics exporter, scraped over loopback."""
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from ignition.core.config_store import ConfigStore
+from ignition.core.ignition_controller import IgnitionController
+from ignition.core.metrics_exporter import MetricsFileWriter, MetricsServer, render_metrics
+from ignition.core.models import AppConfig
+from ignition.core.paths import AppPaths
+from ignition.core.state import AppState
+
+_SAMPLE = {
+    "process_scans_total": 12,
+    "process_scan_seconds_total": 0.25,
+    "poll_interval_seconds": 1.0,
+    "trigger_transitions_total": 2,
+    "iracing_running": True,
+    "managed_apps": 3,
+    "launches_total": 4,
+    "launch_failures_total": 0,
+    "crashes_total": 1,
+    "restarts_total": 1,
+    "terminations_total": {"graceful": 2, "killed": 1},
+}
+
+
+def _parse(text: str) -> dict[str, float]:
+    values = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            values[name] = float(value)
+    return values
+
+
+def _scrape(port: int, path: str = "/metrics") -> tuple[int, str, str]:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=5.0) as resp:
+        return resp.status, resp.headers["Content-Type"], resp.read().decode("utf-8")
+
+
+class TestRenderMetrics:
+    def test_text_format(self):
+        text = render_metrics(_SAMPLE)
+        values = _parse(text)
+        assert values["ignition_process_scans_total"] == 12
+        assert values["ignition_iracing_running"] == 1
+        assert values['ignition_terminations_total{outcome="killed"}'] == 1
+        assert values["ignition_process_threads"] >= 1
+        assert values["ignition_process_resident_memory_bytes"] > 0
+        assert "# TYPE ignition_launches_total counter" in text
+        assert "# TYPE ignition_poll_interval_seconds gauge" in text
+
+
+class TestMetricsServer:
+    def test_scrape_over_loopback(self):
+        server = MetricsServer(lambda: _SAMPLE)
+        server.start()
+        try:
+            status, ctype, body = _scrape(server.port)
+            assert status == 200
+            assert ctype.startswith("text/plain; version=0.0.4")
+            assert _parse(body)["ignition_launches_total"] == 4
+            with pytest.raises(urllib.error.HTTPError) as err:
+                _scrape(server.port, "/nope")
+            assert err.value.code == 404
+        finally:
+            server.stop()
+
+    def test_file_writer(self, tmp_path):
+        path = tmp_path / "metrics.prom"
+        writer = MetricsFileWriter(lambda: _SAMPLE, path, interval_seconds=60.0)
+        writer.start()
+        writer.stop()
+        assert _parse(path.read_text(encoding="utf-8"))["ignition_crashes_total"] == 1
+
+
+class TestHeadlessMetrics:
+    def test_run_headless_serves_controller_metrics(self, tmp_path):
+        paths = AppPaths(config_dir=tmp_path / "config", log_dir=tmp_path / "logs")
+        config = AppConfig.default()
+        config.profiles[0].trigger_process_names = ["ign-no-such-trigger.exe"]
+        store = ConfigStore(paths=paths, config=config)
+        state = AppState(config_store=store, controller=IgnitionController(store))
+
+        stop = threading.Event()
+        metrics_file = tmp_path / "metrics.prom"
+        thread = threading.Thread(
+            target=state.run_headless,
+            kwargs={"metrics_file": metrics_file, "metrics_interval": 0.1, "stop_event": stop},
+        )
+        thread.start()
+        try:
+            deadline = time.monotonic() + 5.0
+            while time.monotonic() < deadline:
+                if metrics_file.exists():
+                    values = _parse(metrics_file.read_text(encoding="utf-8"))
+                    if values.get("ignition_process_scans_total", 0) >= 1:
+                        break
+                time.sleep(0.05)
+            else:
+                raise AssertionError("metrics file never reported a scan")
+            assert values["ignition_iracing_running"] == 0
+        finally:
+            stop.set()
+            thread.join(timeout=10.0)
+        assert not thread.is_alive()
+
+    def test_taken_port_does_not_stop_headless_mode(self, tmp_path):
+        paths = AppPaths(config_dir=tmp_path / "config", log_dir=tmp_path / "logs")
+        config = AppConfig.default()
+        config.profiles[0].trigger_process_names = ["ign-no-such-trigger.exe"]
+        store = ConfigStore(paths=paths, config=config)
+        controller = IgnitionController(store)
+        state = AppState(config_store=store, controller=controller)
+
+        with socket.socket() as taken:
+            taken.bind(("127.0.0.1", 0))
+            taken.listen()
+            stop = threading.Event()
+            thread = threading.Thread(
+                target=state.run_headless,
+                kwargs={"metrics_port": taken.getsockname()[1], "stop_event": stop},
+            )
+            thread.start()
+            try:
+                deadline = time.monotonic() + 5.0
+                while controller.get_metrics()["process_scans_total"] < 1:
+                    assert time.monotonic() < deadline, "controller never scanned"
+                    time.sleep(0.05)
+                assert thread.is_alive()  # still running, just without the endpoint
+            finally:
+                stop.set()
+                thread.join(timeout=10.0)
+        assert not thread.is_alive()
+        assert controller._monitor._thread is None  # and shut down on the way out
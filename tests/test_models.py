@@ -1,7 +1,12 @@
 """Tests for core data models (ManagedApp, Profile, AppConfig)."""
+import os
+import subprocess
+import sys
+
 import pytest
 
-from ignition.core.models import AppConfig, ManagedApp, Profile
+import ignition
+from ignition.core.models import AppConfig, ManagedApp, Profile, TriggerProcessPolicy
 
 
 class TestManagedApp:
@@ -37,6 +42,27 @@ class TestManagedApp:
         app = ManagedApp.from_dict({"name": "A", "executable_path": "B"})
         assert app.app_id  # should be a generated UUID
 
+    def test_process_tuning_fields(self):
+        app = ManagedApp.from_dict({
+            "app_id": "x", "name": "A", "executable_path": "B",
+            "priority": "below_normal", "cpu_affinity": "4-6", "io_priority": "low",
+        })
+        assert (app.priority, app.cpu_affinity, app.io_priority) == ("below_normal", [4, 5, 6], "low")
+        assert ManagedApp.from_dict(app.to_dict()) == app
+
+    def test_process_tuning_invalid_values_mean_unchanged(self):
+        app = ManagedApp.from_dict({
+            "name": "A", "executable_path": "B",
+            "priority": "turbo", "cpu_affinity": "x", "io_priority": "max",
+        })
+        assert (app.priority, app.cpu_affinity, app.io_priority) == ("", [], "")
+
+    def test_suspend_while_driving_roundtrip(self):
+        app = ManagedApp.from_dict({"name": "A", "executable_path": "B"})
+        assert app.suspend_while_driving is False
+        app.suspend_while_driving = True
+        assert ManagedApp.from_dict(app.to_dict()).suspend_while_driving is True
+
 
 class TestProfile:
     def test_create_default(self):
@@ -68,6 +94,26 @@ class TestProfile:
         assert len(p.apps) == 1
 
 
+class TestTriggerProcessPolicy:
+    def test_default_is_off(self):
+        profile = Profile.from_dict({"name": "P"})
+        assert profile.trigger_policy.enabled is False
+        assert profile.trigger_policy.reserved_cores == []
+
+    def test_roundtrip_through_profile(self):
+        profile = Profile.create_default()
+        profile.trigger_policy = TriggerProcessPolicy(
+            enabled=True, priority="high", reserved_cores=[0, 1, 2, 3]
+        )
+        again = Profile.from_dict(profile.to_dict())
+        assert again.trigger_policy == profile.trigger_policy
+        assert profile.to_dict()["trigger_policy"]["reserved_cores"] == [0, 1, 2, 3]
+
+    def test_accepts_core_ranges(self):
+        policy = TriggerProcessPolicy.from_dict({"enabled": True, "reserved_cores": "2-3"})
+        assert policy.reserved_cores == [2, 3]
+
+
 class TestAppConfig:
     def test_default(self):
         cfg = AppConfig.default()
@@ -100,3 +146,30 @@ class TestAppConfig:
         raw["trigger_mode"] = "race"
         cfg = AppConfig.from_dict(raw)
         assert cfg.trigger_mode == "race"
+
+    def test_shutdown_timeout_roundtrip(self):
+        cfg = AppConfig.default()
+        assert cfg.shutdown_timeout_seconds == 10.0
+        cfg.shutdown_timeout_seconds = 4.5
+        assert AppConfig.from_dict(cfg.to_dict()).shutdown_timeout_seconds == 4.5
+
+    def test_activity_log_capacity_roundtrip(self):
+        cfg = AppConfig.default()
+        assert cfg.activity_log_capacity == 200
+        cfg.activity_log_capacity = 1000
+        assert AppConfig.from_dict(cfg.to_dict()).activity_log_capacity == 1000
+
+    def test_cpu_budget_off_by_default_and_roundtrips(self):
+        cfg = AppConfig.default()
+        assert cfg.cpu_budget_percent == 0.0
+        cfg.cpu_budget_percent = 5.0
+        assert AppConfig.from_dict(cfg.to_dict()).cpu_budget_percent == 5.0
+        assert AppConfig.from_dict({}).cpu_budget_percent == 0.0
+
+
+class TestImports:
+    def test_models_do_not_pull_in_psutil(self):
+        code = "import sys, ignition.core.models; sys.exit('psutil' in sys.modules)"
+        src = os.path.dirname(os.path.dirname(ignition.__file__))
+        env = {**os.environ, "PYTHONPATH": src}
+        assert subprocess.run([sys.executable, "-c", code], env=env).returncode == 0
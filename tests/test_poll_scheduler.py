@@ -0,0 +1,105 @@
+"""Tests for the adaptive poll scheduler and interruptible monitor sleep."""
+import threading
+import time
+
+from ignition.core.iracing_monitor import IRacingMonitor
+from ignition.core.poll_scheduler import AdaptivePollScheduler
+from ignition.core.process_events import ProcessEventSource
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _scheduler(clock: FakeClock) -> AdaptivePollScheduler:
+    return AdaptivePollScheduler(
+        fast_interval=0.25,
+        fast_window_seconds=60.0,
+        idle_after_seconds=600.0,
+        idle_multiplier=5.0,
+        max_interval=4.0,
+        clock=clock,
+    )
+
+
+class TestAdaptivePollScheduler:
+    def test_uses_base_interval_normally(self):
+        clock = FakeClock()
+        sched = _scheduler(clock)
+        assert sched.next_interval(1.0) == 1.0
+        assert sched.mode == "normal"
+
+    def test_backs_off_after_long_idle(self):
+        clock = FakeClock()
+        sched = _scheduler(clock)
+        clock.now += 601
+        assert sched.next_interval(1.0) == 4.0  # 5x base, capped at max_interval
+        assert sched.mode == "idle"
+
+    def test_tightens_after_transition(self):
+        clock = FakeClock()
+        sched = _scheduler(clock)
+        clock.now += 601
+        sched.record_transition()
+        assert sched.next_interval(1.0) == 0.25
+        clock.now += 61
+        assert sched.next_interval(1.0) == 1.0
+
+    def test_tightens_while_armed(self):
+        clock = FakeClock()
+        sched = _scheduler(clock)
+        clock.now += 601
+        assert sched.next_interval(1.0, armed=True) == 0.25
+        assert sched.mode == "fast"
+
+    def test_never_slower_than_base(self):
+        clock = FakeClock()
+        sched = _scheduler(clock)
+        clock.now += 601
+        assert sched.next_interval(8.0) == 8.0
+
+    def test_scan_cost_history_is_bounded(self):
+        sched = AdaptivePollScheduler(history_size=3)
+        for cost in (0.001, 0.002, 0.003, 0.004):
+            sched.record_scan(cost)
+        assert sched.recent_scan_costs() == [0.002, 0.003, 0.004]
+        assert sched.stats()["recent_scan_ms"] == [2.0, 3.0, 4.0]
+
+
+class TestMonitorStop:
+    def test_stop_does_not_wait_out_interval(self):
+        monitor = IRacingMonitor(
+            get_trigger_process_names=lambda: [],
+            get_poll_interval_seconds=lambda: 60.0,
+            on_iracing_started=lambda: None,
+            on_iracing_stopped=lambda: None,
+            event_source_factory=ProcessEventSource,
+        )
+        monitor.start()
+        time.sleep(0.1)
+        started = time.monotonic()
+        monitor.stop()
+        assert time.monotonic() - started < 1.0
+        assert not any(t.name == "iracing-monitor" for t in threading.enumerate())
+
+    def test_stats_expose_interval_and_scan_costs(self):
+        monitor = IRacingMonitor(
+            get_trigger_process_names=lambda: [],
+            get_poll_interval_seconds=lambda: 60.0,
+            on_iracing_started=lambda: None,
+            on_iracing_stopped=lambda: None,
+            event_source_factory=ProcessEventSource,
+        )
+        monitor.start()
+        try:
+            time.sleep(0.1)
+            stats = monitor.get_stats()
+        finally:
+            monitor.stop()
+        assert stats["poll_interval_seconds"] == 60.0
+        assert len(stats["recent_scan_ms"]) == 1
+        assert stats["event_source"] == "polling"
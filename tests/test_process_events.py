@@ -0,0 +1,194 @@
+"""Tests for process event sources and their use by IRacingMonitor."""
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from ignition.core.iracing_monitor import SIM_PROCESS_NAME, IRacingMonitor
+from ignition.core.process_events import (
+    NetlinkEventSource,
+    PidfdEventSource,
+    ProcessEventSource,
+)
+from ignition.core.process_utils import ProcessSnapshotService
+
+_LINUX = sys.platform.startswith("linux")
+
+
+def _netlink_or_skip() -> NetlinkEventSource:
+    if not _LINUX:
+        pytest.skip("netlink process connector is Linux-only")
+    try:
+        return NetlinkEventSource()
+    except OSError as exc:
+        pytest.skip(f"netlink process connector not permitted: {exc}")
+
+
+def _sleeper(tmp_path, name: str) -> str:
+    """Copy of ``sleep`` under a unique name so nothing else on the box matches it."""
+    sleep = shutil.which("sleep")
+    if sleep is None:
+        pytest.skip("sleep binary not available")
+    path = tmp_path / name
+    shutil.copy(sleep, path)
+    return str(path)
+
+
+class TestPollingSource:
+    def test_wait_times_out(self):
+        source = ProcessEventSource()
+        started = time.monotonic()
+        assert source.wait(0.05) is None
+        assert time.monotonic() - started >= 0.04
+
+    def test_wake_interrupts_wait(self):
+        source = ProcessEventSource()
+        threading.Timer(0.05, source.wake).start()
+        started = time.monotonic()
+        assert source.wait(5.0) is not None
+        assert time.monotonic() - started < 1.0
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd_open unavailable")
+class TestPidfdSource:
+    def test_exit_wakes_waiter(self):
+        source = PidfdEventSource()
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            source.watch(names=[], pids=[proc.pid])
+            threading.Timer(0.1, proc.kill).start()
+            started = time.monotonic()
+            events = source.wait(5.0)
+            assert events is not None
+            assert events.exited == {proc.pid}
+            assert time.monotonic() - started < 1.0
+        finally:
+            proc.kill()
+            proc.wait()
+            source.close()
+
+
+class TestNetlinkSource:
+    def test_exec_and_exit_reported(self, tmp_path):
+        source = _netlink_or_skip()
+        exe = _sleeper(tmp_path, "ign-evt-exec")
+        try:
+            source.watch(names=["ign-evt-exec"], pids=[])
+            proc = subprocess.Popen([exe, "30"])
+            events = source.wait(5.0)
+            assert events is not None and proc.pid in events.started
+
+            source.watch(names=["ign-evt-exec"], pids=[proc.pid])
+            proc.kill()
+            events = source.wait(5.0)
+            assert events is not None and proc.pid in events.exited
+            proc.wait()
+        finally:
+            source.close()
+
+
+class TestMonitorLatency:
+    def test_start_and_stop_detected_between_polls(self, tmp_path):
+        _netlink_or_skip().close()
+        exe = _sleeper(tmp_path, "ign-evt-trig")
+        started, stopped = threading.Event(), threading.Event()
+        monitor = IRacingMonitor(
+            get_trigger_process_names=lambda: ["ign-evt-trig"],
+            get_poll_interval_seconds=lambda: 30.0,
+            on_iracing_started=started.set,
+            on_iracing_stopped=stopped.set,
+            snapshots=ProcessSnapshotService(),
+        )
+        monitor.start()
+        proc = None
+        try:
+            time.sleep(0.2)  # let the first scan settle
+            proc = subprocess.Popen([exe, "30"])
+            assert started.wait(2.0)
+            proc.kill()
+            proc.wait()
+            assert stopped.wait(2.0)
+        finally:
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            monitor.stop()
+
+
+class TestSimTransitions:
+    def test_sim_start_and_exit_reported(self, tmp_path):
+        exe = _sleeper(tmp_path, SIM_PROCESS_NAME)
+        changes: list[bool] = []
+        changed = threading.Condition()
+
+        def on_sim_changed(running: bool) -> None:
+            with changed:
+                changes.append(running)
+                changed.notify_all()
+
+        monitor = IRacingMonitor(
+            get_trigger_process_names=lambda: ["ign-no-such-trigger"],
+            get_poll_interval_seconds=lambda: 0.25,
+            on_iracing_started=lambda: None,
+            on_iracing_stopped=lambda: None,
+            on_sim_changed=on_sim_changed,
+            snapshots=ProcessSnapshotService(),
+            event_source_factory=ProcessEventSource,
+        )
+        monitor.start()
+        proc = None
+        try:
+            proc = subprocess.Popen([exe, "30"])
+            with changed:
+                assert changed.wait_for(lambda: changes == [True], timeout=5.0)
+            proc.kill()
+            proc.wait()
+            with changed:
+                assert changed.wait_for(lambda: changes == [True, False], timeout=5.0)
+        finally:
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            monitor.stop()
+
+    def test_transitions_delivered_in_order(self, tmp_path):
+        exe = _sleeper(tmp_path, SIM_PROCESS_NAME)
+        changes: list[bool] = []
+        changed = threading.Condition()
+        entered = threading.Event()
+
+        def on_sim_changed(running: bool) -> None:
+            if running:
+                entered.set()
+                time.sleep(1.0)  # still handling the start when the exit is seen
+            with changed:
+                changes.append(running)
+                changed.notify_all()
+
+        monitor = IRacingMonitor(
+            get_trigger_process_names=lambda: ["ign-no-such-trigger"],
+            get_poll_interval_seconds=lambda: 0.1,
+            on_iracing_started=lambda: None,
+            on_iracing_stopped=lambda: None,
+            on_sim_changed=on_sim_changed,
+            snapshots=ProcessSnapshotService(),
+            event_source_factory=ProcessEventSource,
+        )
+        monitor.start()
+        proc = subprocess.Popen([exe, "30"])
+        try:
+            assert entered.wait(5.0)
+            proc.kill()
+            proc.wait()
+            with changed:
+                assert changed.wait_for(lambda: len(changes) == 2, timeout=5.0)
+            assert changes == [True, False]
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            monitor.stop()
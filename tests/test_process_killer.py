@@ -0,0 +1,124 @@
+"""Tests for process termination helpers (POSIX backend)."""
+import os
+import time
+
+import psutil
+import pytest
+
+from ignition.core.process_killer import (
+    graceful_terminate_process,
+    graceful_terminate_process_tree,
+    request_close,
+    resume_processes,
+    suspend_process_tree,
+    terminate_process,
+)
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="exercises the POSIX backend")
+
+_SLEEP = "import time; time.sleep(60)"
+_PARENT_WITH_CHILD = (
+    "import subprocess, sys, time\n"
+    f"subprocess.Popen([sys.executable, '-c', {_SLEEP!r}])\n"
+    "time.sleep(60)\n"
+)
+_IGNORES_SIGTERM = (
+    "import signal, time\n"
+    "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+    "time.sleep(60)\n"
+)
+
+
+def _wait_for_children(pid: int, count: int) -> list[psutil.Process]:
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        children = psutil.Process(pid).children(recursive=True)
+        if len(children) >= count:
+            return children
+        time.sleep(0.05)
+    raise AssertionError("child process did not appear")
+
+
+class TestRequestClose:
+    def test_closes_whole_set_in_one_call(self, spawn):
+        procs = [spawn() for _ in range(3)]
+        try:
+            sent = request_close(p.pid for p in procs)
+            assert sent == {p.pid for p in procs}
+            for p in procs:
+                assert p.wait(timeout=5.0) != 0
+        finally:
+            for p in procs:
+                p.kill()
+                p.wait()
+
+    def test_missing_pids_are_skipped(self, spawn):
+        proc = spawn()
+        proc.kill()
+        proc.wait()
+        assert request_close([proc.pid]) == set()
+        assert request_close([]) == set()
+
+
+class TestGracefulTerminate:
+    def test_single_process_exits_gracefully(self, spawn):
+        proc = spawn()
+        result = graceful_terminate_process(proc.pid, 3.0)
+        assert result.outcome == "graceful"
+        assert not result.killed
+        assert [(e.pid, e.phase) for e in result.exits] == [(proc.pid, "close")]
+        # returns as soon as the process is gone, not after the grace period
+        assert result.duration_seconds < 1.0
+        assert proc.wait(timeout=1.0) is not None
+
+    def test_tree_exits_gracefully(self, spawn):
+        proc = spawn(_PARENT_WITH_CHILD)
+        child = _wait_for_children(proc.pid, 1)[0]
+        result = graceful_terminate_process_tree(proc.pid, 3.0)
+        assert result.outcome == "graceful"
+        assert {e.pid for e in result.exits} == {proc.pid, child.pid}
+        proc.wait(timeout=1.0)
+        assert not child.is_running() or child.status() == psutil.STATUS_ZOMBIE
+
+    def test_ignored_close_request_escalates_to_kill(self, spawn):
+        proc = spawn(_IGNORES_SIGTERM)
+        time.sleep(0.3)  # let it install the handler
+        result = graceful_terminate_process(proc.pid, 0.3, timeout_seconds=0.3)
+        assert result.outcome == "killed"
+        assert result.killed
+        assert [e.phase for e in result.exits] == ["kill"]
+        proc.wait(timeout=1.0)
+
+    def test_already_gone(self, spawn):
+        proc = spawn()
+        proc.kill()
+        proc.wait()
+        result = terminate_process(proc.pid)
+        assert result.outcome == "gone"
+        assert result.exits == ()
+
+
+class TestSuspend:
+    def test_tree_suspended_and_resumed(self, spawn):
+        proc = spawn(_PARENT_WITH_CHILD)
+        try:
+            child = _wait_for_children(proc.pid, 1)[0]
+            suspended = suspend_process_tree(proc.pid)
+            assert [p.pid for p in suspended] == [proc.pid, child.pid]
+            deadline = time.monotonic() + 2.0
+            while {p.status() for p in suspended} != {psutil.STATUS_STOPPED}:
+                assert time.monotonic() < deadline
+                time.sleep(0.02)
+
+            assert resume_processes(suspended) == 2
+            assert psutil.STATUS_STOPPED not in {p.status() for p in suspended}
+        finally:
+            graceful_terminate_process_tree(proc.pid, 0.0)
+
+    def test_exited_process_skipped(self, spawn):
+        proc = spawn()
+        suspended = suspend_process_tree(proc.pid, tree=False)
+        proc.kill()
+        proc.wait()
+        assert resume_processes(suspended) == 0
+        assert suspend_process_tree(proc.pid) == []
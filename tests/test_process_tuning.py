@@ -0,0 +1,129 @@
+"""Tests for per-app priority, CPU affinity and I/O priority."""
+import sys
+import time
+
+import psutil
+import pytest
+
+from ignition.core.process_tuning import (
+    DescendantTuner,
+    ProcessTuning,
+    apply_tuning,
+    capture_tuning,
+    restore_tuning,
+    without_cores,
+)
+from ignition.core.tuning_policy import format_cpu_list, normalize_priority, parse_cpu_list
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux psutil APIs")
+
+
+class TestCpuLists:
+    def test_parse_and_format_roundtrip(self):
+        assert parse_cpu_list("4-7, 9,0") == [0, 4, 5, 6, 7, 9]
+        assert format_cpu_list([0, 4, 5, 6, 7, 9]) == "0,4-7,9"
+        assert parse_cpu_list("") == []
+
+    @pytest.mark.parametrize("bad", ["a", "3-1", "-2", "1-x"])
+    def test_rejects_garbage(self, bad):
+        with pytest.raises(ValueError):
+            parse_cpu_list(bad)
+
+
+class TestNormalizePriority:
+    def test_levels_and_nice_values(self):
+        assert normalize_priority("Below_Normal") == "below_normal"
+        assert normalize_priority("5") == "5"
+        assert normalize_priority(-40) == "-20"
+        assert normalize_priority("turbo") == ""
+        assert normalize_priority(None) == ""
+
+
+class TestWithoutCores:
+    def test_unpinned_app_gets_every_other_core(self, monkeypatch):
+        monkeypatch.setattr(psutil, "cpu_count", lambda *a, **k: 8)
+        tuning = without_cores(ProcessTuning(priority="idle"), [0, 1])
+        assert tuning.cpu_affinity == (2, 3, 4, 5, 6, 7)
+        assert tuning.priority == "idle"
+
+    def test_pinned_app_loses_only_reserved_cores(self):
+        assert without_cores(ProcessTuning(cpu_affinity=(1, 2, 3)), [3]).cpu_affinity == (1, 2)
+
+    def test_app_pinned_only_to_reserved_cores_keeps_its_setting(self):
+        tuning = ProcessTuning(cpu_affinity=(0,))
+        assert without_cores(tuning, [0]) is tuning
+
+    def test_nothing_reserved_is_a_no_op(self):
+        tuning = ProcessTuning(priority="idle")
+        assert without_cores(tuning, []) is tuning
+
+
+@linux_only
+class TestApplyTuning:
+    def test_applies_priority_affinity_and_io(self, spawn):
+        proc = spawn()
+        tuning = ProcessTuning(priority="below_normal", cpu_affinity=(0,), io_priority="very_low")
+        assert apply_tuning(proc.pid, tuning) == []
+        p = psutil.Process(proc.pid)
+        assert p.nice() == 10
+        assert p.cpu_affinity() == [0]
+        assert p.ionice().ioclass == psutil.IOPRIO_CLASS_IDLE
+
+    def test_reports_cores_that_do_not_exist(self, spawn):
+        proc = spawn()
+        count = psutil.cpu_count()
+        failures = apply_tuning(proc.pid, ProcessTuning(cpu_affinity=(count + 1,)))
+        assert len(failures) == 1 and "only" in failures[0]
+
+    def test_exited_process_is_not_a_failure(self, spawn):
+        proc = spawn("pass")
+        proc.wait(5)
+        assert apply_tuning(proc.pid, ProcessTuning(priority="idle")) == []
+
+
+    def test_capture_and_restore(self, spawn):
+        proc = spawn()
+        saved = capture_tuning(proc.pid)
+        assert saved is not None and saved.nice == 0
+        apply_tuning(proc.pid, ProcessTuning(priority="7"))
+        assert psutil.Process(proc.pid).nice() == 7
+        assert restore_tuning(saved) == []
+        assert psutil.Process(proc.pid).nice() == 0
+
+    def test_restore_skips_exited_process(self, spawn):
+        proc = spawn("import time; time.sleep(0.2)")
+        saved = capture_tuning(proc.pid)
+        proc.wait(5)
+        assert restore_tuning(saved) == []
+
+
+@linux_only
+class TestDescendantTuner:
+    def test_tunes_children_started_later(self, spawn):
+        code = (
+            "import subprocess, sys, time\n"
+            "time.sleep(0.3)\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "time.sleep(30)\n"
+        )
+        parent = spawn(code)
+        failures = []
+        tuner = DescendantTuner(lambda key, msgs: failures.append((key, msgs)))
+        tuner.track("app", parent.pid, ProcessTuning(priority="idle"))
+        try:
+            deadline = time.monotonic() + 5
+            children = []
+            while not children and time.monotonic() < deadline:
+                time.sleep(0.05)
+                children = psutil.Process(parent.pid).children()
+            tuner.scan_once()
+        finally:
+            tuner.stop()
+        assert children and children[0].nice() == 19
+        assert tuner.tuned_count == 1
+        assert failures == []
+
+    def test_empty_tuning_is_not_tracked(self):
+        tuner = DescendantTuner(lambda key, msgs: None)
+        tuner.track("app", 1, ProcessTuning())
+        assert tuner._thread is None
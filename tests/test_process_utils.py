@@ -0,0 +1,280 @@
+"""Tests for the process table and the shared snapshot service."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+
+import psutil
+
+from ignition.core import process_utils
+from ignition.core.process_utils import (
+    ExePathCache,
+    ProcessEntry,
+    ProcessSnapshot,
+    ProcessSnapshotService,
+    ProcessTable,
+)
+
+
+def _fake_os(
+    monkeypatch, pids: set[int], create_times: dict[int, float] | None = None
+) -> list[int]:
+    """Serve ``pids`` as the live PID set and record every attribute lookup.
+
+    A PID's create_time is ``create_times[pid]``, defaulting to the PID itself.
+    """
+    resolved: list[int] = []
+    create_times = {} if create_times is None else create_times
+
+    def fake_create_time(pid: int) -> float | None:
+        return create_times.get(pid, float(pid)) if pid in pids else None
+
+    def fake_resolve(pid: int) -> ProcessEntry:
+        resolved.append(pid)
+        return ProcessEntry(
+            pid=pid, name=f"p{pid}.exe", exe="", create_time=fake_create_time(pid)
+        )
+
+    monkeypatch.setattr(process_utils.psutil, "pids", lambda: sorted(pids))
+    monkeypatch.setattr(process_utils, "_resolve_entry", fake_resolve)
+    monkeypatch.setattr(process_utils, "_current_create_time", fake_create_time)
+    return resolved
+
+
+class TestProcessTable:
+    def test_only_new_pids_are_resolved(self, monkeypatch):
+        pids = {1, 2, 3}
+        resolved = _fake_os(monkeypatch, pids)
+        table = ProcessTable()
+        added, removed = table.refresh()
+        assert sorted(e.pid for e in added) == [1, 2, 3]
+        assert removed == []
+
+        table.refresh()  # new entries get one confirming lookup
+        resolved.clear()
+
+        pids.add(4)
+        added, _ = table.refresh()
+        assert [e.pid for e in added] == [4]
+        assert resolved == [4]
+        resolved.clear()
+        table.refresh()
+        table.refresh()
+        assert resolved == [4]
+
+    def test_vanished_pids_are_evicted(self, monkeypatch):
+        pids = {1, 2, 3}
+        _fake_os(monkeypatch, pids)
+        table = ProcessTable()
+        table.refresh()
+        pids.discard(2)
+        _, removed = table.refresh()
+        assert [e.pid for e in removed] == [2]
+        assert table.get(2) is None
+        assert len(table) == 2
+        assert table.evicted_count == 1
+
+    def test_real_child_process_tracked(self):
+        table = ProcessTable()
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            table.refresh()
+            entry = table.get(proc.pid)
+            assert entry is not None
+            assert entry.create_time == psutil.Process(proc.pid).create_time()
+        finally:
+            proc.kill()
+            proc.wait()
+        table.refresh()
+        assert table.get(proc.pid) is None
+
+
+class TestDescendants:
+    def test_children_found_through_ppid(self):
+        snapshot = ProcessSnapshot(
+            taken_at=0.0,
+            entries=(
+                ProcessEntry(pid=10, name="app.exe", exe="", create_time=5.0, ppid=1),
+                ProcessEntry(pid=11, name="child.exe", exe="", create_time=6.0, ppid=10),
+                ProcessEntry(pid=12, name="grandchild.exe", exe="", create_time=7.0, ppid=11),
+                # claims pid 10 as parent but is older: it belonged to an earlier pid 10
+                ProcessEntry(pid=13, name="orphan.exe", exe="", create_time=1.0, ppid=10),
+            ),
+        )
+        assert sorted(snapshot.descendants(10)) == [11, 12]
+        assert snapshot.descendants(12) == []
+
+    def test_real_child_process(self):
+        code = (
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "time.sleep(30)\n"
+        )
+        proc = subprocess.Popen([sys.executable, "-c", code])
+        try:
+            service = ProcessSnapshotService()
+            children: list[int] = []
+            for _ in range(100):
+                children = service.get(max_age_seconds=0).descendants(proc.pid)
+                if children:
+                    break
+                time.sleep(0.05)
+            assert children == [c.pid for c in psutil.Process(proc.pid).children(recursive=True)]
+        finally:
+            for child in psutil.Process(proc.pid).children(recursive=True):
+                child.kill()
+            proc.kill()
+            proc.wait()
+
+
+class TestExePathCache:
+    def test_normalized_once_per_process_lifetime(self, monkeypatch):
+        calls: list[str] = []
+
+        def fake_normalize(path: str) -> str:
+            calls.append(path)
+            return path.lower()
+
+        monkeypatch.setattr(process_utils, "normalize_windows_path", fake_normalize)
+        cache = ExePathCache()
+        entry = ProcessEntry(pid=7, name="a.exe", exe=r"C:\A.exe", create_time=1.0)
+        assert cache.get(entry) == r"c:\a.exe"
+        assert cache.get(entry) == r"c:\a.exe"
+        assert calls == [r"C:\A.exe"]
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+        reused = ProcessEntry(pid=7, name="b.exe", exe=r"C:\B.exe", create_time=2.0)
+        assert cache.get(reused) == r"c:\b.exe"
+        cache.evict([entry, reused])
+        assert len(cache) == 0
+
+    def test_live_only_keeps_nothing_for_retired_processes(self):
+        cache = ExePathCache(live_only=True)
+        live = ProcessEntry(pid=7, name="a.exe", exe=r"C:\A.exe", create_time=1.0)
+        gone = ProcessEntry(pid=8, name="b.exe", exe=r"C:\B.exe", create_time=1.0)
+        cache.add_live([live, gone])
+        cache.evict([gone])
+        cache.get(live)
+        cache.get(gone)  # e.g. a reader still holding an older snapshot
+        assert len(cache) == 1
+
+    def test_old_snapshot_does_not_refill_the_service_cache(self):
+        service = ProcessSnapshotService(max_age_seconds=60.0)
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        exe = psutil.Process(proc.pid).exe()
+        old = service.get(max_age_seconds=0.0)
+        proc.kill()
+        proc.wait()
+        fresh = service.get(max_age_seconds=0.0)
+        assert proc.pid not in {e.pid for e in fresh.entries}
+        assert proc.pid in {e.pid for e in old.entries}
+        assert proc.pid not in old.pids_for_exe(exe)  # checked against the live process
+        assert proc.pid not in {pid for pid, _ in service._exe_paths._paths}
+
+    def test_service_evicts_exited_processes(self):
+        service = ProcessSnapshotService(max_age_seconds=60.0)
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            snap = service.get(max_age_seconds=0.0)
+            assert proc.pid in snap.pids_for_exe(psutil.Process(proc.pid).exe())
+            hits = service.exe_cache_stats()["hits"]
+            service.get(max_age_seconds=0.0).pids_for_exe(sys.executable)
+            assert service.exe_cache_stats()["hits"] > hits
+        finally:
+            proc.kill()
+            proc.wait()
+        size = service.exe_cache_stats()["size"]
+        service.get(max_age_seconds=0.0)
+        assert service.exe_cache_stats()["size"] < size
+
+
+class TestRunningExecutables:
+    def test_one_pass_over_all_candidates(self, monkeypatch):
+        monkeypatch.setattr(process_utils, "normalize_windows_path", lambda p: p.lower())
+        snap = process_utils.ProcessSnapshot(
+            taken_at=0.0,
+            entries=(
+                ProcessEntry(pid=1, name="a.exe", exe=r"C:\A.exe"),
+                ProcessEntry(pid=2, name="b.exe", exe=r"C:\B.exe"),
+                ProcessEntry(pid=3, name="a.exe", exe=r"c:\a.exe"),
+                ProcessEntry(pid=4, name="system", exe=""),
+            ),
+        )
+        found = snap.running_executables([r"C:\A.exe", r"C:\C.exe", ""])
+        assert found == {r"C:\A.exe": [1, 3]}
+
+    def test_service_scans_once(self):
+        service = ProcessSnapshotService(max_age_seconds=60.0)
+        found = service.running_executables([sys.executable, "/no/such/exe"])
+        assert os.getpid() in found[sys.executable]
+        assert "/no/such/exe" not in found
+        assert service.scan_count == 1
+
+
+class TestProcessSnapshotService:
+    def test_snapshot_contains_current_process(self):
+        service = ProcessSnapshotService()
+        snap = service.get()
+        assert os.getpid() in {e.pid for e in snap.entries}
+
+    def test_name_lookup_is_case_insensitive(self):
+        service = ProcessSnapshotService()
+        own_name = psutil.Process().name()
+        assert service.any_name_running([own_name.upper()])
+        assert os.getpid() in service.pids_for_names([own_name])
+        assert not service.any_name_running(["definitely-not-running.exe"])
+
+    def test_empty_names_never_match(self):
+        service = ProcessSnapshotService()
+        assert not service.any_name_running([])
+        assert not service.any_name_running(["  "])
+
+    def test_snapshot_reused_within_max_age(self, monkeypatch):
+        service = ProcessSnapshotService(max_age_seconds=60.0)
+        first = service.get()
+        monkeypatch.setattr(service, "_refresh", lambda: None)
+        assert service.get() is first
+        assert service.scan_count == 1
+
+    def test_zero_max_age_forces_rescan(self):
+        service = ProcessSnapshotService(max_age_seconds=60.0)
+        first = service.get()
+        second = service.get(max_age_seconds=0.0)
+        assert second is not first
+        assert service.scan_count == 2
+
+    def test_reused_pid_left_out_of_matches_and_resolved_again(self, monkeypatch):
+        pids = {1, 2, 3}
+        create_times: dict[int, float] = {}
+        resolved = _fake_os(monkeypatch, pids, create_times)
+        service = ProcessSnapshotService(max_age_seconds=3600)
+        service.get()
+        service.get(max_age_seconds=0.0)  # new entries' confirming lookup
+        assert service.pids_for_names(["p2.exe"]) == [2]
+        resolved.clear()
+
+        create_times[2] = 99.0  # pid 2 exited and was handed to a new process
+        assert service.pids_for_names(["p2.exe"]) == []
+        assert not service.any_name_running(["p2.exe"])
+        assert resolved == []  # nothing re-resolved until the next scan
+
+        service.invalidate()
+        assert service.pids_for_names(["p2.exe"]) == [2]
+        assert [e.create_time for e in service.get().entries if e.pid == 2] == [99.0]
+        assert resolved == [2]
+
+    def test_exited_process_left_out_before_the_next_scan(self, monkeypatch):
+        pids = {1, 2, 3}
+        _fake_os(monkeypatch, pids)
+        service = ProcessSnapshotService(max_age_seconds=3600)
+        service.get()
+        pids.discard(3)
+        assert service.pids_for_names(["p1.exe", "p3.exe"]) == [1]
+
+    def test_invalidate_drops_snapshot(self):
+        service = ProcessSnapshotService(max_age_seconds=60.0)
+        first = service.get()
+        service.invalidate()
+        assert service.get() is not first
@@ -0,0 +1,80 @@
+"""Tests for the own-CPU resource governor."""
+from ignition.core.resource_governor import ResourceGovernor
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCpu:
+    def __init__(self) -> None:
+        self.seconds = 10.0
+
+    def __call__(self) -> float:
+        return self.seconds
+
+
+def _governor(budget: float = 5.0):
+    clock, cpu = FakeClock(), FakeCpu()
+    gov = ResourceGovernor(
+        get_budget_percent=lambda: budget, smoothing=1.0, max_stretch=4.0,
+        clock=clock, cpu_seconds=cpu,
+    )
+    return gov, clock, cpu
+
+
+def _burn(gov, clock, cpu, percent: float) -> None:
+    gov.usage_percent()
+    clock.now += 1.0
+    cpu.seconds += percent / 100.0
+    gov.usage_percent()
+
+
+class TestResourceGovernor:
+    def test_measures_percent_of_one_core(self):
+        gov, clock, cpu = _governor()
+        _burn(gov, clock, cpu, 20.0)
+        assert round(gov.usage_percent(), 6) == 20.0
+
+    def test_not_enforced_outside_a_session(self):
+        gov, clock, cpu = _governor()
+        _burn(gov, clock, cpu, 50.0)
+        assert not gov.over_budget()
+        assert gov.stretch(1.0) == 1.0
+        assert gov.allow_optional()
+
+    def test_over_budget_stretches_and_sheds(self):
+        gov, clock, cpu = _governor(budget=5.0)
+        gov.set_enforcing(True)
+        _burn(gov, clock, cpu, 10.0)
+        assert gov.over_budget()
+        assert round(gov.stretch(1.0), 6) == 2.0
+        assert not gov.allow_optional()
+        stats = gov.stats()
+        assert stats["over_budget"] and stats["enforcing"]
+        assert stats["stretch"] == 2.0
+        assert stats["throttled"] == 2
+
+    def test_stretch_is_capped(self):
+        gov, clock, cpu = _governor(budget=5.0)
+        gov.set_enforcing(True)
+        _burn(gov, clock, cpu, 100.0)
+        assert gov.stretch(0.5) == 2.0
+
+    def test_zero_budget_disables(self):
+        gov, clock, cpu = _governor(budget=0.0)
+        gov.set_enforcing(True)
+        _burn(gov, clock, cpu, 100.0)
+        assert gov.allow_optional()
+        assert not gov.stats()["enforcing"]
+
+    def test_samples_at_most_once_per_period(self):
+        gov, clock, cpu = _governor()
+        _burn(gov, clock, cpu, 10.0)
+        clock.now += 0.5
+        cpu.seconds += 1.0
+        assert round(gov.usage_percent(), 6) == 10.0
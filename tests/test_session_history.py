@@ -0,0 +1,73 @@
+"""Tests for the SQLite session history store."""
+import json
+
+from ignition.core.session_history import SessionHistoryStore
+
+
+def _entry(day: int, profile: str = "p1") -> dict:
+    return {
+        "started_at": f"2026-01-{day:02d}T20:00:00",
+        "ended_at": f"2026-01-{day:02d}T21:00:00",
+        "duration_seconds": 3600,
+        "profile_name": profile.upper(),
+        "profile_id": profile,
+        "apps_launched": ["SimHub"],
+    }
+
+
+class TestSessionHistoryStore:
+    def test_pages_newest_first(self, tmp_path):
+        store = SessionHistoryStore(tmp_path / "h.sqlite3")
+        for day in range(1, 11):
+            store.add(_entry(day))
+        first = store.page(limit=3)
+        assert [e["started_at"][8:10] for e in first] == ["10", "09", "08"]
+        second = store.page(limit=3, offset=3)
+        assert [e["started_at"][8:10] for e in second] == ["07", "06", "05"]
+        assert store.count() == 10
+        store.close()
+
+    def test_retention_is_unbounded(self, tmp_path):
+        store = SessionHistoryStore(tmp_path / "h.sqlite3")
+        for i in range(120):
+            store.add(_entry(1 + i % 28))
+        assert store.count() == 120
+        store.close()
+
+    def test_filter_by_profile(self, tmp_path):
+        store = SessionHistoryStore(tmp_path / "h.sqlite3")
+        store.add(_entry(1, "a"))
+        store.add(_entry(2, "b"))
+        store.add(_entry(3, "a"))
+        assert [e["profile_id"] for e in store.page(profile_id="a")] == ["a", "a"]
+        assert store.count(profile_id="b") == 1
+        store.close()
+
+    def test_persists_across_reopen_and_clear(self, tmp_path):
+        store = SessionHistoryStore(tmp_path / "h.sqlite3")
+        store.add(_entry(1))
+        store.close()
+        reopened = SessionHistoryStore(tmp_path / "h.sqlite3")
+        assert reopened.page() == [_entry(1)]
+        reopened.clear()
+        assert reopened.count() == 0
+        reopened.close()
+
+    def test_legacy_json_migrated_once(self, tmp_path):
+        legacy = tmp_path / "session_history.json"
+        legacy.write_text(json.dumps([_entry(1), _entry(2)]), encoding="utf-8")
+        store = SessionHistoryStore(tmp_path / "h.sqlite3", legacy_json=legacy)
+        assert store.count() == 2
+        store.close()
+        assert not legacy.exists()
+        assert (tmp_path / "session_history.json.migrated").exists()
+
+        # a stray copy reappearing is not imported a second time
+        legacy.write_text(json.dumps([_entry(3)]), encoding="utf-8")
+        again = SessionHistoryStore(tmp_path / "h.sqlite3", legacy_json=legacy)
+        assert again.count() == 2
+        again.close()
+
+    def test_construction_does_not_touch_disk(self, tmp_path):
+        SessionHistoryStore(tmp_path / "sub" / "h.sqlite3")
+        assert not (tmp_path / "sub").exists()
@@ -0,0 +1,69 @@
+"""Tests for incrementally maintained session analytics."""
+import datetime
+
+from ignition.core.session_stats import SessionAnalytics
+
+
+def _entry(started_at: str, seconds: int, profile: str = "p1", apps=("SimHub",)) -> dict:
+    return {
+        "started_at": started_at,
+        "duration_seconds": seconds,
+        "profile_id": profile,
+        "profile_name": profile.upper(),
+        "apps_launched": list(apps),
+    }
+
+
+class TestSessionAnalytics:
+    def test_totals_and_buckets(self):
+        stats = SessionAnalytics()
+        stats.record(_entry("2026-01-05T20:00:00", 3600))
+        stats.record(_entry("2026-01-06T20:00:00", 1800, apps=("SimHub", "CrewChief")))
+        stats.record(_entry("2026-01-12T20:00:00", 5400, profile="p2", apps=()))
+
+        s = stats.summary()
+        assert s["sessions"] == 3
+        assert s["total_hours"] == 3.0
+        assert s["average_seconds"] == 3600
+        assert [(p["profile_id"], p["sessions"]) for p in s["profiles"]] == [("p1", 2), ("p2", 1)]
+        assert s["profiles"][0]["total_hours"] == 1.5
+        assert s["apps"] == [
+            {"name": "SimHub", "launches": 2},
+            {"name": "CrewChief", "launches": 1},
+        ]
+        assert [(w["week"], w["sessions"]) for w in s["weeks"]] == [("2026-W02", 2), ("2026-W03", 1)]
+        assert [d["day"] for d in s["days"]] == ["2026-01-05", "2026-01-06", "2026-01-12"]
+
+    def test_empty_summary(self):
+        s = SessionAnalytics().summary()
+        assert s["sessions"] == 0
+        assert s["average_seconds"] == 0
+        assert s["profiles"] == [] and s["apps"] == []
+
+    def test_persist_roundtrip(self, tmp_path):
+        stats = SessionAnalytics()
+        stats.record(_entry("2026-01-05T20:00:00", 3600))
+        path = tmp_path / "stats.json"
+        stats.save(path)
+        loaded = SessionAnalytics.load(path)
+        assert loaded is not None
+        assert loaded.summary() == stats.summary()
+        loaded.record(_entry("2026-01-05T22:00:00", 600))
+        assert loaded.summary()["days"] == [
+            {"day": "2026-01-05", "sessions": 2, "total_seconds": 4200}
+        ]
+
+    def test_load_missing_or_corrupt(self, tmp_path):
+        assert SessionAnalytics.load(tmp_path / "missing.json") is None
+        bad = tmp_path / "bad.json"
+        bad.write_text("{nope", encoding="utf-8")
+        assert SessionAnalytics.load(bad) is None
+
+    def test_old_day_buckets_pruned(self):
+        stats = SessionAnalytics()
+        day = datetime.date(2024, 1, 1)
+        for i in range(450):
+            stats.record(_entry((day + datetime.timedelta(days=i)).isoformat(), 60))
+        assert len(stats.days) == 400
+        assert stats.sessions == 450
+        assert sum(v[0] for v in stats.weeks.values()) == 450
@@ -0,0 +1,154 @@
+"""Tests for the change-driven, delta-encoded status push."""
+import json
+import re
+import threading
+import time
+
+import pytest
+
+from ignition.gui.web.status_push import StatusPusher
+
+
+class FakeFrontend:
+    """Stands in for the API and the window: records what would be evaluated."""
+
+    def __init__(self) -> None:
+        self.status = {"iracing_running": False, "running_app_ids": [], "paused": False}
+        self.entries: list[dict] = []
+        self.status_reads = 0
+        self.calls: list[tuple[str, dict, list]] = []
+        self.fail = False
+        self.pushed = threading.Condition()
+
+    def get_status(self) -> dict:
+        self.status_reads += 1
+        return dict(self.status)
+
+    def get_log_since(self, seq: int) -> list[dict]:
+        return [e for e in self.entries if e["seq"] >= seq]
+
+    def log(self, msg: str) -> None:
+        self.entries.append({"seq": len(self.entries), "msg": msg})
+
+    def evaluate_js(self, js: str) -> None:
+        if self.fail:
+            raise RuntimeError("window gone")
+        handler, args = re.match(r"window\.(\w+) && window\.\w+\((.*)\)$", js).groups()
+        changes, entries = json.loads(f"[{args}]")
+        with self.pushed:
+            self.calls.append((handler, changes, entries))
+            self.pushed.notify_all()
+
+    def wait_for_calls(self, count: int) -> None:
+        with self.pushed:
+            assert self.pushed.wait_for(lambda: len(self.calls) >= count, timeout=2.0)
+
+
+def _pusher(frontend: FakeFrontend, **kwargs) -> StatusPusher:
+    return StatusPusher(
+        get_status=frontend.get_status,
+        get_log_since=frontend.get_log_since,
+        evaluate_js=frontend.evaluate_js,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def running():
+    started: list[StatusPusher] = []
+
+    def start(pusher: StatusPusher) -> StatusPusher:
+        threading.Thread(target=pusher.run, daemon=True).start()
+        started.append(pusher)
+        return pusher
+
+    yield start
+    for pusher in started:
+        pusher.stop()
+
+
+class TestPush:
+    def test_full_then_only_changed_fields(self):
+        frontend = FakeFrontend()
+        pusher = _pusher(frontend)
+        assert pusher.push(full=True)
+        frontend.status["iracing_running"] = True
+        frontend.log("iRacing detected")
+        assert pusher.push()
+
+        (h1, full, _), (h2, delta, entries) = frontend.calls
+        assert (h1, h2) == ("__ignitionStatusUpdate", "__ignitionStatusPatch")
+        assert set(full) == {"iracing_running", "running_app_ids", "paused"}
+        assert delta == {"iracing_running": True}
+        assert [e["msg"] for e in entries] == ["iRacing detected"]
+
+    def test_nothing_sent_when_nothing_changed(self):
+        frontend = FakeFrontend()
+        pusher = _pusher(frontend)
+        pusher.push(full=True)
+        assert pusher.push() is False
+        assert len(frontend.calls) == 1
+
+    def test_failed_push_folded_into_the_next(self):
+        frontend = FakeFrontend()
+        pusher = _pusher(frontend)
+        pusher.push(full=True)
+        frontend.status["paused"] = True
+        frontend.log("Monitoring paused")
+        frontend.fail = True
+        with pytest.raises(RuntimeError):
+            pusher.push()
+        frontend.fail = False
+        assert pusher.push()
+        _, delta, entries = frontend.calls[-1]
+        assert delta == {"paused": True}
+        assert [e["msg"] for e in entries] == ["Monitoring paused"]
+
+
+class TestPushThread:
+    def test_burst_coalesced_into_one_update(self, running):
+        frontend = FakeFrontend()
+        pusher = running(_pusher(frontend, frame_seconds=0.2))
+        frontend.wait_for_calls(1)  # initial snapshot
+
+        for i in range(50):
+            frontend.log(f"event {i}")
+            pusher.mark_changed()
+        frontend.wait_for_calls(2)
+        time.sleep(0.3)
+        assert len(frontend.calls) == 2
+        assert len(frontend.calls[1][2]) == 50
+
+    def test_hidden_window_does_no_work_until_shown(self, running):
+        frontend = FakeFrontend()
+        pusher = running(_pusher(frontend, visible=False, frame_seconds=0.0))
+        for _ in range(10):
+            frontend.log("event")
+            pusher.mark_changed()
+        time.sleep(0.2)
+        assert frontend.status_reads == 0 and frontend.calls == []
+
+        pusher.set_visible(True)
+        frontend.wait_for_calls(1)
+        handler, _, entries = frontend.calls[0]
+        assert handler == "__ignitionStatusUpdate"
+        assert len(entries) == 10
+
+    def test_idle_does_nothing(self, running):
+        frontend = FakeFrontend()
+        running(_pusher(frontend, frame_seconds=0.0))
+        frontend.wait_for_calls(1)
+        time.sleep(0.3)
+        assert frontend.status_reads == 1
+
+    def test_reshown_window_resynced_with_full_snapshot(self, running):
+        frontend = FakeFrontend()
+        pusher = running(_pusher(frontend, frame_seconds=0.0))
+        frontend.wait_for_calls(1)
+        pusher.set_visible(False)
+        frontend.status["paused"] = True
+        pusher.mark_changed()
+        pusher.set_visible(True)
+        frontend.wait_for_calls(2)
+        assert frontend.calls[1][0] == "__ignitionStatusUpdate"
+        assert frontend.calls[1][1]["paused"] is True